@@ -15,16 +15,46 @@
 from collections import namedtuple
 from pathlib import Path
 
+import importlib
 import importlib_metadata
 import os
 import errno
 import inspect
+from typing import TYPE_CHECKING
 
 # NOTE - Only utility functions that are user visible should be added here to avoid circular imports
-from chipscopy.api import CoreType
-from chipscopy.api.session import create_session, delete_session
-from chipscopy.dm.request import null_callback
-from chipscopy.api.report import report_versions, report_devices, report_hierarchy
+#
+# They are imported on first access (PEP 562), so "import chipscopy" and
+# "import chipscopy.<submodule>" do not load the session, device and debug core stack.
+_LAZY_ATTRIBUTES = {
+    "CoreType": "chipscopy.api",
+    "create_session": "chipscopy.api.session",
+    "delete_session": "chipscopy.api.session",
+    "null_callback": "chipscopy.dm.request",
+    "report_versions": "chipscopy.api.report",
+    "report_devices": "chipscopy.api.report",
+    "report_hierarchy": "chipscopy.api.report",
+}
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api import CoreType
+    from chipscopy.api.session import create_session, delete_session
+    from chipscopy.dm.request import null_callback
+    from chipscopy.api.report import report_versions, report_devices, report_hierarchy
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __author__ = "Advanced Micro Devices, Inc."
 __copyright__ = "Copyright (C) 2022-2024, Advanced Micro Devices, Inc."
@@ -14,21 +14,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from __future__ import annotations
+
 import re
 from collections import deque
 import argparse
 import sys
 import os
 from pathlib import Path
-from typing import Tuple, Dict, Union
+from typing import Tuple, Dict, Union, TYPE_CHECKING
 
 from more_itertools import one
 
+# The session stack is imported on first use - keeps "csutil --help" and "--version" fast
 import chipscopy
-from chipscopy import create_session, report_versions, report_devices
-from chipscopy.api.session import Session
-from chipscopy.client.view_info import ViewInfo
-from chipscopy.dm import Node
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.session import Session
+    from chipscopy.client.view_info import ViewInfo
+    from chipscopy.dm import Node
 
 
 class NodeVisitorBase:
@@ -106,9 +110,9 @@ def display_banner():
 
 def report(session: Session, *, devices: bool = True, servers: bool = True):
     if servers:
-        report_versions(session)
+        chipscopy.report_versions(session)
     if devices:
-        report_devices(session)
+        chipscopy.report_devices(session)
 
 
 def _get_node_path(host: str, view: ViewInfo, view_name: str, node: Node) -> str:
@@ -534,13 +538,13 @@ def parse_args(cmdline_args):
         _cs_url = args.cs_url
 
     if args.subcommand == "report":
-        with create_session(
+        with chipscopy.create_session(
             hw_server_url=_hw_url, cs_server_url=_cs_url, bypass_version_check=_bypass_version_check
         ) as session:
             report(session=session, devices=args.devices, servers=args.servers)
 
     elif args.subcommand == "info":
-        with create_session(
+        with chipscopy.create_session(
             hw_server_url=_hw_url,
             cs_server_url=_cs_url,
             initial_device_scan=False,
@@ -549,7 +553,7 @@ def parse_args(cmdline_args):
             info(session=session, match_string=args.context)
 
     elif args.subcommand == "ls":
-        with create_session(
+        with chipscopy.create_session(
             hw_server_url=_hw_url,
             cs_server_url=_cs_url,
             initial_device_scan=False,
@@ -558,7 +562,7 @@ def parse_args(cmdline_args):
             ls(session=session, is_long=args.long, show_context=args.show_context)
 
     elif args.subcommand == "program":
-        with create_session(
+        with chipscopy.create_session(
             hw_server_url=_hw_url, cs_server_url=_cs_url, bypass_version_check=_bypass_version_check
         ) as session:
             program(
@@ -578,7 +582,7 @@ def parse_args(cmdline_args):
             )
 
     elif args.subcommand == "tree":
-        with create_session(
+        with chipscopy.create_session(
             hw_server_url=_hw_url,
             cs_server_url=_cs_url,
             initial_device_scan=False,
@@ -0,0 +1,165 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""channel_pool.py -
+
+Per-process pool of hw_server and cs_server channels, keyed by server url.
+
+Sessions acquire their server channels from the pool and release them on
+disconnect. Shared channels are reference counted. Released channels can be
+kept open (warm) for the next session to the same server, which skips the
+tcp connect and service handshake.
+
+Each server url has its own lock, so sessions to different servers connect
+concurrently.
+"""
+import socket
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Tuple
+
+from chipscopy.client import disconnect as client_disconnect
+from chipscopy.client.server_info import ServerInfo
+from chipscopy.client.util import process_param_str, parse_params
+from chipscopy.tcf import channel
+from chipscopy.utils.logger import log
+
+# Format: (server_name, ip, port)
+ChannelKey = Tuple[str, str, int]
+
+
+@dataclass
+class _PoolEntry:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Shared channel and the number of sessions using it
+    shared_server: ServerInfo = None
+    ref_count: int = 0
+    # Released channels kept open for reuse
+    idle_servers: List[ServerInfo] = field(default_factory=list)
+    # Serializes remote connect/disconnect commands on the channels to this url
+    remote_lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+def _is_open(server: ServerInfo) -> bool:
+    return server.channel.getState() == channel.STATE_OPEN
+
+
+class ChannelPool:
+    """Reference counted, per-url pool of server channels.
+
+    Args:
+        max_idle_channels: Number of released channels kept open per server url.
+            Default 0 closes a channel when the last session releases it.
+    """
+
+    def __init__(self, max_idle_channels: int = 0):
+        self.max_idle_channels = max_idle_channels
+        self._lock = threading.Lock()  # Only protects the dicts below, never held while connecting
+        self._entries: Dict[ChannelKey, _PoolEntry] = {}
+        self._keys_by_url: Dict[Tuple[str, str], ChannelKey] = {}
+
+    def get_key(self, server_name: str, url: str) -> ChannelKey:
+        """Pool key of a server url. The host name is resolved once per url."""
+        with self._lock:
+            key = self._keys_by_url.get((server_name, url))
+        if key is None:
+            host_port_dict = parse_params(process_param_str(url))
+            ip = socket.gethostbyname(host_port_dict.get("Host"))
+            key = (server_name, ip, int(host_port_dict.get("Port")))
+            with self._lock:
+                self._keys_by_url[(server_name, url)] = key
+        return key
+
+    def _get_entry(self, key: ChannelKey) -> _PoolEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _PoolEntry()
+            return entry
+
+    def get_remote_lock(self, server_name: str, url: str) -> threading.RLock:
+        """Lock for commands that change the remote connections of a server, e.g. connect_remote.
+        Sessions to the same server url take turns, sessions to other servers are not blocked.
+        """
+        return self._get_entry(self.get_key(server_name, url)).remote_lock
+
+    def _pop_idle(self, entry: _PoolEntry) -> ServerInfo:
+        while entry.idle_servers:
+            server = entry.idle_servers.pop()
+            if _is_open(server):
+                return server
+        return None
+
+    def acquire(
+        self, server_name: str, url: str, connect_func: Callable[[str], ServerInfo], share: bool
+    ) -> ServerInfo:
+        """Get a channel to the server at url.
+
+        Args:
+            server_name: "hw_server" or "cs_server"
+            url: Server url
+            connect_func: Called with url to open a new channel
+            share: True=Share one channel between all sessions to this url.
+                False=Each session gets its own channel.
+
+        Returns:
+            ServerInfo of the channel
+        """
+        key = self.get_key(server_name, url)
+        entry = self._get_entry(key)
+        with entry.lock:
+            if share and entry.shared_server:
+                if _is_open(entry.shared_server):
+                    entry.ref_count += 1
+                    return entry.shared_server
+                # Closed by the server - drop it and connect again
+                entry.shared_server = None
+                entry.ref_count = 0
+            server = self._pop_idle(entry)
+            if server:
+                log.client.debug(f"channel_pool: reusing open {server_name} channel to {url}")
+            else:
+                server = connect_func(url)
+            if share:
+                entry.shared_server = server
+                entry.ref_count = 1
+            return server
+
+    def release(self, server_name: str, url: str, server: ServerInfo):
+        """Return a channel from acquire(). The channel is closed, or kept open for reuse."""
+        key = self.get_key(server_name, url)
+        entry = self._get_entry(key)
+        with entry.lock:
+            if server is entry.shared_server:
+                entry.ref_count -= 1
+                if entry.ref_count > 0:
+                    return
+                entry.shared_server = None
+                entry.ref_count = 0
+            if _is_open(server) and len(entry.idle_servers) < self.max_idle_channels:
+                entry.idle_servers.append(server)
+                return
+        client_disconnect(server)
+
+    def clear(self):
+        """Close the idle channels and forget all shared channels."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries = {}
+        for entry in entries:
+            with entry.lock:
+                idle_servers, entry.idle_servers = entry.idle_servers, []
+            for server in idle_servers:
+                if _is_open(server):
+                    client_disconnect(server)
@@ -13,15 +13,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import re
 from inspect import getattr_static
-from typing import TypeVar, Sequence, Any, Callable
+from typing import TypeVar, Sequence, Any, Callable, Dict, List, Optional
 from collections import UserDict, UserList
 
 # This along with the Generic[T] base class for QueryList is needed to allow type hints such as
 # QueryList[VIO] - Implies the QueryList contains only VIO cores
 T = TypeVar("T")
 
+# Filter values without any of these characters are matched as plain strings, without regex.
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def _is_literal_pattern(pattern: str) -> bool:
+    return _REGEX_SPECIAL_CHARS.isdisjoint(pattern)
+
+
+def _compile_filter_value(match_value) -> Callable[[str], bool]:
+    # Returns a function testing if a string fully matches the filter value
+    pattern = str(match_value)
+    if _is_literal_pattern(pattern):
+        return pattern.__eq__
+    compiled = re.compile(pattern)
+    return lambda string_to_match: compiled.fullmatch(string_to_match) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _has_own_filter_match(item_type: type) -> bool:
+    try:
+        _ = getattr_static(item_type, "check_for_filter_match")
+        return True
+    except AttributeError:
+        return False
+
 
 # The Generic[T] adds the ability to subscript i.e. use the [], for QueryList in type hints
 class QueryList(UserList, Sequence[T]):
@@ -33,11 +59,19 @@ class QueryList(UserList, Sequence[T]):
 
     A custom matching function can be specified in this querylist using set_custom_match_function. Any
     custom match function takes priority when matching over the optional filter_by attribute.
+
+    For large lists that are filtered many times by the same keys, hash indexes can be enabled
+    with ``index_keys`` or :meth:`add_index`. An index is built on the first filter by that key with
+    a plain (non-regex) value, and dropped when the list changes.
     """
 
-    def __init__(self, initlist=None, *, custom_match_function: Callable = None):
+    def __init__(
+        self, initlist=None, *, custom_match_function: Callable = None, index_keys: List[str] = None
+    ):
         self.custom_match_function = custom_match_function
         self.iter_index = 0
+        self.index_keys = set(index_keys) if index_keys else set()
+        self._indexes: Dict[str, Optional[Dict[str, List[T]]]] = {}
         super().__init__(initlist=initlist)
 
     def __str__(self):
@@ -46,8 +80,7 @@ class QueryList(UserList, Sequence[T]):
 
     def __iter__(self):
         # Returns a generator now - fixes one() in new more-itertools 1.7.0
-        for i in range(len(self)):
-            yield self.at(i)
+        yield from self.data
 
     def set_custom_match_function(self, match_function):
         """Sets an optional custom match function for the QueryList. If a custom match function is set,
@@ -59,6 +92,85 @@ class QueryList(UserList, Sequence[T]):
         """
         self.custom_match_function = match_function
 
+    def add_index(self, *keys: str):
+        """Enable hash indexes for filter_by keys. Filtering by an indexed key with a plain value
+        only checks the items with that value, instead of every item in the list.
+
+        Indexes are built on first use, and dropped when the list is changed. Call
+        :meth:`drop_indexes` if the filter_by values of items in the list change.
+
+        Args:
+            *keys: filter_by keys to index, e.g. "name"
+        """
+        self.index_keys.update(keys)
+
+    def drop_indexes(self):
+        """Drop all built indexes. They are rebuilt on the next filter_by."""
+        self._indexes.clear()
+
+    # Changes to the list drop the filter_by indexes
+    def __setitem__(self, i, item):
+        self._indexes.clear()
+        super().__setitem__(i, item)
+
+    def __delitem__(self, i):
+        self._indexes.clear()
+        super().__delitem__(i)
+
+    def __iadd__(self, other):
+        self._indexes.clear()
+        return super().__iadd__(other)
+
+    def __imul__(self, n):
+        self._indexes.clear()
+        return super().__imul__(n)
+
+    def append(self, item):
+        self._indexes.clear()
+        super().append(item)
+
+    def insert(self, i, item):
+        self._indexes.clear()
+        super().insert(i, item)
+
+    def pop(self, i=-1):
+        self._indexes.clear()
+        return super().pop(i)
+
+    def remove(self, item):
+        self._indexes.clear()
+        super().remove(item)
+
+    def clear(self):
+        self._indexes.clear()
+        super().clear()
+
+    def reverse(self):
+        self._indexes.clear()
+        super().reverse()
+
+    def sort(self, /, *args, **kwds):
+        self._indexes.clear()
+        super().sort(*args, **kwds)
+
+    def extend(self, other):
+        self._indexes.clear()
+        super().extend(other)
+
+    def _get_index(self, key: str) -> Optional[Dict[str, List[T]]]:
+        if key not in self._indexes:
+            index = {}
+            for list_item in self.data:
+                if _has_own_filter_match(type(list_item)):
+                    # Items with their own match function can not be indexed
+                    index = None
+                    break
+                filter_by = getattr(list_item, "filter_by", None)
+                if filter_by and key in filter_by:
+                    index.setdefault(str(filter_by[key]), []).append(list_item)
+            self._indexes[key] = index
+        return self._indexes[key]
+
     def all(self) -> "QueryList[T]":
         """
         Returns: every element in list
@@ -117,37 +229,48 @@ class QueryList(UserList, Sequence[T]):
         retval = QueryList()
         retval.set_custom_match_function(self.custom_match_function)
 
-        for list_item in self:
-            # First priority is a custom match function set on this QueryList.
-            # Custom match function works across all list elements without regard to filter_by property.
-            if self.custom_match_function:
-                # Non-default match function - this is the first priority to check for a match
-                matched = True
-                for key, value in filters.items():
-                    if not self.custom_match_function(list_item, key, value):
-                        matched = False
-                if matched:
+        # First priority is a custom match function set on this QueryList.
+        # Custom match function works across all list elements without regard to filter_by property.
+        if self.custom_match_function:
+            for list_item in self.data:
+                if all(
+                    self.custom_match_function(list_item, key, value)
+                    for key, value in filters.items()
+                ):
                     retval.append(list_item)
+            return retval
+
+        # Patterns are compiled once per call. Plain values are compared without regex.
+        matchers = {key: _compile_filter_value(value) for key, value in filters.items()}
+
+        candidates = self.data
+        for key, value in filters.items():
+            if key in self.index_keys and _is_literal_pattern(str(value)):
+                index = self._get_index(key)
+                if index is not None:
+                    candidates = index.get(str(value), [])
+                    break
+
+        for list_item in candidates:
+            # To support filtering the object must have 'filter_by' attribute as a second priority to
+            # the custom match function.
+            # filter_by is a dict where the key is a property name, and value is a property value.
+            if not hasattr(list_item, "filter_by"):
+                continue
+            filter_by = list_item.filter_by
+            if _has_own_filter_match(type(list_item)):
+                # The object has it's own staticmethod 'check_for_filter_match()'
+                matched = all(
+                    list_item.check_for_filter_match(filter_by, key, value)
+                    for key, value in filters.items()
+                )
             else:
-                # To support filtering the object must have 'filter_by' attribute as a second priority to
-                # the custom match function.
-                # filter_by is a dict where the key is a property name, and value is a property value.
-                if not hasattr(list_item, "filter_by"):
-                    continue
-                matched = True
-                for key, value in filters.items():
-                    # If the object has it's own staticmethod 'check_for_filter_match()', call it
-                    # else use the static 'check_for_filter_match' in this class
-                    match_function = QueryList.check_for_filter_match
-                    try:
-                        _ = getattr_static(list_item, "check_for_filter_match")
-                        match_function = list_item.check_for_filter_match
-                    except AttributeError:
-                        pass
-                    if not match_function(list_item.filter_by, key, value):
-                        matched = False
-                if matched:
-                    retval.append(list_item)
+                matched = all(
+                    key in filter_by and matcher(str(filter_by[key]))
+                    for key, matcher in matchers.items()
+                )
+            if matched:
+                retval.append(list_item)
 
         return retval
 
@@ -156,10 +279,7 @@ class QueryList(UserList, Sequence[T]):
         if filter_name not in filters_dict:
             return False
 
-        pattern = str(match_value)
-        string_to_match = str(filters_dict[filter_name])
-        match_result = re.fullmatch(pattern, string_to_match)
-        return match_result is not None
+        return _compile_filter_value(match_value)(str(filters_dict[filter_name]))
 
 
 class QueryDict(UserDict):
@@ -16,29 +16,15 @@
 import os
 import sys
 import csv
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, List, TYPE_CHECKING
 from dataclasses import dataclass
 from collections import OrderedDict
 
-try:
-    import pandas as pd
-    import plotly.graph_objects as go
-
-    _plotting_pkgs_available = True
-except ImportError:
-    _plotting_pkgs_available = False
-
-try:
-    from IPython import get_ipython
-    from IPython.display import Image, display
-
-    _jupyter_available = True
-except ImportError:
-    get_ipython = None
-    Image = None
-    display = None
-    _jupyter_available = False
+# pandas, plotly and IPython are slow to import - they are imported on first use
+_plotting_pkgs_available = find_spec("pandas") is not None and find_spec("plotly") is not None
+_jupyter_available = find_spec("IPython") is not None
 
 from chipscopy.dm import request
 from chipscopy.tcf.services import DoneHWCommand
@@ -1794,6 +1780,9 @@ class DDR(DebugCore["DDRMCClient"]):
             "Right_PS": right_ps,
         }
 
+        import pandas as pd
+        import plotly.graph_objects as go
+
         df = pd.DataFrame(data_defs)
         fig = go.Figure()
 
@@ -2293,6 +2282,8 @@ class DDR(DebugCore["DDRMCClient"]):
                         raise ImportError(
                             f"Jupyter packages not installed! Please run 'pip install chipscopy[jupyter]'"
                         )
+                    from IPython.display import Image, display
+
                     image_bytes = fig.to_image(format="png")
                     ipython_image = Image(image_bytes)
                     display(ipython_image)
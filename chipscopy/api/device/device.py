@@ -18,9 +18,10 @@ import re
 import sys
 import time
 from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Union, Dict, List, Set, Any, NewType, Literal
+from typing import Optional, Union, Dict, List, Set, Any, NewType, Literal, Iterable
 from struct import pack, unpack
 
 from chipscopy.api import DMNodeListener
@@ -37,7 +38,7 @@ from chipscopy.api.memory import Memory
 from chipscopy.api.noc.noc import NocPerfmon
 from chipscopy.api.pcie import PCIe
 from chipscopy.api.sysmon import Sysmon
-from chipscopy.api.vio import VIO
+from chipscopy.api.vio import VIO, clear_port_info_cache
 from chipscopy.client import ServerInfo
 from chipscopy.client.axis_ila_core_client import AxisIlaCoreClient
 from chipscopy.client.axis_pcie_core_client import AxisPCIeCoreClient
@@ -55,8 +56,10 @@ from chipscopy.dm import chipscope, request, Node
 from chipscopy.utils.printer import printer, PercentProgressBar
 from chipscopy.api.device.device_scanner import (
     scan_all_views,
+    ViewRecordType,
 )
 from chipscopy.api.device.device_util import copy_node_props
+from chipscopy.api.device.topology_cache import TopologyCache
 from chipscopy.utils.logger import log
 
 
@@ -69,6 +72,10 @@ class DeviceException(Exception):
     pass
 
 
+# Number of threads used when creating and initializing debug core wrappers concurrently.
+DEFAULT_CORE_SETUP_WORKERS = 8
+
+
 class DeviceState(Enum):
     VALID = 0
     NEEDS_REFRESH = 1
@@ -115,6 +122,9 @@ class Device:
         "hbm": HBMClient,
     }
 
+    # Core types whose wrappers do not access hardware until first use.
+    _DEFERRED_INIT_CORE_TYPES = {"ila", "vio"}
+
     def __init__(
         self,
         *,
@@ -458,7 +468,7 @@ class Device:
         elif node.type == "npi_nir":
             debug_core_wrapper = NocPerfmon(node)
         elif node.type == "ibert":
-            debug_core_wrapper = IBERT(node)
+            debug_core_wrapper = IBERT(node, self)
         elif node.type == "sysmon":
             debug_core_wrapper = Sysmon(node)
         elif node.type == "ddrmc_main":
@@ -528,6 +538,24 @@ class Device:
                 found_cores.append(Device._get_client_wrapper(node))
         return found_cores
 
+    def setup_core_wrappers(
+        self, *, initialize: bool = True, max_workers: int = DEFAULT_CORE_SETUP_WORKERS
+    ) -> int:
+        """Create the debug core wrappers (ILA, VIO, IBERT, DDR, ...) of this device concurrently,
+        instead of one at a time on first access of ``ila_cores``, ``vio_cores``, etc.
+        The initialize and property round trips of the cores overlap on the server channel.
+
+        Args:
+            initialize: Also run the deferred initialization of cores which support it (like ILA)
+            max_workers: Max number of cores set up at the same time
+
+        Returns:
+            Number of debug core wrappers created
+        """
+        self._raise_if_family_not(DeviceFamily.VERSAL, DeviceFamily.UPLUS)
+        self._raise_if_state_invalid()
+        return setup_core_wrappers([self], initialize=initialize, max_workers=max_workers)
+
     def discover_and_setup_cores(
         self,
         *,
@@ -551,6 +579,8 @@ class Device:
             ddr_scan: True=Scan Device for DDRs
             hbm_scan: True=Scan Device for HBMs
             sysmon_scan: True=Scan Device for System Monitor
+            parallel_setup: True=Create and initialize the found debug cores concurrently.
+                Default is False, where cores are set up one at a time on first access.
         """
         # Selectively disable scanning of cores depending on what comes in
         # This is second priority to the disable_core_scan in __init__.
@@ -607,6 +637,9 @@ class Device:
                 # print(self._device_spec.to_json())
                 raise RuntimeError("chipscope_node not available")
 
+        if kwargs.get("parallel_setup", False):
+            self.setup_core_wrappers()
+
     # MEMORY
 
     @property
@@ -945,6 +978,8 @@ class Device:
 
         jtag_programming_node = self.jtag_node
         assert jtag_programming_node is not None
+        # The new design may have other VIO cores
+        clear_port_info_cache()
         if not skip_reset:
             jtag_programming_node.future().reset()
 
@@ -970,6 +1005,65 @@ UltrascaleDevice = NewType("UltrascaleDevice", Device)
 GenericDevice = NewType("GenericDevice", Device)
 
 
+def setup_core_wrappers(
+    devices: Iterable[Device],
+    *,
+    initialize: bool = True,
+    max_workers: int = DEFAULT_CORE_SETUP_WORKERS,
+) -> int:
+    # Creates the missing debug core wrappers for all devices with one thread pool.
+    # Each node is its own request queue group, so the blocking TCF requests issued by the
+    # wrapper constructors on different worker threads are in flight at the same time.
+    #
+    # Wrappers of core types with deferred initialization are cheap to construct. They are
+    # constructed in node order on the calling thread (keeps default names like hw_ila_0 stable)
+    # and only their _initialize() runs in the pool.
+    pending_nodes = []
+    for device in devices:
+        for nodes in device._find_all_debugcore_nodes().values():
+            for node in nodes:
+                if Device._get_client_wrapper(node) is None:
+                    pending_nodes.append((device, node))
+
+    first_error = None
+    created_count = 0
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="core_setup") as executor:
+        futures = []
+        for device, node in pending_nodes:
+            if node.type in Device._DEFERRED_INIT_CORE_TYPES:
+                futures.append((node, None, device._create_debugcore_wrapper(node)))
+            else:
+                futures.append(
+                    (node, executor.submit(device._create_debugcore_wrapper, node), None)
+                )
+
+        to_initialize = []
+        for node, future, debug_core_wrapper in futures:
+            try:
+                if future:
+                    debug_core_wrapper = future.result()
+            except Exception as ex:
+                log.client.error(f"setup_core_wrappers: {node.ctx} setup failed: {ex}")
+                first_error = first_error or ex
+                continue
+            Device._set_client_wrapper(node, debug_core_wrapper)
+            if debug_core_wrapper is not None:
+                created_count += 1
+                if initialize and hasattr(debug_core_wrapper, "_initialize"):
+                    to_initialize.append(executor.submit(debug_core_wrapper._initialize))
+
+        for future in to_initialize:
+            try:
+                future.result()
+            except Exception as ex:
+                log.client.error(f"setup_core_wrappers: core initialization failed: {ex}")
+                first_error = first_error or ex
+
+    if first_error:
+        raise first_error
+    return created_count
+
+
 def discover_devices(
     hw_server: ServerInfo,
     cs_server: ServerInfo = None,
@@ -977,6 +1071,8 @@ def discover_devices(
     cable_ctx: Optional[str] = None,
     disable_cache: bool = False,
     enable_experimental_protocol_decode: bool = False,
+    device_records: Optional[Dict[str, List[ViewRecordType]]] = None,
+    topology_cache: Optional[TopologyCache] = None,
 ) -> QueryList[Device]:
     log.client.debug(
         f"discover_devices: hw_server={hw_server}, cs_server={cs_server}, disable_core_scan={disable_core_scan}, cable_ctx={cable_ctx}",
@@ -985,7 +1081,12 @@ def discover_devices(
     include_dna = True
     devices: QueryList[Device] = QueryList()
     idx = 0
-    for key, device_record_list in scan_all_views(hw_server, cs_server, include_dna).items():
+    if device_records is None:
+        # No (valid) cached records - scan the views
+        device_records = scan_all_views(hw_server, cs_server, include_dna)
+        if topology_cache:
+            topology_cache.save(hw_server.url, cs_server.url if cs_server else None, device_records)
+    for key, device_record_list in device_records.items():
         device_spec = DeviceSpec.create_from_device_records(
             hw_server, cs_server, device_record_list
         )
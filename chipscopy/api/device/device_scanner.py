@@ -89,9 +89,9 @@ for any given device.
 """
 import dataclasses
 from collections import defaultdict
-from typing import Optional, List, Iterator, Dict, TypeVar
+from typing import Optional, List, Iterator, Dict, TypeVar, Tuple, Set
 
-from chipscopy.api.device.device_util import get_node_dna
+from chipscopy.api.device.device_util import get_node_dna, get_nodes_dna
 from chipscopy.client import ServerInfo
 from chipscopy.utils.logger import log
 
@@ -173,12 +173,17 @@ def scan_jtag_view(
 
     """
     log.client.debug(
-        f"scan_jtag_view: hw_server={hw_server}, include_dna={include_dna}, include_arm_dap={include_arm_dap}"
+        "scan_jtag_view: hw_server={}, include_dna={}, include_arm_dap={}",
+        hw_server,
+        include_dna,
+        include_arm_dap,
     )
     previous_jtag_device_record: Optional[JtagRecord] = None
     view = hw_server.get_view("jtag")
+    jtag_records: List[JtagRecord] = []
+    dna_nodes = {}  # jtag_record.ctx -> node, for devices which need dna
     for jtag_cable in view.get_children():
-        log.client.debug(f"jtag_scan: scanning cable {jtag_cable.ctx}")
+        log.client.debug("jtag_scan: scanning cable {}", jtag_cable.ctx)
         jtag_index = 0
         error_msg = ""
         if not jtag_cable.props.get("isActive"):
@@ -217,29 +222,34 @@ def scan_jtag_view(
                     # Versal and Zynq
                     jtag_record.dap_ctx = previous_jtag_device_record.ctx
                     if include_dna:
-                        jtag_record.dna = get_node_dna(jtag_device)
+                        dna_nodes[jtag_record.ctx] = jtag_device
                 elif jtag_record.arch_name in ["kintexuplus", "kintexu", "virtexuplus", "virtexu"]:
                     # Virtex, Kintex US+, no arm-dap
                     jtag_record.dap_ctx = ""
                     if include_dna:
-                        jtag_record.dna = get_node_dna(jtag_device)
-                log.client.debug(f"jtag_record: idx={jtag_index}, device={jtag_record.ctx}")
-                log.client.trace(repr(jtag_record))
-                yield jtag_record
+                        dna_nodes[jtag_record.ctx] = jtag_device
+                log.client.debug("jtag_record: idx={}, device={}", jtag_index, jtag_record.ctx)
+                jtag_records.append(jtag_record)
             else:
                 if include_arm_dap:
-                    log.client.debug(f"jtag_record: idx={jtag_index}, ctx={jtag_record.ctx}")
-                    log.client.trace(repr(jtag_record))
-                    yield jtag_record
+                    log.client.debug("jtag_record: idx={}, ctx={}", jtag_index, jtag_record.ctx)
+                    jtag_records.append(jtag_record)
                 else:
                     log.client.debug(
-                        f"jtag_record: idx={jtag_index}, ctx={jtag_record.ctx} (EXCLUDED)"
+                        "jtag_record: idx={}, ctx={} (EXCLUDED)", jtag_index, jtag_record.ctx
                     )
-                    log.client.trace(repr(jtag_record))
+                    log.client.trace("{!r}", jtag_record)
 
             jtag_index += 1
             previous_jtag_device_record = jtag_record
 
+    # Read dna of all devices on all cables together, rather than one device at a time.
+    dna_by_ctx = get_nodes_dna(dna_nodes.values()) if dna_nodes else {}
+    for jtag_record in jtag_records:
+        jtag_record.dna = dna_by_ctx.get(jtag_record.ctx)
+        log.client.trace("{!r}", jtag_record)
+        yield jtag_record
+
 
 def scan_memory_view(hw_server: ServerInfo, include_dna=True) -> Iterator[MemoryRecord]:
     """
@@ -252,7 +262,7 @@ def scan_memory_view(hw_server: ServerInfo, include_dna=True) -> Iterator[Memory
     Returns:
 
     """
-    log.client.debug(f"scan_memory_view: hw_server={hw_server}, include_dna={include_dna}")
+    log.client.debug("scan_memory_view: hw_server={}, include_dna={}", hw_server, include_dna)
     view = hw_server.get_view("memory")
     for memory_node in view.get_children():
         name = memory_node.props.get("Name", "")
@@ -270,8 +280,8 @@ def scan_memory_view(hw_server: ServerInfo, include_dna=True) -> Iterator[Memory
         )
         if include_dna:
             memory_record.dna = get_node_dna(memory_node)
-        log.client.debug(f"memory_record: name={memory_record.name}, ctx={memory_record.ctx}")
-        log.client.trace(repr(memory_record))
+        log.client.debug("memory_record: name={}, ctx={}", memory_record.name, memory_record.ctx)
+        log.client.trace("{!r}", memory_record)
         yield memory_record
 
 
@@ -283,7 +293,7 @@ def scan_debugcore_view(hw_server: ServerInfo, include_dna=True) -> Iterator[Deb
 
     Returns:
     """
-    log.client.debug(f"scan_debugcore_view: hw_server={hw_server}, include_dna={include_dna}")
+    log.client.debug("scan_debugcore_view: hw_server={}, include_dna={}", hw_server, include_dna)
     view = hw_server.get_view("debugcore")
     for debugcore_node in view.get_children():
         name = debugcore_node.props.get("Name", "")
@@ -300,9 +310,9 @@ def scan_debugcore_view(hw_server: ServerInfo, include_dna=True) -> Iterator[Deb
         if include_dna:
             debugcore_record.dna = get_node_dna(debugcore_node)
         log.client.debug(
-            f"debugcore_record: name={debugcore_record.name}, ctx={debugcore_record.ctx}"
+            "debugcore_record: name={}, ctx={}", debugcore_record.name, debugcore_record.ctx
         )
-        log.client.trace(repr(debugcore_record))
+        log.client.trace("{!r}", debugcore_record)
         yield debugcore_record
 
 
@@ -314,7 +324,7 @@ def scan_chipscope_view(cs_server: ServerInfo, include_dna=True) -> Iterator[Chi
 
     Returns:
     """
-    log.client.debug(f"scan_chipscope_view: cs_server={cs_server}, include_dna={include_dna}")
+    log.client.debug("scan_chipscope_view: cs_server={}, include_dna={}", cs_server, include_dna)
     view = cs_server.get_view("chipscope")
     for chipscope_node in view.get_children():
         name = chipscope_node.props.get("Name", "")
@@ -331,12 +341,39 @@ def scan_chipscope_view(cs_server: ServerInfo, include_dna=True) -> Iterator[Chi
         if include_dna:
             chipscope_record.dna = get_node_dna(chipscope_node)
         log.client.debug(
-            f"chipscope_record: name={chipscope_record.name}, ctx={chipscope_record.ctx}"
+            "chipscope_record: name={}, ctx={}", chipscope_record.name, chipscope_record.ctx
         )
-        log.client.trace(repr(chipscope_record))
+        log.client.trace("{!r}", chipscope_record)
         yield chipscope_record
 
 
+class _ContextMatcher:
+    """
+    Finds which known context handle is a substring of another context handle.
+    Substrings are looked up in a dict, once per distinct handle length, instead of
+    testing every known handle against every context.
+    """
+
+    def __init__(self):
+        self._owners: Dict[str, Tuple[int, str]] = {}
+        self._lengths: Set[int] = set()
+
+    def add(self, ctx: str, owner_ctx: str, order: int):
+        # When several handles match, the owner with the lowest order wins.
+        if ctx and ctx not in self._owners:
+            self._owners[ctx] = (order, owner_ctx)
+            self._lengths.add(len(ctx))
+
+    def find_owner(self, ctx: str) -> Optional[str]:
+        best = None
+        for length in self._lengths:
+            for start in range(len(ctx) - length + 1):
+                hit = self._owners.get(ctx[start : start + length])
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+        return best[1] if best else None
+
+
 def scan_all_views(
     hw_server: ServerInfo, cs_server: ServerInfo, include_dna=True
 ) -> Dict[str, List[ViewRecordType]]:
@@ -348,16 +385,12 @@ def scan_all_views(
             else:
                 view_dict_[rec.ctx] = rec
 
-    def populate_context_dicts(all_view_dict_, view_dict_, jtag_ctx_, dap_ctx_):
+    def populate_context_dicts(all_view_dict_, view_dict_, matcher: _ContextMatcher):
         # Helper to reduce duplication - add nodes to correct dict without help of dna
         for ctx in list(view_dict_.keys()):
-            rec = view_dict_[ctx]
-            if jtag_ctx_ in ctx:
-                all_view_dict_[jtag_ctx].append(rec)
-                del view_dict_[ctx]
-            elif dap_ctx_ and dap_ctx_ in ctx:
-                all_view_dict_[jtag_ctx_].append(rec)
-                del view_dict_[ctx]
+            owner_ctx = matcher.find_owner(ctx)
+            if owner_ctx is not None:
+                all_view_dict_[owner_ctx].append(view_dict_.pop(ctx))
 
     # Tracking dictionaries. As we detect nodes attached to specific devices,
     # they move from the <view>_view_ctx_dicts into the all_view_dict.
@@ -395,13 +428,15 @@ def scan_all_views(
     # Jtag nodes give us an easy context to match other nodes with and remove
     # some from the list.
 
-    for jtag_ctx in list(jtag_view_ctx_dict.keys()):
-        jtag_rec = jtag_view_ctx_dict[jtag_ctx]
+    jtag_matcher = _ContextMatcher()
+    for order, (jtag_ctx, jtag_rec) in enumerate(jtag_view_ctx_dict.items()):
         all_view_dict[jtag_ctx].append(jtag_rec)
-        del jtag_view_ctx_dict[jtag_ctx]
-        populate_context_dicts(all_view_dict, memory_view_ctx_dict, jtag_ctx, jtag_rec.dap_ctx)
-        populate_context_dicts(all_view_dict, debugcore_view_ctx_dict, jtag_ctx, jtag_rec.dap_ctx)
-        populate_context_dicts(all_view_dict, chipscope_view_ctx_dict, jtag_ctx, jtag_rec.dap_ctx)
+        jtag_matcher.add(jtag_ctx, jtag_ctx, order)
+        jtag_matcher.add(jtag_rec.dap_ctx, jtag_ctx, order)
+    jtag_view_ctx_dict.clear()
+    populate_context_dicts(all_view_dict, memory_view_ctx_dict, jtag_matcher)
+    populate_context_dicts(all_view_dict, debugcore_view_ctx_dict, jtag_matcher)
+    populate_context_dicts(all_view_dict, chipscope_view_ctx_dict, jtag_matcher)
 
     # What remains are nodes not attached to a jtag node and has no dna...
     # Here we glue the remaining nodes together based on debugcore contexts.
@@ -411,18 +446,11 @@ def scan_all_views(
     # This likely happens for XVC MM testing or emulation flows where the
     # device is not fully configured in hw_server like real hardware.
 
-    for dc_ctx in list(debugcore_view_ctx_dict.keys()):
-        dc_rec = debugcore_view_ctx_dict[dc_ctx]
+    dc_matcher = _ContextMatcher()
+    for order, (dc_ctx, dc_rec) in enumerate(debugcore_view_ctx_dict.items()):
         all_view_dict[dc_ctx].append(dc_rec)
-        del debugcore_view_ctx_dict[dc_ctx]
-        for mem_ctx in list(memory_view_ctx_dict.keys()):
-            if dc_ctx in mem_ctx:
-                mem_rec = memory_view_ctx_dict[mem_ctx]
-                all_view_dict[dc_ctx].append(mem_rec)
-                del memory_view_ctx_dict[mem_ctx]
-        for cs_ctx in list(chipscope_view_ctx_dict.keys()):
-            if dc_ctx in cs_ctx:
-                cs_rec = chipscope_view_ctx_dict[cs_ctx]
-                all_view_dict[dc_ctx].append(cs_rec)
-                del chipscope_view_ctx_dict[cs_ctx]
+        dc_matcher.add(dc_ctx, dc_ctx, order)
+    debugcore_view_ctx_dict.clear()
+    populate_context_dicts(all_view_dict, memory_view_ctx_dict, dc_matcher)
+    populate_context_dicts(all_view_dict, chipscope_view_ctx_dict, dc_matcher)
     return all_view_dict
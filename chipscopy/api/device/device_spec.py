@@ -251,33 +251,36 @@ class DeviceSpec:
     def search_memory_node_deep(
         self, any_target: str = None, default_target: TargetType = "DPC"
     ) -> Optional[Memory]:
-        # Go dumpster diving searching for the first match to the requested node
+        # Search for the first match to the requested node
         # Note: here the any_target is the node name (not just DPC or DAP)...
-        # This is an inefficient matching algorithm meant to maintain backward
-        # compatibility with the previous memory search algorithm
+        # Nodes with the name come from the Name index of the view. A match counts if it is
+        # reached from the DAP node through memory nodes, like the previous tree walk.
         memory_view = self.hw_server.get_view("memory")
         if any_target == "DPC" or any_target == "DAP" or any_target is None:
             return self.get_memory_node(target=any_target, default_target=default_target)
         else:
-            # TODO: Make a more efficient way to do this
             found_node = None
             top = self.get_memory_node(target="DAP", default_target=default_target)
             if top:
-                nodes_to_travel = deque([top])
-                memory_node_list = []
-                while nodes_to_travel:
-                    node = nodes_to_travel.popleft()
-                    if node.props.get("Name") == any_target:
+                for node in memory_view.get_nodes_by_prop("Name", any_target):
+                    if DeviceSpec._is_memory_descendant(memory_view, node, top):
                         found_node = self.get_node("memory", node.ctx, MemoryNode)  # upgrade
                         break
-                    if MemoryNode.is_compatible(node):
-                        memory_node = memory_view.get_node(node.ctx, MemoryNode)
-                        memory_node_list.append(memory_node)
-                        nodes_to_travel.extendleft(memory_view.get_children(memory_node))
         if found_node:
             found_node = Memory.check_and_upgrade(memory_view, found_node)  # noqa
         return found_node
 
+    @staticmethod
+    def _is_memory_descendant(memory_view: ViewInfo, node: Node, top: Node) -> bool:
+        # True if node is top, or every node from top down to the parent of node is a memory node
+        while node.ctx != top.ctx:
+            if not node.parent_ctx:
+                return False
+            node = memory_view.get_node(node.parent_ctx)
+            if node is None or not MemoryNode.is_compatible(node):
+                return False
+        return True
+
     def get_debugcore_ctx(
         self, target: TargetType = None, default_target: TargetType = "DPC"
     ) -> Optional[str]:
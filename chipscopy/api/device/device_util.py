@@ -19,12 +19,13 @@
 Collection of utility functions
 
 """
-from typing import Optional
+from typing import Optional, Iterable, Dict
 
 from chipscopy.client import ServerInfo
 from chipscopy.client.jtagdevice import JtagDevice, JtagRegister
 from chipscopy.client.view_info import ViewInfo
 from chipscopy.dm import Node
+from chipscopy.dm.request import null_callback
 
 
 def get_node_hier_name(view: ViewInfo, node: Node) -> str:
@@ -157,22 +158,57 @@ def get_chipscope_view_dict(cs_server: ServerInfo) -> dict:
     return _get_basic_view_dict(cs_server, "cs_server", "chipscope")
 
 
+def _has_jtag_dna_reg(node: Node) -> bool:
+    # jtag devices store dna as a bytestream in the dna register
+    return node.props.get("node_cls") is JtagDevice and bool(
+        node.props.get("regs", None) and node.props["regs"].get("dna", None)
+    )
+
+
+def _read_jtag_dna(node: Node) -> int:
+    jtag_register = node.props["regs"]["dna"]
+    bytearray_data = jtag_register.data[0]
+    return int.from_bytes(bytearray_data, byteorder="little", signed=False)
+
+
+def get_nodes_dna(nodes: Iterable[Node]) -> Dict[str, Optional[int]]:
+    """Gets the dna of many nodes. The jtag dna register reads for all nodes are sent
+    before waiting for any reply, so devices on different cables are read concurrently.
+
+    Returns: {node ctx: 128-bit device dna value, or None if not available}
+    """
+    dna_by_ctx = {}
+    pending = []
+    for node in nodes:
+        if _has_jtag_dna_reg(node):
+            try:
+                future = node.future(done=null_callback).update_regs(reg_names=("dna",), force=True)
+                pending.append((node, future))
+            except Exception:  # noqa
+                dna_by_ctx[node.ctx] = None
+        else:
+            dna_by_ctx[node.ctx] = get_node_dna(node)
+    for node, future in pending:
+        try:
+            _ = future.result
+            dna_by_ctx[node.ctx] = _read_jtag_dna(node)
+        except Exception:  # noqa
+            dna_by_ctx[node.ctx] = None
+    return dna_by_ctx
+
+
 def get_node_dna(node: Node) -> Optional[int]:
     """Returns: 128-bit device dna value if available for the node, None otherwise."""
     dna_128 = None
     if node.props.get("node_cls") is JtagDevice:
-        # jtag devices store dna as a bytestream
-        if node.props.get("regs", None):
-            if node.props["regs"].get("dna", None):
-                # Below refreshes the dna data and makes it available
-                # node.status('dna')
-                try:
-                    node.update_regs(reg_names=("dna",), force=True, done=None)
-                    jtag_register = node.props["regs"]["dna"]
-                    bytearray_data = jtag_register.data[0]
-                    dna_128 = int.from_bytes(bytearray_data, byteorder="little", signed=False)
-                except Exception:  # noqa
-                    dna_128 = None
+        if _has_jtag_dna_reg(node):
+            # Below refreshes the dna data and makes it available
+            # node.status('dna')
+            try:
+                node.update_regs(reg_names=("dna",), force=True, done=None)
+                dna_128 = _read_jtag_dna(node)
+            except Exception:  # noqa
+                dna_128 = None
     else:
         # Other contexts store dna as a 4-tuple of 32-bit ints
         dna_4_tuple = node.props.get("DeviceDNA", None)
@@ -0,0 +1,206 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""topology_cache.py -
+
+On-disk cache of the device scan records of a hw_server (and cs_server).
+
+A full device scan waits for the jtag cables to be ready and reads the dna of
+every device. When the same boards are used by many short sessions, the scan
+result is the same every time. The topology cache saves the records of the scan
+keyed by server url. A new session loads them and checks them against the
+current view nodes, which does not access hardware, plus one dna read per cable.
+If anything does not match, the session falls back to a full scan.
+"""
+import dataclasses
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from chipscopy.api.device.device_scanner import (
+    JtagRecord,
+    MemoryRecord,
+    DebugcoreRecord,
+    ChipscopeRecord,
+    ViewRecordType,
+)
+from chipscopy.api.device.device_util import get_node_dna, get_nodes_dna
+from chipscopy.client import ServerInfo
+from chipscopy.utils.json_file_cache import JsonFileCache
+from chipscopy.utils.logger import log
+
+TOPOLOGY_CACHE_VERSION = 1
+
+DEFAULT_TOPOLOGY_CACHE_DIR = Path.home() / ".chipscopy" / "topology_cache"
+
+_RECORD_TYPES = {
+    record_type.__name__: record_type
+    for record_type in (JtagRecord, MemoryRecord, DebugcoreRecord, ChipscopeRecord)
+}
+
+
+class TopologyCache(JsonFileCache):
+    """Saves and loads device scan records, keyed by hw_server and cs_server url.
+
+    ::
+
+        session = create_session(hw_server_url=..., cs_server_url=..., topology_cache=True)
+
+    Args:
+        cache_dir: Directory for cache files. Default is ``~/.chipscopy/topology_cache``,
+            or the ``CHIPSCOPY_TOPOLOGY_CACHE_DIR`` environment variable if set.
+        dna_spot_check: Read the dna of one device per cable when validating cached records.
+    """
+
+    log_name = "topology_cache"
+
+    def __init__(self, cache_dir: Union[str, Path] = None, *, dna_spot_check: bool = True):
+        if cache_dir is None:
+            cache_dir = os.getenv("CHIPSCOPY_TOPOLOGY_CACHE_DIR", DEFAULT_TOPOLOGY_CACHE_DIR)
+        super().__init__(cache_dir)
+        self.dna_spot_check = dna_spot_check
+        # Path -> serialized records last read or written, to skip rewriting unchanged records
+        self._known_records: Dict[Path, str] = {}
+
+    def get_path(self, hw_server_url: str, cs_server_url: Optional[str] = None) -> Path:
+        return self._file_path(hw_server_url, cs_server_url)
+
+    def save(
+        self,
+        hw_server_url: str,
+        cs_server_url: Optional[str],
+        device_records: Dict[str, List[ViewRecordType]],
+    ):
+        """
+        Save scan records. Records that are the same as the ones last read or written are not
+        written again. Errors writing the file are logged and ignored.
+        """
+        devices = {
+            key: [{"type": type(rec).__name__, **dataclasses.asdict(rec)} for rec in record_list]
+            for key, record_list in device_records.items()
+        }
+        path = self.get_path(hw_server_url, cs_server_url)
+        serialized = json.dumps(devices)
+        if self._known_records.get(path) == serialized:
+            log.client.debug(f"topology_cache: {path} is up to date")
+            return
+        data = {
+            "version": TOPOLOGY_CACHE_VERSION,
+            "hw_server_url": hw_server_url,
+            "cs_server_url": cs_server_url,
+            "timestamp": time.time(),
+            "devices": devices,
+        }
+        if self._write_file(path, data):
+            self._known_records[path] = serialized
+
+    def _read(
+        self, hw_server_url: str, cs_server_url: Optional[str]
+    ) -> Optional[Dict[str, List[ViewRecordType]]]:
+        path = self.get_path(hw_server_url, cs_server_url)
+        data = self._read_file(path)
+        if data is None:
+            return None
+        try:
+            if data.get("version") != TOPOLOGY_CACHE_VERSION:
+                return None
+            self._known_records[path] = json.dumps(data["devices"])
+            return {
+                key: [_RECORD_TYPES[rec.pop("type")](**rec) for rec in record_list]
+                for key, record_list in data["devices"].items()
+            }
+        except (AttributeError, KeyError, TypeError) as ex:
+            self._report_unreadable(path, ex)
+            return None
+
+    def load(
+        self, hw_server: ServerInfo, cs_server: Optional[ServerInfo]
+    ) -> Optional[Dict[str, List[ViewRecordType]]]:
+        """Load the cached scan records for the servers, if they are still valid.
+
+        Returns:
+            Records in the format of scan_all_views(), or None if there is no valid cache entry.
+        """
+        device_records = self._read(hw_server.url, cs_server.url if cs_server else None)
+        if device_records is None:
+            return None
+        if not self.validate(hw_server, cs_server, device_records):
+            log.client.info("topology_cache: cached topology does not match - full scan")
+            return None
+        log.client.info("topology_cache: using cached topology")
+        return device_records
+
+    def validate(
+        self,
+        hw_server: ServerInfo,
+        cs_server: Optional[ServerInfo],
+        device_records: Dict[str, List[ViewRecordType]],
+    ) -> bool:
+        """Check cached records against the current view nodes.
+
+        Every record must have a node with the same name and dna property, and
+        the top level nodes of each view must be the same set as cached. With
+        dna_spot_check, the dna of the first device on each cable is read from
+        hardware and compared, which catches a board swapped for the same part.
+        """
+        servers = {"hw_server": hw_server, "cs_server": cs_server}
+        cached_ctxs = {"jtag": set(), "memory": set(), "debugcore": set(), "chipscope": set()}
+        spot_check = {}  # jtag_cable_ctx -> (node, JtagRecord)
+        for record_list in device_records.values():
+            for rec in record_list:
+                server = servers.get(rec.server)
+                if server is None:
+                    return False
+                node = server.get_view(rec.view).get_node(rec.ctx)
+                if node is None or node.props.get("Name") != rec.name:
+                    return False
+                cached_ctxs[rec.view].add(rec.ctx)
+                if type(rec) is JtagRecord:
+                    if rec.dna is not None and rec.jtag_cable_ctx not in spot_check:
+                        spot_check[rec.jtag_cable_ctx] = (node, rec)
+                elif get_node_dna(node) != rec.dna:
+                    return False
+
+        if cached_ctxs["jtag"] != _current_jtag_device_ctxs(hw_server):
+            return False
+        for view_name in ("memory", "debugcore", "chipscope"):
+            server = hw_server if view_name != "chipscope" else cs_server
+            if server is None:
+                continue
+            current_ctxs = {node.ctx for node in server.get_view(view_name).get_children()}
+            if current_ctxs != cached_ctxs[view_name]:
+                return False
+
+        if self.dna_spot_check and spot_check:
+            dna_by_ctx = get_nodes_dna(node for node, _ in spot_check.values())
+            for _, rec in spot_check.values():
+                if dna_by_ctx.get(rec.ctx) != rec.dna:
+                    return False
+        return True
+
+
+def _current_jtag_device_ctxs(hw_server: ServerInfo) -> set:
+    # Same devices as scan_jtag_view() would return, without reading dna
+    ctxs = set()
+    view = hw_server.get_view("jtag")
+    for jtag_cable in view.get_children():
+        props = jtag_cable.props
+        if not props.get("isActive") or props.get("isError") or props.get("Status"):
+            continue
+        for jtag_device in view.get_children(jtag_cable):
+            if jtag_device.props.get("Name") != "arm_dap":
+                ctxs.add(jtag_device.ctx)
+    return ctxs
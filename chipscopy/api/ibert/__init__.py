@@ -15,14 +15,21 @@
 
 from chipscopy.api.ibert.ibert import IBERT
 from chipscopy.api.ibert.link.manager import LinkGroupManager, LinkManager
+from chipscopy.api.ibert.link.monitor import LinkMonitor
 from chipscopy.api.ibert.eye_scan.manager import EyeScanManager
+from chipscopy.api.ibert.eye_scan.archive import EyeScanArchive, save_eye_scans
 from chipscopy.api.ibert.yk_scan.manager import YKScanManager
+from chipscopy.api.ibert.serial_object_base import BulkPropertyCommands
+from chipscopy.api.ibert.layout import clear_layout_cache, set_layout_cache
+from chipscopy.api.ibert.layout_cache import IBERTLayoutCache
 
 # Aliases for ease of use
 create_links = LinkManager.create_links
 delete_links = LinkManager.delete_links
 get_all_links = LinkManager.all_links
 detect_links = LinkManager.detect_links
+refresh_links = LinkManager.refresh_links
+monitor_links = LinkManager.monitor_links
 
 create_link_groups = LinkGroupManager.create_link_groups
 delete_link_groups = LinkGroupManager.delete_link_groups
@@ -30,6 +37,7 @@ get_all_link_groups = LinkGroupManager.all_link_groups
 
 create_eye_scans = EyeScanManager.create_eye_scans
 delete_eye_scans = EyeScanManager.delete_eye_scans
+run_eye_scans = EyeScanManager.run_eye_scans
 get_all_eye_scans = EyeScanManager.all_eye_scans
 
 create_yk_scans = YKScanManager.create_yk_scans
@@ -15,10 +15,25 @@
 
 from __future__ import annotations
 
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 from threading import Event
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from rich.box import SQUARE as BOX_SQUARE
 from rich.table import Table
@@ -48,12 +63,9 @@ from chipscopy.api.ibert.aliases import (
     MB_ELF_VERSION,
     EYE_SCAN_HORZ_STEP,
     EYE_SCAN_VERT_STEP,
-    EYE_SCAN_MAX_HORZ_RANGE,
-    EYE_SCAN_MIN_HORZ_RANGE,
-    EYE_SCAN_MAX_VERT_RANGE,
-    EYE_SCAN_MIN_VERT_RANGE,
 )
 from chipscopy.api.ibert.rx import RX
+from chipscopy.api.ibert.eye_scan.grid import EyeScanGrid
 from chipscopy.api.ibert.eye_scan.params import EyeScanParam
 from chipscopy.api.ibert.eye_scan.plotter import EyeScanPlot
 from chipscopy.utils.printer import printer, PercentProgressBar
@@ -73,20 +85,69 @@ class ScanPoint:
     samples: int
 
 
+class ScanPoints(Mapping):
+    """
+    Read only mapping of X, Y to :py:class:`ScanPoint`. The points are stored in the typed arrays
+    of the eye scan grid, the :py:class:`ScanPoint` instances are created on access. Changing a
+    :py:class:`ScanPoint` does not change the stored point.
+    """
+
+    def __init__(self, grid: EyeScanGrid):
+        self._grid = grid
+
+    @property
+    def grid(self) -> EyeScanGrid:
+        """Eye scan grid that stores the points"""
+        return self._grid
+
+    def __getitem__(self, key: Tuple[int, int]) -> ScanPoint:
+        x, y = key
+        grid = self._grid
+        idx = grid.index(x, y)
+        if idx is None or not grid.filled[idx]:
+            raise KeyError(key)
+        return ScanPoint(x, y, grid.ber[idx], grid.errors[idx], grid.samples[idx])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        for idx in self._grid.filled_indexes():
+            yield self._grid.point(idx)
+
+    def __len__(self) -> int:
+        return self._grid.point_count
+
+    def __repr__(self) -> str:
+        return f"ScanPoints(points={len(self)})"
+
+
 @dataclass(frozen=True)
 class Plot2DData:
-    scan_points: Dict[Tuple[int, int], ScanPoint]
-    """Collection of :py:class:`ScanPoint` instances to represent the 2D eye scan plot"""
+    scan_points: Mapping[Tuple[int, int], ScanPoint]
+    """
+    Collection of :py:class:`ScanPoint` instances to represent the 2D eye scan plot.
+    For a scan this is a read only :py:class:`ScanPoints` mapping. Any mapping of X, Y to
+    :py:class:`ScanPoint`, like a dict, can be used to build a Plot2DData for plotting.
+    """
 
     ber_floor_value: float
     """This value is used as the ``ber`` value for any X, Y coordinate whose computed BER was 0"""
 
 
+def _int_column(values) -> Union[array, List[int]]:
+    # 64 bit typed array, or a list if any value does not fit
+    try:
+        return array("q", values)
+    except (TypeError, OverflowError):
+        return list(values)
+
+
 @dataclass
 class RawData:
     """
     Class for storing raw data from the MicroBlaze. The size of all the lists in this class
     will be the same
+
+    Values are stored in 64 bit typed arrays (:py:class:`array.array`), which support indexing,
+    iteration and ``len()`` like lists. ``numpy.asarray()`` uses them without a copy.
     """
 
     ut: List[int]
@@ -96,6 +157,30 @@ class RawData:
     vertical_range: List[int]
     horizontal_range: List[int]
 
+    def __post_init__(self):
+        for name in _RAW_DATA_COLUMNS:
+            setattr(self, name, _int_column(getattr(self, name)))
+
+    def extend(self, **new_values):
+        """Append new values, one keyword argument per column"""
+        for name, values in new_values.items():
+            column = getattr(self, name)
+            new_column = _int_column(values)
+            if isinstance(column, array) and isinstance(new_column, array):
+                column.extend(new_column)
+            else:
+                setattr(self, name, list(column) + list(new_column))
+
+
+_RAW_DATA_COLUMNS = (
+    "ut",
+    "prescale",
+    "error_count",
+    "sample_count",
+    "vertical_range",
+    "horizontal_range",
+)
+
 
 @dataclass
 class ScanData:
@@ -205,6 +290,16 @@ class EyeScan:
 
     _scan_done_event: Event = field(default_factory=Event)
 
+    # Internal done notification, used by EyeScanScheduler. Called on the TCF thread.
+    _scan_done_listener: Callable[["EyeScan"], None] = None
+
+    # Incremental 2D plot state, see _update_plot_2d()
+    _plot_grid: Optional[EyeScanGrid] = None
+
+    _plot_2d_first_key: Optional[str] = None
+
+    _plot_2d_items_read: int = 0
+
     def __repr__(self) -> str:
         return self.name
 
@@ -241,6 +336,9 @@ class EyeScan:
         self.open_data_points = 0
         self.data_points_read = 0
         self.data_points_expected = 0
+        self._plot_grid = None
+        self._plot_2d_first_key = None
+        self._plot_2d_items_read = 0
 
         self._scan_done_event.clear()
 
@@ -263,72 +361,86 @@ class EyeScan:
         self._clear_out_old_data()
 
     def _calculate_vertical_horizontal_opening(self, plot_params):
-        horizontal_middle = 0
-        max_horizontal = plot_params[EYE_SCAN_MAX_HORZ_RANGE]
-        min_horizontal = plot_params[EYE_SCAN_MIN_HORZ_RANGE]
-        horizontal_step = plot_params[EYE_SCAN_HORZ_STEP]
-        if max_horizontal != -min_horizontal:
-            middle = ((max_horizontal - min_horizontal) + 1) / 2
-            horizontal_middle = min_horizontal + middle - (min_horizontal % horizontal_step)
-
-        vertical_middle = 0
-        max_vertical = plot_params[EYE_SCAN_MAX_VERT_RANGE]
-        min_vertical = plot_params[EYE_SCAN_MIN_VERT_RANGE]
-        vertical_step = plot_params[EYE_SCAN_VERT_STEP]
-        if max_vertical != -min_vertical:
-            middle = ((max_vertical - min_vertical) + 1) / 2
-            vertical_middle = min_vertical + middle - (min_vertical % vertical_step)
-
-        zero_offset_horz_min = 1000
-        zero_offset_horz_max = -1000
-        zero_offset_vert_min = 1000
-        zero_offset_vert_max = -1000
-        zero_offset_vertical_count = 0
-        zero_offset_horizontal_count = 0
-
-        for _, data in self.scan_data.processed.scan_points.items():
-            if data.errors == 0:
-                if data.x == horizontal_middle:
-                    zero_offset_vertical_count += 1
-                    if data.y < zero_offset_vert_min:
-                        zero_offset_vert_min = data.y
-                    if data.y > zero_offset_vert_max:
-                        zero_offset_vert_max = data.y
-
-                if data.y == vertical_middle:
-                    zero_offset_horizontal_count += 1
-                    if data.x < zero_offset_horz_min:
-                        zero_offset_horz_min = data.x
-                    if data.x > zero_offset_horz_max:
-                        zero_offset_horz_max = data.x
-
-        zero_offset_vert_opening = zero_offset_vert_max - zero_offset_vert_min
-        zero_offset_horz_opening = zero_offset_horz_max - zero_offset_horz_min
-
-        if zero_offset_vert_opening < 0:
-            zero_offset_vert_opening = 0
-
-        if zero_offset_horz_opening < 0:
-            zero_offset_horz_opening = 0
-
-        if zero_offset_vert_max >= 0 >= zero_offset_horz_min:
-            zero_offset_vert_opening += 1
-
-        if zero_offset_horz_max >= 0 >= zero_offset_horz_min:
-            zero_offset_horz_opening += 1
-
-        self.metric_data.vertical_opening = zero_offset_vert_opening
-        self.metric_data.horizontal_opening = zero_offset_horz_opening
-
-        num_of_columns = (max_horizontal - min_horizontal) / horizontal_step + 1
-        self.metric_data.horizontal_percentage = round(
-            float((zero_offset_horizontal_count * 100) / num_of_columns), 2
+        grid = self._plot_grid
+        if grid is None:
+            return
+
+        self.metric_data.vertical_opening = grid.vertical_opening()
+        self.metric_data.horizontal_opening = grid.horizontal_opening()
+        self.metric_data.horizontal_percentage = grid.horizontal_percentage()
+        self.metric_data.vertical_percentage = grid.vertical_percentage()
+
+    def get_ber_contour_area(self, ber: float) -> int:
+        """
+        Area inside the BER contour of the eye, computed from the scan points so far.
+
+        Args:
+            ber: BER of the contour, e.g. ``1e-9``
+
+        Returns:
+            Number of scan points with a BER at or below ber, times the horizontal and vertical
+            step. Same unit as :py:data:`MetricData.open_area`.
+
+        """
+        grid = self._plot_grid
+        if grid is None:
+            return 0
+        return grid.count_at_or_below(ber) * grid.x_step * grid.y_step
+
+    def _new_plot_2d_items(self, plot_data: dict) -> Tuple[Iterable, bool]:
+        # The server sends all points read so far with every update. Points are in scan order,
+        # so only the items after the ones already processed are new. If the payload does not
+        # continue the previous one, it is a full re-send that replaces the points stored so far.
+        #
+        # Returns the items to add, and True if they continue the points already in the grid.
+        first_key = next(iter(plot_data), None)
+        continues = (
+            self._plot_2d_first_key is not None
+            and first_key == self._plot_2d_first_key
+            and len(plot_data) >= self._plot_2d_items_read
         )
+        if continues:
+            items = islice(plot_data.items(), self._plot_2d_items_read, None)
+        else:
+            items = plot_data.items()
+            self._plot_2d_first_key = first_key
+        self._plot_2d_items_read = len(plot_data)
+        return items, continues
+
+    def _update_plot_2d(self, plot_report: dict, plot_params: dict):
+        if self.metric_data is None:
+            self.metric_data = MetricData(
+                open_area=0,
+                open_percentage=0,
+                vertical_opening=0,
+                vertical_percentage=0,
+                horizontal_opening=0,
+                horizontal_percentage=0,
+            )
+
+        items, continues = self._new_plot_2d_items(plot_report[EYE_SCAN_2D_PLOT_DATA])
+        if self._plot_grid is None or not continues:
+            # Rebuilt for a full re-send, so its points are not combined with the stored ones
+            self._plot_grid = EyeScanGrid.from_params(plot_params)
+        grid = self._plot_grid
 
-        num_of_rows = (max_vertical - min_vertical) / vertical_step + 1
-        self.metric_data.vertical_percentage = round(
-            float((zero_offset_vertical_count * 100) / num_of_rows), 2
+        for key, data in items:
+            x, y = [int(coordinate) for coordinate in key.split(", ")]
+            grid.add(x, y, data["BER"], data["Errors"], data["Sample"])
+
+        self.open_data_points = grid.open_count
+        self.metric_data.open_area = (
+            grid.open_count * plot_params[EYE_SCAN_HORZ_STEP] * plot_params[EYE_SCAN_VERT_STEP]
         )
+        self.metric_data.open_percentage = grid.open_percentage()
+        self._calculate_vertical_horizontal_opening(plot_params)
+
+        ber_floor_value = plot_report[EYE_SCAN_2D_PLOT_BER_FLOOR_VALUE]
+        processed = self.scan_data.processed
+        if processed is None or processed.ber_floor_value != ber_floor_value or not continues:
+            self.scan_data.processed = Plot2DData(
+                scan_points=ScanPoints(grid), ber_floor_value=ber_floor_value
+            )
 
     def start(self, *, show_progress_bar: bool = True):
         """
@@ -340,6 +452,14 @@ class EyeScan:
         """
         self._clear_out_old_data()
 
+        self._handle_from_cs_server = self.rx.core_tcf_node.start_eye_scan(
+            rx_name=self.rx.handle,
+            scan_parameters=self._get_scan_params(),
+        )
+
+        self._add_progress_task(show_progress_bar)
+
+    def _get_scan_params(self) -> dict:
         scan_params = dict()
         for param in self.params.values():
             if param.value is not None:
@@ -350,12 +470,9 @@ class EyeScan:
                     )
                     continue
                 scan_params[param.name] = param.value
+        return scan_params
 
-        self._handle_from_cs_server = self.rx.core_tcf_node.start_eye_scan(
-            rx_name=self.rx.handle,
-            scan_parameters=scan_params,
-        )
-
+    def _add_progress_task(self, show_progress_bar: bool):
         self._task_id = common_progress.add_task(
             description=f"{self.name} progress ",
             status=self._get_status(),
@@ -424,66 +541,19 @@ class EyeScan:
                     )
 
                 else:
-                    self.scan_data.raw.ut.extend(new_ut)
-                    self.scan_data.raw.prescale.extend(new_prescale)
-                    self.scan_data.raw.error_count.extend(new_error_count)
-                    self.scan_data.raw.sample_count.extend(new_sample_count)
-                    self.scan_data.raw.vertical_range.extend(new_vertical_range)
-                    self.scan_data.raw.horizontal_range.extend(new_horizontal_range)
-
-            if EYE_SCAN_2D_PLOT in scan_report:
-                ber_floor_value = scan_report[EYE_SCAN_2D_PLOT][EYE_SCAN_2D_PLOT_BER_FLOOR_VALUE]
-                plot_params = scan_report[EYE_SCAN_SCAN_PARAMETERS]
-
-                if self.metric_data is None:
-                    self.metric_data = MetricData(
-                        open_area=0,
-                        open_percentage=0,
-                        vertical_opening=0,
-                        vertical_percentage=0,
-                        horizontal_opening=0,
-                        horizontal_percentage=0,
+                    self.scan_data.raw.extend(
+                        ut=new_ut,
+                        prescale=new_prescale,
+                        error_count=new_error_count,
+                        sample_count=new_sample_count,
+                        vertical_range=new_vertical_range,
+                        horizontal_range=new_horizontal_range,
                     )
 
-                scan_points: Dict[Tuple[int, int], ScanPoint] = dict()
-                for key, data in scan_report[EYE_SCAN_2D_PLOT][EYE_SCAN_2D_PLOT_DATA].items():
-                    x, y = [int(coordinate) for coordinate in key.split(", ")]
-                    ber = data["BER"]
-                    errors = data["Errors"]
-                    samples = data["Sample"]
-
-                    data_point = (x, y)
-
-                    if data_point in scan_points:
-                        scan_point = scan_points[data_point]
-
-                        # Combine existing BER with new BER
-                        scan_point.ber += ber
-
-                        # Combine errors if new error != 0 and old error == 0
-                        if errors != 0 and scan_point.errors == 0:
-                            scan_point.errors = errors
-                            self.open_data_points -= 1
-                            self.metric_data.open_area -= (
-                                plot_params[EYE_SCAN_HORZ_STEP] * plot_params[EYE_SCAN_VERT_STEP]
-                            )
-
-                    else:
-                        scan_points[data_point] = ScanPoint(x, y, ber, errors, samples)
-                        if errors == 0:
-                            self.open_data_points += 1
-                            self.metric_data.open_area += (
-                                plot_params[EYE_SCAN_HORZ_STEP] * plot_params[EYE_SCAN_VERT_STEP]
-                            )
-
-                self.scan_data.processed = Plot2DData(
-                    scan_points=scan_points, ber_floor_value=ber_floor_value
-                )
-
-                self.metric_data.open_percentage = round(
-                    float((self.open_data_points * 100) / len(scan_points)), 2
+            if EYE_SCAN_2D_PLOT in scan_report:
+                self._update_plot_2d(
+                    scan_report[EYE_SCAN_2D_PLOT], scan_report[EYE_SCAN_SCAN_PARAMETERS]
                 )
-                self._calculate_vertical_horizontal_opening(plot_params)
 
             if EYE_SCAN_PROGRESS in scan_report:
                 self.progress = round(float(scan_report[EYE_SCAN_PROGRESS]), 2)
@@ -520,6 +590,9 @@ class EyeScan:
 
                 self._scan_done_event.set()
 
+                if callable(self._scan_done_listener):
+                    self._scan_done_listener(self)
+
             else:
                 # If user has registered progress callback function call it.
                 if callable(self.progress_callback):
@@ -0,0 +1,382 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Archive of many eye scans in one file.
+
+The archive is a zip file. ``index.json`` has one entry per scan, with the RX, link, status,
+scan parameters and metrics. The arrays of each scan - raw data columns and 2D plot grid
+columns - are separate members holding the bytes of the typed arrays, so writing is a memory copy
+and opening the archive only reads the index. The arrays of a scan are read when the scan is
+loaded.
+
+::
+
+    save_eye_scans("board_7_run_3.zip", eye_scans)
+
+    with EyeScanArchive("board_7_run_3.zip") as archive:
+        for entry in archive.find(link_name="Link_1.*"):
+            print(entry["name"], entry["metrics"]["open_area"])
+        scan = archive.load("EyeScan_12")
+        scan.plot.show()
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sys
+import time
+import zipfile
+from array import array
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from chipscopy.api.ibert.eye_scan import (
+    EyeScan,
+    MetricData,
+    Plot2DData,
+    RawData,
+    ScanData,
+    ScanPoints,
+    _RAW_DATA_COLUMNS,
+)
+from chipscopy.api.ibert.eye_scan.grid import EyeScanGrid
+from chipscopy.api.ibert.eye_scan.plotter import EyeScanPlot
+
+EYE_SCAN_ARCHIVE_VERSION = 1
+
+_INDEX = "index.json"
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+_GRID_TYPECODES = {"ber": "d", "errors": "q", "samples": "q"}
+
+
+@dataclass(frozen=True)
+class ArchivedRX:
+    """Identity of the RX of an archived eye scan"""
+
+    name: str
+    handle: str
+    link_name: Optional[str] = None
+
+
+@dataclass
+class ArchivedEyeScan:
+    """
+    Eye scan loaded from an :py:class:`EyeScanArchive`. Has the same data attributes as
+    :py:class:`~chipscopy.api.ibert.eye_scan.EyeScan`, and a ``plot`` for showing or saving the plot.
+    """
+
+    name: str
+    rx: ArchivedRX
+    status: str
+    progress: float
+    error: str
+    start_time: Optional[datetime]
+    stop_time: Optional[datetime]
+    elf_version: Optional[str]
+    data_points_read: int
+    data_points_expected: int
+    open_data_points: int
+    params: Dict[str, Any]
+    """Value of every scan parameter"""
+
+    scan_data: Optional[ScanData] = None
+    metric_data: Optional[MetricData] = None
+    plot: EyeScanPlot = None
+    _plot_grid: Optional[EyeScanGrid] = field(default=None, repr=False)
+
+    def __post_init__(self):
+        self.plot = EyeScanPlot(self)
+
+    def __repr__(self) -> str:
+        return self.name
+
+    def get_ber_contour_area(self, ber: float) -> int:
+        """Same as :py:meth:`EyeScan.get_ber_contour_area`"""
+        grid = self._plot_grid
+        if grid is None:
+            return 0
+        return grid.count_at_or_below(ber) * grid.x_step * grid.y_step
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    return value.strftime(_TIME_FORMAT) if value else None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    return datetime.strptime(value, _TIME_FORMAT) if value else None
+
+
+def _column_bytes(column) -> Optional[bytes]:
+    # Typed array columns are stored as bytes. List columns go into the index.
+    return column.tobytes() if isinstance(column, array) else None
+
+
+def _native_array(typecode: str, data: bytes, byteorder: str) -> array:
+    column = array(typecode)
+    column.frombytes(data)
+    if byteorder != sys.byteorder:
+        column.byteswap()
+    return column
+
+
+def save_eye_scans(
+    path: Union[str, Path],
+    eye_scans: List[EyeScan],
+    *,
+    compress: bool = False,
+) -> Path:
+    """
+    Save eye scans to a new archive file. Scans without scan data are skipped.
+
+    Args:
+        path: Archive file path. An existing file is replaced.
+        eye_scans: Eye scans to save. Scan names must be unique.
+        compress: Deflate the array members. Smaller files, slower write.
+
+    Returns:
+        Path of the archive
+
+    """
+    path = Path(path)
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    entries = list()
+    names = set()
+    with zipfile.ZipFile(path, "w", compression=compression) as zip_file:
+        for eye_scan in eye_scans:
+            if eye_scan.scan_data is None:
+                continue
+            if eye_scan.name in names:
+                raise ValueError(f"Eye scan name {eye_scan.name} is used more than once!")
+            names.add(eye_scan.name)
+
+            member_prefix = f"scans/{len(entries)}/"
+            entry = _scan_entry(eye_scan)
+            entry["members"] = member_prefix
+
+            raw = eye_scan.scan_data.raw
+            for name in _RAW_DATA_COLUMNS:
+                column = getattr(raw, name)
+                data = _column_bytes(column)
+                if data is None:
+                    entry["raw_lists"][name] = list(column)
+                else:
+                    zip_file.writestr(f"{member_prefix}raw_{name}", data)
+
+            grid = eye_scan._plot_grid
+            if grid is not None and eye_scan.scan_data.processed is not None:
+                entry["grid"] = grid.geometry()
+                entry["ber_floor_value"] = eye_scan.scan_data.processed.ber_floor_value
+                for name, data in grid.to_columns().items():
+                    zip_file.writestr(f"{member_prefix}grid_{name}", data)
+
+            entries.append(entry)
+
+        index = {
+            "version": EYE_SCAN_ARCHIVE_VERSION,
+            "timestamp": time.time(),
+            "byteorder": sys.byteorder,
+            "scans": entries,
+        }
+        zip_file.writestr(_INDEX, json.dumps(index), compress_type=zipfile.ZIP_DEFLATED)
+
+    return path
+
+
+def _scan_entry(eye_scan: EyeScan) -> Dict[str, Any]:
+    rx = eye_scan.rx
+    link = getattr(rx, "link", None)
+    return {
+        "name": eye_scan.name,
+        "rx_name": rx.name,
+        "rx_handle": rx.handle,
+        "link_name": link.name if link is not None else None,
+        "status": eye_scan.status,
+        "progress": eye_scan.progress,
+        "error": eye_scan.error,
+        "start_time": _format_time(eye_scan.start_time),
+        "stop_time": _format_time(eye_scan.stop_time),
+        "elf_version": eye_scan.elf_version,
+        "data_points_read": eye_scan.data_points_read,
+        "data_points_expected": eye_scan.data_points_expected,
+        "open_data_points": eye_scan.open_data_points,
+        "params": {
+            name: param.default_value if param.value is None else param.value
+            for name, param in eye_scan.params.items()
+        },
+        "all_params": eye_scan.scan_data.all_params,
+        "metrics": asdict(eye_scan.metric_data) if eye_scan.metric_data else None,
+        "raw_lists": dict(),
+        "grid": None,
+        "ber_floor_value": None,
+    }
+
+
+class EyeScanArchive:
+    """
+    Read only access to an eye scan archive written by :py:func:`save_eye_scans`.
+
+    Opening the archive reads the index, with the RX, link, parameters and metrics of every
+    scan. The arrays of a scan are read by :py:meth:`load`.
+
+    Args:
+        path: Archive file path
+
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._zip_file = zipfile.ZipFile(self.path, "r")
+        try:
+            index = json.loads(self._zip_file.read(_INDEX))
+        except KeyError:
+            self._zip_file.close()
+            raise ValueError(f"{self.path} is not an eye scan archive!")
+        if index.get("version") != EYE_SCAN_ARCHIVE_VERSION:
+            self._zip_file.close()
+            raise ValueError(
+                f"Eye scan archive version {index.get('version')} of {self.path} "
+                f"is not supported!"
+            )
+
+        self.timestamp: float = index["timestamp"]
+        """Time the archive was written, in seconds since the epoch"""
+
+        self._byteorder: str = index["byteorder"]
+        self.entries: Dict[str, Dict[str, Any]] = {entry["name"]: entry for entry in index["scans"]}
+        """Index entry by scan name"""
+
+    def __repr__(self) -> str:
+        return f"EyeScanArchive({str(self.path)!r}, scans={len(self)})"
+
+    def __enter__(self) -> EyeScanArchive:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def __getitem__(self, name: str) -> ArchivedEyeScan:
+        return self.load(name)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.entries)
+
+    def close(self):
+        self._zip_file.close()
+
+    def find(
+        self,
+        *,
+        name: str = None,
+        rx_name: str = None,
+        link_name: str = None,
+        status: str = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Index entries that match all given filters. Filters are regular expressions, matched
+        against the whole value, like ``QueryList.filter_by``.
+
+        Returns:
+            Matching index entries, in archive order
+
+        """
+        filters = {"name": name, "rx_name": rx_name, "link_name": link_name, "status": status}
+        patterns = {
+            key: re.compile(pattern) for key, pattern in filters.items() if pattern is not None
+        }
+        return [
+            entry
+            for entry in self.entries.values()
+            if all(
+                entry[key] is not None and pattern.fullmatch(str(entry[key]))
+                for key, pattern in patterns.items()
+            )
+        ]
+
+    def metrics(self) -> Dict[str, Optional[MetricData]]:
+        """Metrics of every scan by scan name, from the index only"""
+        return {
+            name: MetricData(**entry["metrics"]) if entry["metrics"] else None
+            for name, entry in self.entries.items()
+        }
+
+    def load(self, name: str) -> ArchivedEyeScan:
+        """
+        Read the arrays of one scan.
+
+        Args:
+            name: Scan name
+
+        Returns:
+            The scan, with raw data, 2D plot data and metrics
+
+        """
+        entry = self.entries[name]
+        prefix = entry["members"]
+
+        raw_columns = dict()
+        for column_name in _RAW_DATA_COLUMNS:
+            if column_name in entry["raw_lists"]:
+                raw_columns[column_name] = entry["raw_lists"][column_name]
+            else:
+                raw_columns[column_name] = _native_array(
+                    "q", self._zip_file.read(f"{prefix}raw_{column_name}"), self._byteorder
+                )
+
+        scan_data = ScanData(raw=RawData(**raw_columns), all_params=entry["all_params"])
+
+        grid = None
+        if entry["grid"] is not None:
+            columns = {
+                column_name: _native_array(
+                    typecode, self._zip_file.read(f"{prefix}grid_{column_name}"), self._byteorder
+                ).tobytes()
+                for column_name, typecode in _GRID_TYPECODES.items()
+            }
+            columns["filled"] = self._zip_file.read(f"{prefix}grid_filled")
+            grid = EyeScanGrid.from_columns(entry["grid"], columns)
+            scan_data.processed = Plot2DData(
+                scan_points=ScanPoints(grid), ber_floor_value=entry["ber_floor_value"]
+            )
+
+        return ArchivedEyeScan(
+            name=entry["name"],
+            rx=ArchivedRX(entry["rx_name"], entry["rx_handle"], entry["link_name"]),
+            status=entry["status"],
+            progress=entry["progress"],
+            error=entry["error"],
+            start_time=_parse_time(entry["start_time"]),
+            stop_time=_parse_time(entry["stop_time"]),
+            elf_version=entry["elf_version"],
+            data_points_read=entry["data_points_read"],
+            data_points_expected=entry["data_points_expected"],
+            open_data_points=entry["open_data_points"],
+            params=entry["params"],
+            scan_data=scan_data,
+            metric_data=MetricData(**entry["metrics"]) if entry["metrics"] else None,
+            _plot_grid=grid,
+        )
@@ -0,0 +1,387 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from array import array
+from math import log10
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+
+    _numpy_available = True
+except ImportError:
+    np = None
+    _numpy_available = False
+
+from chipscopy.api.ibert.aliases import (
+    EYE_SCAN_HORZ_STEP,
+    EYE_SCAN_MAX_HORZ_RANGE,
+    EYE_SCAN_MAX_VERT_RANGE,
+    EYE_SCAN_MIN_HORZ_RANGE,
+    EYE_SCAN_MIN_VERT_RANGE,
+    EYE_SCAN_VERT_STEP,
+)
+from chipscopy.utils.printer import printer
+
+
+class _ZeroOffsetLine:
+    """Open points on the zero offset row or column of the eye, stored incrementally"""
+
+    __slots__ = ("count", "min", "max")
+
+    def __init__(self):
+        # Same initial values as the full scan in older versions, the opening math depends on them
+        self.count = 0
+        self.min = 1000
+        self.max = -1000
+
+    def add(self, position: int):
+        self.count += 1
+        if position < self.min:
+            self.min = position
+        if position > self.max:
+            self.max = position
+
+
+class EyeScanGrid:
+    """
+    Dense 2D grid of eye scan points, preallocated from the scan parameters.
+
+    Points are stored in flat typed arrays indexed by ``(y - min_y) / y_step * columns +
+    (x - min_x) / x_step``. The open point count and the zero offset row and column are updated
+    as points are added, so the scan metrics never need a pass over all points.
+
+    Whole grid operations, like the plot z values and BER contour areas, work on the arrays
+    directly, with numpy when it is installed.
+
+    The scan range does not have to be a multiple of the step, e.g. -127 to 127 in steps of 8.
+    The grid follows the points instead: if the first point is not at ``min + k * step``, the
+    grid is moved to the point. A later point that is still off the grid is snapped to the
+    nearest grid point, with a warning. The zero offset percentages are still relative to the
+    scan range, ``(max - min) / step + 1`` rows or columns, as before the grid.
+    """
+
+    def __init__(
+        self,
+        min_x: int,
+        max_x: int,
+        x_step: int,
+        min_y: int,
+        max_y: int,
+        y_step: int,
+        middle_x: Optional[float] = None,
+        middle_y: Optional[float] = None,
+        scan_min_x: Optional[int] = None,
+        scan_min_y: Optional[int] = None,
+    ):
+        self.min_x, self.max_x, self.x_step = min_x, max_x, x_step
+        self.min_y, self.max_y, self.y_step = min_y, max_y, y_step
+        # Minimums of the scan range, before the grid is moved to the points
+        self.scan_min_x = min_x if scan_min_x is None else scan_min_x
+        self.scan_min_y = min_y if scan_min_y is None else scan_min_y
+
+        self.point_count = 0
+        self.open_count = 0
+        self._allocate()
+
+        if middle_x is None:
+            middle_x = 0
+            if max_x != -min_x:
+                middle_x = min_x + ((max_x - min_x) + 1) / 2 - (min_x % x_step)
+        self.middle_x = middle_x
+        if middle_y is None:
+            middle_y = 0
+            if max_y != -min_y:
+                middle_y = min_y + ((max_y - min_y) + 1) / 2 - (min_y % y_step)
+        self.middle_y = middle_y
+
+        self.middle_column = _ZeroOffsetLine()
+        self.middle_row = _ZeroOffsetLine()
+
+        self._snap_reported = False
+
+    def _allocate(self):
+        self.columns = int((self.max_x - self.min_x) // self.x_step) + 1
+        self.rows = int((self.max_y - self.min_y) // self.y_step) + 1
+        size = self.columns * self.rows
+
+        self.ber = array("d", bytes(8 * size))
+        self.errors = array("q", bytes(8 * size))
+        self.samples = array("q", bytes(8 * size))
+        self.filled = bytearray(size)
+
+    @classmethod
+    def from_params(cls, plot_params: dict) -> EyeScanGrid:
+        return cls(
+            plot_params[EYE_SCAN_MIN_HORZ_RANGE],
+            plot_params[EYE_SCAN_MAX_HORZ_RANGE],
+            plot_params[EYE_SCAN_HORZ_STEP],
+            plot_params[EYE_SCAN_MIN_VERT_RANGE],
+            plot_params[EYE_SCAN_MAX_VERT_RANGE],
+            plot_params[EYE_SCAN_VERT_STEP],
+        )
+
+    @classmethod
+    def from_columns(cls, geometry: Dict[str, int], columns: Dict[str, bytes]) -> EyeScanGrid:
+        """
+        Grid from the output of :py:meth:`geometry` and :py:meth:`to_columns`.
+        Bytes are in native byte order.
+        """
+        grid = cls(**geometry)
+        size = grid.columns * grid.rows
+        for name in ("ber", "errors", "samples"):
+            column = array(getattr(grid, name).typecode)
+            column.frombytes(columns[name])
+            if len(column) != size:
+                raise ValueError(
+                    f"Eye scan grid column {name} has {len(column)} values, not {size}"
+                )
+            setattr(grid, name, column)
+        grid.filled = bytearray(columns["filled"])
+        if len(grid.filled) != size:
+            raise ValueError(
+                f"Eye scan grid column filled has {len(grid.filled)} values, not {size}"
+            )
+
+        grid.point_count = size - grid.filled.count(0)
+        grid.open_count = sum(
+            1 for filled, errors in zip(grid.filled, grid.errors) if filled and errors == 0
+        )
+        if grid.index(grid.middle_x, grid.min_y) is not None:
+            grid.middle_column = grid._open_line(x=grid.middle_x)
+        if grid.index(grid.min_x, grid.middle_y) is not None:
+            grid.middle_row = grid._open_line(y=grid.middle_y)
+        return grid
+
+    def geometry(self) -> Dict[str, int]:
+        return {
+            "min_x": self.min_x,
+            "max_x": self.max_x,
+            "x_step": self.x_step,
+            "min_y": self.min_y,
+            "max_y": self.max_y,
+            "y_step": self.y_step,
+            "middle_x": self.middle_x,
+            "middle_y": self.middle_y,
+            "scan_min_x": self.scan_min_x,
+            "scan_min_y": self.scan_min_y,
+        }
+
+    def to_columns(self) -> Dict[str, bytes]:
+        """Point arrays as bytes, in native byte order"""
+        return {
+            "ber": self.ber.tobytes(),
+            "errors": self.errors.tobytes(),
+            "samples": self.samples.tobytes(),
+            "filled": bytes(self.filled),
+        }
+
+    def __len__(self) -> int:
+        return self.point_count
+
+    def index(self, x: int, y: int) -> Optional[int]:
+        """Flat array index of a point, or None if the point is not on the grid"""
+        column, x_rem = divmod(x - self.min_x, self.x_step)
+        row, y_rem = divmod(y - self.min_y, self.y_step)
+        if x_rem or y_rem or not (0 <= column < self.columns and 0 <= row < self.rows):
+            return None
+        return int(row * self.columns + column)
+
+    def _align_to(self, x: int, y: int) -> bool:
+        # Move the empty grid so x, y is on it. The grid keeps covering the scan range.
+        if not (self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y):
+            return False
+        self.min_x += (x - self.min_x) % self.x_step
+        self.min_y += (y - self.min_y) % self.y_step
+        self._allocate()
+        return True
+
+    def _nearest_index(self, x: int, y: int) -> int:
+        column = min(max(round((x - self.min_x) / self.x_step), 0), self.columns - 1)
+        row = min(max(round((y - self.min_y) / self.y_step), 0), self.rows - 1)
+        return int(row * self.columns + column)
+
+    def add(self, x: int, y: int, ber: float, errors: int, samples: int) -> int:
+        """
+        Add a new point, or combine it with the point already stored at x, y.
+
+        Returns:
+            Flat array index of the point
+
+        """
+        idx = self.index(x, y)
+        if idx is None:
+            if self.point_count == 0 and self._align_to(x, y):
+                idx = self.index(x, y)
+            if idx is None:
+                idx = self._nearest_index(x, y)
+                snapped_x, snapped_y = self.point(idx)
+                if not self._snap_reported:
+                    self._snap_reported = True
+                    printer(
+                        f"Eye scan point {x}, {y} is not on the scan grid, it is stored as "
+                        f"{snapped_x}, {snapped_y}. Other points off the grid are snapped too.",
+                        level="warning",
+                    )
+                x, y = snapped_x, snapped_y
+
+        if not self.filled[idx]:
+            self.filled[idx] = 1
+            self.point_count += 1
+            self.ber[idx] = ber
+            self.errors[idx] = errors
+            self.samples[idx] = samples
+            if errors == 0:
+                self.open_count += 1
+                if x == self.middle_x:
+                    self.middle_column.add(y)
+                if y == self.middle_y:
+                    self.middle_row.add(x)
+            return idx
+
+        # Combine existing BER with new BER
+        self.ber[idx] += ber
+
+        # Combine errors if new error != 0 and old error == 0
+        if errors != 0 and self.errors[idx] == 0:
+            self.errors[idx] = errors
+            self.open_count -= 1
+            if x == self.middle_x:
+                self.middle_column = self._open_line(x=x)
+            if y == self.middle_y:
+                self.middle_row = self._open_line(y=y)
+        return idx
+
+    def _open_line(self, *, x: int = None, y: int = None) -> _ZeroOffsetLine:
+        # Rescan one column (or row) after an open point was closed. This is the only O(n) path.
+        line = _ZeroOffsetLine()
+        if x is not None:
+            first, stride, count = self.index(x, self.min_y), self.columns, self.rows
+            start, step = self.min_y, self.y_step
+        else:
+            first, stride, count = self.index(self.min_x, y), 1, self.columns
+            start, step = self.min_x, self.x_step
+        for n in range(count):
+            idx = first + n * stride
+            if self.filled[idx] and self.errors[idx] == 0:
+                line.add(start + n * step)
+        return line
+
+    def x_at(self, column: int) -> int:
+        return self.min_x + column * self.x_step
+
+    def y_at(self, row: int) -> int:
+        return self.min_y + row * self.y_step
+
+    def point(self, idx: int) -> Tuple[int, int]:
+        """X, Y of a flat array index"""
+        row, column = divmod(idx, self.columns)
+        return self.x_at(column), self.y_at(row)
+
+    def filled_indexes(self) -> List[int]:
+        """Flat array indexes of all points, in row order"""
+        if _numpy_available:
+            return np.flatnonzero(np.frombuffer(self.filled, dtype=np.uint8)).tolist()
+        return [idx for idx, filled in enumerate(self.filled) if filled]
+
+    def filled_rows_and_columns(self) -> Tuple[List[int], List[int]]:
+        """Indexes of the rows and of the columns with at least one point"""
+        if _numpy_available:
+            filled = np.frombuffer(self.filled, dtype=np.uint8).reshape(self.rows, self.columns)
+            return (
+                np.flatnonzero(filled.any(axis=1)).tolist(),
+                np.flatnonzero(filled.any(axis=0)).tolist(),
+            )
+        rows, columns = set(), set()
+        for idx in self.filled_indexes():
+            row, column = divmod(idx, self.columns)
+            rows.add(row)
+            columns.add(column)
+        return sorted(rows), sorted(columns)
+
+    def log10_ber(
+        self, rows: List[int], columns: List[int], ber_floor: float
+    ) -> List[List[Optional[float]]]:
+        """
+        log10 of the BER of the points in the rows and columns, row by row.
+        BER 0 is replaced by ber_floor. Missing points are None.
+        """
+        if _numpy_available:
+            shape = (self.rows, self.columns)
+            selection = np.ix_(rows, columns)
+            filled = np.frombuffer(self.filled, dtype=np.uint8).reshape(shape)[selection] != 0
+            ber = np.frombuffer(self.ber, dtype=np.float64).reshape(shape)[selection]
+            z = np.log10(np.where(ber > 0, ber, ber_floor))
+            z_rows = z.tolist()
+            if not filled.all():
+                for z_row, filled_row in zip(z_rows, filled.tolist()):
+                    for n, is_filled in enumerate(filled_row):
+                        if not is_filled:
+                            z_row[n] = None
+            return z_rows
+
+        z_rows = list()
+        for row in rows:
+            first = row * self.columns
+            z_row = list()
+            for column in columns:
+                idx = first + column
+                if self.filled[idx]:
+                    ber = self.ber[idx]
+                    z_row.append(log10(ber if ber > 0 else ber_floor))
+                else:
+                    z_row.append(None)
+            z_rows.append(z_row)
+        return z_rows
+
+    def count_at_or_below(self, ber: float) -> int:
+        """Number of points with a BER at or below ber"""
+        if _numpy_available:
+            filled = np.frombuffer(self.filled, dtype=np.uint8) != 0
+            return int(
+                np.count_nonzero(filled & (np.frombuffer(self.ber, dtype=np.float64) <= ber))
+            )
+        return sum(
+            1 for filled, point_ber in zip(self.filled, self.ber) if filled and point_ber <= ber
+        )
+
+    def open_percentage(self) -> float:
+        return (
+            round(float((self.open_count * 100) / self.point_count), 2) if self.point_count else 0
+        )
+
+    def vertical_opening(self) -> int:
+        line = self.middle_column
+        opening = max(line.max - line.min, 0)
+        # Compared with the horizontal minimum, as the original full scan did
+        if line.max >= 0 >= self.middle_row.min:
+            opening += 1
+        return opening
+
+    def horizontal_opening(self) -> int:
+        line = self.middle_row
+        opening = max(line.max - line.min, 0)
+        if line.max >= 0 >= line.min:
+            opening += 1
+        return opening
+
+    def vertical_percentage(self) -> float:
+        num_of_rows = (self.max_y - self.scan_min_y) / self.y_step + 1
+        return round(float((self.middle_column.count * 100) / num_of_rows), 2)
+
+    def horizontal_percentage(self) -> float:
+        num_of_columns = (self.max_x - self.scan_min_x) / self.x_step + 1
+        return round(float((self.middle_row.count * 100) / num_of_columns), 2)
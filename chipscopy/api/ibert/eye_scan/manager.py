@@ -20,6 +20,7 @@ from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Union
 from chipscopy.api.containers import QueryList
 from chipscopy.api.ibert.link import Link
 from chipscopy.api.ibert.eye_scan import EyeScan
+from chipscopy.api.ibert.eye_scan.scheduler import DEFAULT_MAX_SCANS_PER_CORE, EyeScanScheduler
 from chipscopy.utils import printer
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -107,6 +108,39 @@ class EyeScanManager:
 
         return new_eye_scans
 
+    @staticmethod
+    def run_eye_scans(
+        eye_scans: UnionEyeScanListEyeScan,
+        *,
+        max_scans_per_core: int = DEFAULT_MAX_SCANS_PER_CORE,
+        show_progress_bar: bool = True,
+        wait: bool = False,
+    ) -> EyeScanScheduler:
+        """
+        Start many eye scans, a limited number at a time on each IBERT core.
+        See :py:class:`~chipscopy.api.ibert.eye_scan.scheduler.EyeScanScheduler`.
+
+        Args:
+            eye_scans: Eye scan object(s) to run
+            max_scans_per_core: Number of scans running at the same time on each IBERT core
+            show_progress_bar: Set to true to show progress bar on stdout
+            wait: Block till all scans have ended
+
+        Returns:
+            Scheduler, with the aggregate progress and completion futures
+
+        """
+        if isinstance(eye_scans, EyeScan):
+            eye_scans = [eye_scans]
+
+        scheduler = EyeScanScheduler(
+            eye_scans, max_scans_per_core=max_scans_per_core, show_progress_bar=show_progress_bar
+        )
+        scheduler.start()
+        if wait:
+            scheduler.wait_till_done()
+        return scheduler
+
     @staticmethod
     def delete_eye_scans(scans_to_delete: Optional[UnionEyeScanListEyeScan] = None):
         """
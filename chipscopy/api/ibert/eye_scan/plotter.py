@@ -15,36 +15,22 @@
 
 import csv
 import math
+from importlib.util import find_spec
 import re
-from math import exp, log
+from math import exp, log, log10
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional
 
 from chipscopy.utils.printer import printer
 
-try:
-    import kaleido
-    import plotly as px
-    import plotly.graph_objs as go
-
-    _plotly_available = True
-except ImportError:
-    _plotly_available = False
-
-try:
-    from IPython import get_ipython
-    from IPython.display import Image, display
-
-    _jupyter_available = True
-except ImportError:
-    get_ipython = None
-    Image = None
-    display = None
-    _jupyter_available = False
+# plotly and IPython are slow to import - they are imported on first use
+_plotly_available = find_spec("plotly") is not None and find_spec("kaleido") is not None
+_jupyter_available = find_spec("IPython") is not None
 
 from chipscopy.api.ibert.aliases import EYE_SCAN_HORZ_RANGE
 
 if TYPE_CHECKING:  # pragma: no cover
+    import plotly.graph_objs as go
     from chipscopy.api.ibert.eye_scan import EyeScan
 
 
@@ -65,6 +51,8 @@ def check_for_jupyter():
 def is_running_notebook():
     try:
         check_for_jupyter()
+        from IPython import get_ipython
+
         shell = get_ipython().__class__.__name__
     except ImportError:
         shell = None
@@ -85,7 +73,7 @@ class EyeScanPlot:
         self.eye_scan: EyeScan = eye_scan
         """Link to the `EyeScan` object"""
 
-        self.fig: go.Figure = None
+        self.fig: "go.Figure" = None
         """Plotly `Figure` object"""
 
         # -------------------------------------------------------
@@ -126,23 +114,40 @@ class EyeScanPlot:
                 f"This might be because the scan did not finish successfully."
             )
 
-        xs, ys = set(), set()
-        for point in self.eye_scan.scan_data.processed.scan_points:
-            xs.add(point[0])
-            ys.add(point[1])
-
-        self._x = sorted(xs)
-        self._y = sorted(ys)
-
-        for y in self._y:
-            row_vals = list()
+        from chipscopy.api.ibert.eye_scan import ScanPoints
+
+        scan_points = self.eye_scan.scan_data.processed.scan_points
+        ber_floor_value = self.eye_scan.scan_data.processed.ber_floor_value
+        if isinstance(scan_points, ScanPoints):
+            # z values come from the typed arrays of the eye scan grid, row by row
+            grid = scan_points.grid
+            rows, columns = grid.filled_rows_and_columns()
+            self._x = [grid.x_at(column) for column in columns]
+            self._y = [grid.y_at(row) for row in rows]
+            self._z = grid.log10_ber(rows, columns, ber_floor_value)
+        else:
+            # Any mapping of X, Y to ScanPoint, e.g. a dict built by the user
+            self._x = sorted({x for x, _ in scan_points})
+            self._y = sorted({y for _, y in scan_points})
+            for y in self._y:
+                z_row = list()
+                for x in self._x:
+                    point = scan_points.get((x, y))
+                    if point is None:
+                        z_row.append(None)
+                    else:
+                        z_row.append(log10(point.ber if point.ber > 0 else ber_floor_value))
+                self._z.append(z_row)
+
+        for row_vals in self._z:
             z_hovertext_row = list()
-            for x in self._x:
-                ber = self.eye_scan.scan_data.processed.scan_points[(x, y)].ber
-                val = log(ber, 10)
-                hovertext = format(pow(10, val), ".2e")
-                z_hovertext_row.append(hovertext)
-                row_vals.append(val)
+            for val in row_vals:
+                z_hovertext_row.append("" if val is None else format(pow(10, val), ".2e"))
+            self._z_to_ber.append(z_hovertext_row)
+
+            row_vals = [val for val in row_vals if val is not None]
+            if not row_vals:
+                continue
 
             curr_min = min(row_vals)
             if self._min_ber == -1234 or curr_min < self._min_ber:
@@ -152,9 +157,6 @@ class EyeScanPlot:
             if self._max_ber == -1234 or curr_max > self._max_ber:
                 self._max_ber = curr_max
 
-            self._z.append(row_vals)
-            self._z_to_ber.append(z_hovertext_row)
-
         extracted_data = re.match(
             r"^(.*) UI to (.*) UI$", self.eye_scan.scan_data.all_params[EYE_SCAN_HORZ_RANGE]
         )
@@ -181,6 +183,7 @@ class EyeScanPlot:
 
     def _generate_plot_instance(self, *, title: str = ""):
         check_for_plotly()
+        import plotly.graph_objs as go
 
         contour = go.Contour(
             x=self._x,
@@ -233,6 +236,8 @@ class EyeScanPlot:
             self.fig.show()
         elif display_type == "static":
             check_for_jupyter()
+            from IPython.display import Image, display
+
             image_bytes = self.fig.to_image(format="png")
             ipython_image = Image(image_bytes)
             display(ipython_image)
@@ -0,0 +1,256 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Tuple
+
+from chipscopy.api.ibert.aliases import EYE_SCAN_ABORTED, EYE_SCAN_DONE
+from chipscopy.tcf import protocol
+from chipscopy.utils.printer import printer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.ibert.eye_scan import EyeScan
+
+DEFAULT_MAX_SCANS_PER_CORE = 4
+"""
+Default number of scans running at the same time on each IBERT core. This is a starting point,
+not a limit read from the core - tune it with ``max_scans_per_core`` for the design and server.
+"""
+
+
+class _CoreQueue:
+    __slots__ = ("client", "pending", "running")
+
+    def __init__(self, client):
+        self.client = client
+        self.pending: Deque[EyeScan] = deque()
+        self.running = 0
+
+
+class EyeScanScheduler:
+    """
+    Runs many eye scans, a limited number at a time on each IBERT core.
+
+    The first scans of every core are started together, with pipelined start commands. When a
+    scan ends, the next scan of the same core is started right away from the TCF thread.
+    :py:meth:`start` returns right away, use the futures or :py:meth:`wait_till_done` to wait.
+
+    ::
+
+        scans = create_eye_scans(target_objs=links)
+        scheduler = EyeScanScheduler(scans, max_scans_per_core=4)
+        scheduler.start()
+        scheduler.wait_till_done()
+        print(scheduler.progress, len(scheduler.aborted_scans))
+
+    Args:
+        eye_scans: Eye scans to run, in the order they should start. Scan names must be unique.
+        max_scans_per_core: Number of scans running at the same time on each IBERT core.
+        show_progress_bar: Show a progress bar for every scan on stdout.
+        progress_callback: **(Optional)** Called with the aggregate progress in % when a scan
+            ends. Called on the TCF thread.
+
+    """
+
+    def __init__(
+        self,
+        eye_scans: List[EyeScan],
+        *,
+        max_scans_per_core: int = DEFAULT_MAX_SCANS_PER_CORE,
+        show_progress_bar: bool = True,
+        progress_callback: Callable[[float], None] = None,
+    ):
+        if max_scans_per_core < 1:
+            raise ValueError(f"max_scans_per_core must be 1 or larger, not {max_scans_per_core}")
+
+        self.eye_scans: List[EyeScan] = list(eye_scans)
+        names = set()
+        for scan in self.eye_scans:
+            if scan.name in names:
+                raise ValueError(
+                    f"More than one eye scan is named {scan.name!r}. "
+                    f"Eye scan names must be unique in an EyeScanScheduler."
+                )
+            names.add(scan.name)
+        self.max_scans_per_core = max_scans_per_core
+        self.show_progress_bar = show_progress_bar
+        self.progress_callback = progress_callback
+
+        self.futures: Dict[str, Future] = dict()
+        """Future per eye scan name. The result is the :py:class:`EyeScan`, done or aborted"""
+
+        self.future: Future = Future()
+        """Completes with the list of eye scans, when all scans have ended"""
+
+        self._queues: Dict[str, _CoreQueue] = dict()
+        self._running: Dict[str, Tuple[EyeScan, _CoreQueue]] = dict()
+        self._remaining = 0
+        self._started = False
+
+    def __repr__(self) -> str:
+        return (
+            f"EyeScanScheduler(scans={len(self.eye_scans)}, pending={self.pending_count}, "
+            f"running={self.running_count}, progress={self.progress}%)"
+        )
+
+    @property
+    def pending_count(self) -> int:
+        """Number of scans not started yet"""
+        return sum(len(queue.pending) for queue in self._queues.values())
+
+    @property
+    def running_count(self) -> int:
+        return len(self._running)
+
+    @property
+    def done_scans(self) -> List[EyeScan]:
+        return [scan for scan in self.eye_scans if scan.status == EYE_SCAN_DONE]
+
+    @property
+    def aborted_scans(self) -> List[EyeScan]:
+        return [scan for scan in self.eye_scans if scan.status == EYE_SCAN_ABORTED]
+
+    @property
+    def progress(self) -> float:
+        """Aggregate progress of all scans in %"""
+        if not self.eye_scans:
+            return 100.0
+        total = 0.0
+        for name, future in self.futures.items():
+            if future.done():
+                total += 100.0
+            else:
+                scan, _ = self._running.get(name, (None, None))
+                if scan is not None and scan.progress > 0:
+                    total += scan.progress
+        return round(total / len(self.eye_scans), 2)
+
+    def start(self) -> EyeScanScheduler:
+        """Start scheduling the eye scans. Returns right away."""
+        if self._started:
+            raise RuntimeError("Eye scan scheduler was already started!")
+        self._started = True
+
+        self._remaining = len(self.eye_scans)
+        for scan in self.eye_scans:
+            self.futures[scan.name] = Future()
+            node = scan.rx.core_tcf_node
+            queue = self._queues.get(node.ctx)
+            if queue is None:
+                client = node.manager.cs_manager.get_node(node.ctx, node.node_cls)
+                queue = self._queues[node.ctx] = _CoreQueue(client)
+            queue.pending.append(scan)
+
+        if self._remaining == 0:
+            self.future.set_result(self.eye_scans)
+        else:
+            protocol.invokeLater(self._start_next_scans)
+        return self
+
+    def wait_till_done(self, timeout: Optional[float] = None) -> List[EyeScan]:
+        """
+        Block till all scans have ended.
+
+        Args:
+            timeout: Max seconds to wait. Default is no limit.
+
+        Returns:
+            List of all eye scans
+
+        """
+        return self.future.result(timeout)
+
+    def stop(self):
+        """Cancel the scans not started yet and stop the running scans."""
+        protocol.invokeLater(self._stop)
+
+    def _start_next_scans(self):
+        # NOTE - This is called on the TCF event dispatcher thread.
+        # All start commands go out before any result comes back.
+        for queue in self._queues.values():
+            while queue.pending and queue.running < self.max_scans_per_core:
+                self._start_scan(queue, queue.pending.popleft())
+
+    def _start_scan(self, queue: _CoreQueue, scan: EyeScan):
+        queue.running += 1
+        self._running[scan.name] = (scan, queue)
+        scan._clear_out_old_data()
+        scan._scan_done_listener = self._scan_done
+
+        def done_start(token, error, handle):
+            if error:
+                self._scan_failed(scan, error)
+                return
+            scan._handle_from_cs_server = handle
+            scan._add_progress_task(self.show_progress_bar)
+
+        try:
+            queue.client.start_eye_scan(
+                rx_name=scan.rx.handle, scan_parameters=scan._get_scan_params(), done=done_start
+            )
+        except Exception as e:
+            self._scan_failed(scan, e)
+
+    def _scan_failed(self, scan: EyeScan, error):
+        scan.status = EYE_SCAN_ABORTED
+        scan.error = str(error)
+        scan._scan_done_event.set()
+        self._scan_done(scan)
+
+    def _scan_done(self, scan: EyeScan):
+        # NOTE - This is called on the TCF event dispatcher thread
+        _, queue = self._running.pop(scan.name, (None, None))
+        if queue is None:
+            return
+        scan._scan_done_listener = None
+        queue.running -= 1
+        self._finish(scan.name, result=scan)
+        self._start_next_scans()
+
+    def _finish(self, name: str, *, result=None, cancel: bool = False):
+        future = self.futures[name]
+        if cancel:
+            future.cancel()
+        else:
+            future.set_result(result)
+
+        self._remaining -= 1
+        if callable(self.progress_callback):
+            try:
+                self.progress_callback(self.progress)
+            except Exception as e:
+                printer(
+                    f"Unhandled exception during eye scan scheduler progress callback!\n"
+                    f"Exception - {str(e)}",
+                    level="warning",
+                )
+        if self._remaining == 0:
+            self.future.set_result(self.eye_scans)
+
+    def _stop(self):
+        # NOTE - This is called on the TCF event dispatcher thread
+        for queue in self._queues.values():
+            while queue.pending:
+                self._finish(queue.pending.popleft().name, cancel=True)
+
+        for scan, queue in list(self._running.values()):
+            queue.client.terminate_eye_scan(rx_name=scan.rx.handle, done=_ignore_done)
+
+
+def _ignore_done(token, error, results):
+    # The aborted status arrives with the scan report
+    pass
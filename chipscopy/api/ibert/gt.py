@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Dict, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Union, Any
 
 from chipscopy.api.ibert.aliases import CHILDREN, RX_KEY, TX_KEY, TYPE, PLL_SOURCE, PLL_KEY
 from chipscopy.api.ibert.rx import RX
@@ -68,6 +68,9 @@ class GT(SerialObjectBase["GTGroup", Union[TX, RX]]):
         _, pll_names_for_this_gt = self._property.refresh(
             self._property_for_alias[PLL_SOURCE]
         ).popitem()
+        self._set_pll(pll_names_for_this_gt)
+
+    def _set_pll(self, pll_names_for_this_gt: str):
         if pll_names_for_this_gt:
             for pll in self.parent.plls:
                 if pll.name == pll_names_for_this_gt:
@@ -75,16 +78,11 @@ class GT(SerialObjectBase["GTGroup", Union[TX, RX]]):
         else:
             print("No PLL defined for this GT")
 
-    def setup(self):
-        if self.setup_done:
-            return
-
-        obj_info = self._get_obj_info_with_props()
-        self._update_all_props(obj_info)
-        self._build_aliases(obj_info)
+    def _setup_from_obj_info(self, obj_info: Dict[str, Any]) -> List[Union[TX, RX, PLL]]:
+        SerialObjectBase._setup_from_obj_info(self, obj_info)
 
         if not obj_info.get(CHILDREN):
-            return
+            return []
 
         # Build the child objects
         for child_name, child_obj_info in obj_info[CHILDREN].items():
@@ -98,9 +96,15 @@ class GT(SerialObjectBase["GTGroup", Union[TX, RX]]):
             else:
                 continue
 
-            obj.setup()
             self._children.append(obj)
 
+        return list(self._children)
+
+    def _finish_setup(self):
+        if not self._children:
+            self.setup_done = True
+            return
+
         # We always expect a GT to have one valid RX and one valid TX, no more, no less.
         self.rx = one(
             self._children.filter_by(type=RX_KEY),
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import TYPE_CHECKING, Dict, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Union, Any
 
 from chipscopy.api.ibert.aliases import CHILDREN, TYPE, PLL_SOURCE, PLL_KEY
 from chipscopy.api.ibert.serial_object_base import SerialObjectBase
@@ -35,16 +35,11 @@ class GTCOMMON(SerialObjectBase["GTGroup", None]):
         self.pll: list[PLL] = []
         "PLL driving this GT_COMMON"
 
-    def setup(self):
-        if self.setup_done:
-            return
-
-        obj_info = self._get_obj_info_with_props()
-        self._update_all_props(obj_info)
-        self._build_aliases(obj_info)
+    def _setup_from_obj_info(self, obj_info: Dict[str, Any]) -> List[PLL]:
+        SerialObjectBase._setup_from_obj_info(self, obj_info)
 
         if not obj_info.get(CHILDREN):
-            return
+            return []
 
         # Build the child objects
         for child_name, child_obj_info in obj_info[CHILDREN].items():
@@ -53,8 +48,7 @@ class GTCOMMON(SerialObjectBase["GTGroup", None]):
             else:
                 continue
 
-            obj.setup()
             self._children.append(obj)
             self.pll.append(obj)
 
-        self.setup_done = True
+        return list(self._children)
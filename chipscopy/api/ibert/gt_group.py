@@ -15,12 +15,13 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Union, Any
+from typing import TYPE_CHECKING, Dict, List, Union, Any
 
 from chipscopy.api.containers import QueryList
 from chipscopy.api.ibert.aliases import CHILDREN, GT_KEY, GT_COMMON_KEY, PLL_KEY, TYPE
 from chipscopy.api.ibert.gt import GT
 from chipscopy.api.ibert.gt_common import GTCOMMON
+from chipscopy.api.ibert.layout import setup_gt_groups
 from chipscopy.api.ibert.pll import PLL
 from chipscopy.api.ibert.serial_object_base import SerialObjectBase
 from typing_extensions import final
@@ -78,13 +79,14 @@ class GTGroup(SerialObjectBase["IBERT", Union[GT, PLL]]):
         if self.setup_done:
             return
 
-        self.core_tcf_node.setup_gt_group(self.name)
-        obj_info = self._get_obj_info_with_props()
-        self._update_all_props(obj_info)
-        self._build_aliases(obj_info)
+        # Sets up the GTs and PLLs too, with pipelined requests
+        setup_gt_groups([self])
+
+    def _setup_from_obj_info(self, obj_info: Dict[str, Any]) -> List[Union[GT, GTCOMMON, PLL]]:
+        SerialObjectBase._setup_from_obj_info(self, obj_info)
 
         if not obj_info.get(CHILDREN):
-            return
+            return []
 
         for child_info in obj_info[CHILDREN].values():
             obj: Union[GT, PLL]
@@ -97,11 +99,6 @@ class GTGroup(SerialObjectBase["IBERT", Union[GT, PLL]]):
             else:
                 continue
 
-            obj.setup()
             self._children.append(obj)
 
-        self.setup_done = True
-
-        # Call this only after setup is complete.
-        for gt in self.gts:
-            gt.update_pll()
+        return list(self._children)
@@ -16,13 +16,14 @@
 from __future__ import annotations
 
 from rich.tree import Tree
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from chipscopy.api import CoreType
 from chipscopy.api._detail.debug_core import DebugCore
 from chipscopy.api.containers import QueryList
 from chipscopy.api.ibert.aliases import GT_GROUP_KEY, HANDLE_NAME, IBERT_KEY, DISPLAY_NAME
 from chipscopy.api.ibert.gt_group import GTGroup
+from chipscopy.api.ibert.layout import get_layout_cache, get_obj_infos, setup_gt_groups
 from chipscopy.api.report import report_hierarchy
 from chipscopy.utils import deprecated_api
 from typing_extensions import Final, final
@@ -37,12 +38,22 @@ class IBERT(DebugCore["IBERTCoreClient"]):
     Main API class to use IBERT (Integrated Bit Error Ratio Tester) debug core.
     """
 
-    def __init__(self, ibert_tcf_node):
+    def __init__(self, ibert_tcf_node, device=None):
         super(IBERT, self).__init__(CoreType.IBERT, ibert_tcf_node)
+        self._device = device
         _, core_info = self.core_tcf_node.initialize_architecture().popitem()
 
         self._gt_groups_discovery_complete: bool = False
 
+        self.use_layout_cache: bool = True
+        """
+        Keep the object info of this IBERT core by core UUID, and build the serial object tree
+        of other IBERT wrappers with the same UUID from it. Set this before the GT Groups are used.
+        See also :py:func:`~chipscopy.api.ibert.layout.set_layout_cache` for an on-disk cache.
+        """
+
+        self._server_version: Optional[str] = None
+
         self.type: Final[str] = IBERT_KEY
         """Serial object type"""
 
@@ -93,12 +104,33 @@ class IBERT(DebugCore["IBERTCoreClient"]):
         if isinstance(gt_group_handles, str):
             gt_group_handles = [gt_group_handles]
 
+        # GT Group info from the cache is the info after GT Group setup. It has more in it, which
+        # GTGroup ignores. Info before GT Group setup is not added to the cache.
+        obj_infos = get_obj_infos(
+            self.core_tcf_node, gt_group_handles, cache=get_layout_cache(self), update_cache=False
+        )
         for handle in gt_group_handles:
-            obj_info = self.core_tcf_node.get_obj_info(handle, include_property="client_visible")
-            self.children.append(GTGroup(obj_info, self, self.core_tcf_node))
+            self.children.append(GTGroup(obj_infos[handle], self, self.core_tcf_node))
 
         self._gt_groups_discovery_complete = True
 
+    def setup_gt_groups(self, *, include_uninstantiated: bool = False):
+        """
+        Discover the GT Groups and set up all of them, including their GTs, PLLs, RXs and TXs.
+
+        The objects of each level of the hierarchy are set up with pipelined requests,
+        which is much faster than setting up the GT Groups one by one on large devices.
+
+        Args:
+            include_uninstantiated (bool): If you wish to include un-instantiated GT Groups in the discovery process,
+                set this to 'True'.
+
+        Returns:
+            None
+        """
+        self.discover_gt_groups(include_uninstantiated=include_uninstantiated)
+        setup_gt_groups(self.children.filter_by(type=GT_GROUP_KEY))
+
     def reset(self):
         """
         Reset all RXs, TXs and PLLs in the GT Groups
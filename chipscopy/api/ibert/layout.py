@@ -0,0 +1,220 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bulk setup of the serial object tree of an IBERT core.
+
+The tree is built one level at a time - GT Groups, then GTs and PLLs, then RXs, TXs and PLLs of
+the GTs. The ``get_obj_info`` commands for all objects of a level go out together, so setting up
+an IBERT core costs a few round trips instead of one per object.
+
+The object info is static for an IBERT IP configuration, so it is also kept per IBERT core UUID.
+Another IBERT wrapper with the same UUID, e.g. after a device rescan, builds its tree from it.
+With :py:func:`set_layout_cache`, it is also saved on disk for later sessions, see
+:py:class:`~chipscopy.api.ibert.layout_cache.IBERTLayoutCache`.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
+
+from chipscopy.api.ibert.aliases import GT_KEY, PLL_SOURCE
+from chipscopy.api.ibert.layout_cache import IBERTLayoutCache
+from chipscopy.api.ibert.serial_object_base import BulkPropertyCommands, SerialObjectBase
+from chipscopy.utils.logger import log
+from chipscopy.utils.version import get_server_version_info
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.ibert.gt_group import GTGroup  # noqa
+    from chipscopy.api.ibert.ibert import IBERT  # noqa
+    from chipscopy.client.ibert_core_client import IBERTCoreClient  # noqa
+
+# Object info with client visible properties (handle -> info), by IBERT core UUID.
+# This is the info after setup_gt_group, so it has the children of the GT Groups.
+_OBJ_INFO_BY_UUID: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+# UUIDs with object info loaded from disk, which is not checked against cs_server yet
+_UNVALIDATED_UUIDS: Set[str] = set()
+
+_persistent_cache: Optional[IBERTLayoutCache] = None
+
+
+def set_layout_cache(cache: Union[bool, str, Path, IBERTLayoutCache, None]):
+    """
+    Save the IBERT object layout on disk, and reuse it in later sessions.
+
+    Args:
+        cache: True, a cache directory path, or an IBERTLayoutCache. False or None turns the
+            on-disk cache off. Default is no on-disk cache.
+
+    """
+    global _persistent_cache
+    if cache is True:
+        cache = IBERTLayoutCache()
+    elif isinstance(cache, (str, Path)):
+        cache = IBERTLayoutCache(cache)
+    elif not cache:
+        cache = None
+    _persistent_cache = cache
+
+
+def clear_layout_cache():
+    """Forget the object info kept for all IBERT cores. Files of the on-disk cache are kept."""
+    _OBJ_INFO_BY_UUID.clear()
+    _UNVALIDATED_UUIDS.clear()
+
+
+def _core_uuid(ibert: IBERT) -> Optional[str]:
+    return ibert.core_info.uuid if ibert.core_info else None
+
+
+def _server_version(ibert: IBERT) -> Optional[str]:
+    # "<version>.<build number>" of the cs_server, from the version info of the session
+    if ibert._server_version is None:
+        cs_server = ibert._device.cs_server if ibert._device is not None else None
+        try:
+            if cs_server is None:
+                raise RuntimeError("IBERT core is not attached to a cs_server")
+            version_info = get_server_version_info(cs_server, "cs_server")
+            ibert._server_version = f"{version_info.version}.{version_info.build}"
+        except Exception as ex:
+            log.client.warning(f"ibert_layout_cache: could not read cs_server version: {ex}")
+            ibert._server_version = ""
+    return ibert._server_version or None
+
+
+def get_layout_cache(ibert: IBERT) -> Optional[Dict[str, Dict[str, Any]]]:
+    uuid = _core_uuid(ibert)
+    if not uuid or not ibert.use_layout_cache:
+        return None
+
+    cache = _OBJ_INFO_BY_UUID.get(uuid)
+    if cache is None:
+        cache = _OBJ_INFO_BY_UUID[uuid] = dict()
+        server_version = _server_version(ibert) if _persistent_cache else None
+        if server_version:
+            obj_infos = _persistent_cache.load(uuid, server_version)
+            if obj_infos:
+                log.client.info(f"ibert_layout_cache: using cached layout of {ibert.name}")
+                cache.update(obj_infos)
+                _UNVALIDATED_UUIDS.add(uuid)
+    return cache
+
+
+def _validate_layout_cache(
+    ibert: IBERT, cache: Dict[str, Dict[str, Any]], gt_groups: List[GTGroup]
+):
+    # Compare the GT Group info from disk with the info from cs_server, which is fetched anyway.
+    # The same core UUID with another IBERT configuration shows up as a difference in there.
+    uuid = _core_uuid(ibert)
+    handles = [gt_group.handle for gt_group in gt_groups]
+    obj_infos = get_obj_infos(ibert.core_tcf_node, handles)
+    if any(cache.get(handle) != obj_infos[handle] for handle in handles):
+        log.client.info(f"ibert_layout_cache: cached layout of {ibert.name} does not match")
+        cache.clear()
+        server_version = _server_version(ibert)
+        if _persistent_cache and server_version:
+            _persistent_cache.remove(uuid, server_version)
+    cache.update(obj_infos)
+    _UNVALIDATED_UUIDS.discard(uuid)
+
+
+def get_obj_infos(
+    core_tcf_node: IBERTCoreClient,
+    handles: List[str],
+    *,
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    update_cache: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Get the info with client visible properties for many objects, in one pipelined request.
+
+    Args:
+        core_tcf_node: IBERT core client
+        handles: Object handles
+        cache: **(Optional)** Object info by handle. Only the missing handles are fetched.
+        update_cache: Add the fetched object info to the cache
+
+    Returns:
+        Object handle -> object info
+
+    """
+    if cache is None:
+        cache = dict()
+        update_cache = False
+
+    missing = [handle for handle in handles if handle not in cache]
+    fetched = dict()
+    if missing:
+        fetched = core_tcf_node.get_obj_info_multi(missing, include_property="client_visible")
+        if update_cache:
+            cache.update(fetched)
+
+    return {handle: fetched[handle] if handle in fetched else cache[handle] for handle in handles}
+
+
+def setup_gt_groups(gt_groups: List[GTGroup]):
+    """
+    Set up GT Groups and all objects below them, with a few pipelined requests per IBERT core.
+
+    Args:
+        gt_groups: GT Groups to set up. GT Groups that are set up already are skipped.
+
+    """
+    # IBERT core ctx -> GT Groups to set up
+    groups_by_core: Dict[str, List[GTGroup]] = defaultdict(list)
+    for gt_group in gt_groups:
+        if not gt_group.setup_done:
+            groups_by_core[gt_group.core_tcf_node.ctx].append(gt_group)
+
+    for groups in groups_by_core.values():
+        _setup_gt_groups(groups[0].parent, groups)
+
+
+def _setup_gt_groups(ibert: IBERT, gt_groups: List[GTGroup]):
+    core_tcf_node = ibert.core_tcf_node
+    cache = get_layout_cache(ibert)
+
+    core_tcf_node.setup_gt_group_multi([gt_group.name for gt_group in gt_groups])
+
+    if cache is not None and _core_uuid(ibert) in _UNVALIDATED_UUIDS:
+        _validate_layout_cache(ibert, cache, gt_groups)
+    cached_count = len(cache) if cache is not None else 0
+
+    all_objs: List[SerialObjectBase] = list()
+    level: List[SerialObjectBase] = list(gt_groups)
+    while level:
+        obj_infos = get_obj_infos(core_tcf_node, [obj.handle for obj in level], cache=cache)
+        all_objs.extend(level)
+        next_level = list()
+        for obj in level:
+            next_level.extend(obj._setup_from_obj_info(obj_infos[obj.handle]))
+        level = next_level
+
+    if cache is not None and len(cache) > cached_count and _persistent_cache:
+        server_version = _server_version(ibert)
+        if server_version:
+            _persistent_cache.save(_core_uuid(ibert), server_version, cache)
+
+    # Children first, a parent is done when all of its children are done
+    for obj in reversed(all_objs):
+        obj._finish_setup()
+
+    # One refresh for the PLL source of all GTs, instead of one per GT
+    gts = [obj for obj in all_objs if obj.type == GT_KEY and PLL_SOURCE in obj.property_for_alias]
+    if gts:
+        for gt, values in BulkPropertyCommands(gts).refresh(PLL_SOURCE).items():
+            gt._set_pll(values[PLL_SOURCE])
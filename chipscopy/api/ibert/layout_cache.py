@@ -0,0 +1,94 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of the IBERT serial object layout.
+
+The object info of the GT Groups, GTs, PLLs, RXs and TXs - client visible property names and
+alias tables - only depends on the IBERT IP configuration and the cs_server version. The layout
+cache saves it keyed by IBERT core UUID and cs_server version, so a later session against the same
+design builds the serial object tree without get_obj_info calls. The first GT Group setup of a
+session fetches the GT Group info anyway and compares it with the cached info. If anything does
+not match, the cache entry is dropped and the layout is read from cs_server.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from chipscopy.utils.json_file_cache import JsonFileCache
+
+IBERT_LAYOUT_CACHE_VERSION = 1
+
+DEFAULT_IBERT_LAYOUT_CACHE_DIR = Path.home() / ".chipscopy" / "ibert_layout_cache"
+
+
+class IBERTLayoutCache(JsonFileCache):
+    """Saves and loads IBERT object info, keyed by IBERT core UUID and cs_server version.
+
+    ::
+
+        from chipscopy.api.ibert import set_layout_cache
+        set_layout_cache(True)
+
+    Args:
+        cache_dir: Directory for cache files. Default is ``~/.chipscopy/ibert_layout_cache``,
+            or the ``CHIPSCOPY_IBERT_LAYOUT_CACHE_DIR`` environment variable if set.
+    """
+
+    log_name = "ibert_layout_cache"
+
+    def __init__(self, cache_dir: Union[str, Path] = None):
+        if cache_dir is None:
+            cache_dir = os.getenv(
+                "CHIPSCOPY_IBERT_LAYOUT_CACHE_DIR", DEFAULT_IBERT_LAYOUT_CACHE_DIR
+            )
+        super().__init__(cache_dir)
+
+    def get_path(self, uuid: str, server_version: str) -> Path:
+        return self._file_path(uuid, server_version)
+
+    def save(self, uuid: str, server_version: str, obj_infos: Dict[str, Dict[str, Any]]):
+        """Save object info by handle. Errors writing the file are logged and ignored."""
+        data = {
+            "version": IBERT_LAYOUT_CACHE_VERSION,
+            "uuid": uuid,
+            "server_version": server_version,
+            "timestamp": time.time(),
+            "obj_info": obj_infos,
+        }
+        self._write_file(self.get_path(uuid, server_version), data)
+
+    def load(self, uuid: str, server_version: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load object info by handle, or None if there is no usable cache entry."""
+        path = self.get_path(uuid, server_version)
+        data = self._read_file(path)
+        if data is None:
+            return None
+        try:
+            if (
+                data.get("version") != IBERT_LAYOUT_CACHE_VERSION
+                or data.get("uuid") != uuid
+                or data.get("server_version") != server_version
+            ):
+                return None
+            return data["obj_info"]
+        except (AttributeError, KeyError) as ex:
+            self._report_unreadable(path, ex)
+            return None
+
+    def remove(self, uuid: str, server_version: str):
+        """Delete the cache file for the core UUID and cs_server version, if there is one."""
+        self._remove_file(self.get_path(uuid, server_version))
@@ -0,0 +1,193 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Link detection engine.
+
+Every TX gets a code ``index + 1``. In round ``b`` the TXs with bit ``b`` of their code set send
+PRBS 15 and all other TXs send PRBS 7, while all RXs check for PRBS 7. An RX that shows
+``No link`` in round ``b`` is driven by a TX with bit ``b`` set, so after ``log2(#TX)`` rounds
+every RX knows the code of its TX. An RX driven by none of the TXs stays linked in every round and
+ends up with code 0.
+
+Each round is one set and commit request and one refresh request per IBERT core, each covering all
+endpoints of the core, see :py:class:`BulkPropertyCommands`. The decoded pairs are verified with
+the complement codes: in verification round ``b`` the TXs with bit ``b`` of their code *clear* send
+PRBS 15, so every RX must lose the link in exactly the rounds it kept it before. An RX whose status
+changed for another reason, or that is stuck at ``No link``, fails verification and falls back to
+the serial search.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from chipscopy.api.ibert.aliases import PATTERN, RX_STATUS
+from chipscopy.api.ibert.serial_object_base import BulkPropertyCommands
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.ibert.rx import RX
+    from chipscopy.api.ibert.tx import TX
+
+CHECK_PATTERN = "PRBS 7"
+FLIP_PATTERN = "PRBS 15"
+NO_LINK = "No link"
+
+# Called with (info, percent_complete)
+DetectionProgressCallback = Callable[[str, float], None]
+
+
+def _set_patterns(values: Dict[object, str]):
+    BulkPropertyCommands(values).set_each(
+        {obj: {PATTERN: value} for obj, value in values.items()}, commit=True
+    )
+
+
+def _refresh(objs: List, alias: str) -> Dict[object, object]:
+    return {obj: values[alias] for obj, values in BulkPropertyCommands(objs).refresh(alias).items()}
+
+
+class LinkDetector:
+    """
+    Finds the TX driving each RX, by changing TX patterns and checking the RX status.
+
+    Args:
+        rxs: RXs to find a TX for
+        txs: Candidate TXs
+        progress: **(Optional)** Called with status info and percent complete
+
+    """
+
+    def __init__(
+        self,
+        rxs: List[RX],
+        txs: List[TX],
+        progress: Optional[DetectionProgressCallback] = None,
+    ):
+        self.rxs = list(rxs)
+        self.txs = list(txs)
+        self.progress = progress
+        self._tx_patterns: Dict[TX, str] = dict()
+
+    def _report(self, info: str, percent_complete: float):
+        if self.progress:
+            self.progress(info, round(percent_complete, 2))
+
+    def _set_tx_patterns(self, patterns: Dict[TX, str]):
+        # Only send the patterns that change
+        changed = {tx: value for tx, value in patterns.items() if self._tx_patterns[tx] != value}
+        if changed:
+            _set_patterns(changed)
+            self._tx_patterns.update(changed)
+
+    def _set_tx_code_bit_patterns(self, bit: int, flip_when_set: bool):
+        # TX codes are index + 1, code 0 is "not driven by any TX"
+        self._set_tx_patterns(
+            {
+                tx: FLIP_PATTERN if bool((index + 1) >> bit & 1) == flip_when_set else CHECK_PATTERN
+                for index, tx in enumerate(self.txs)
+            }
+        )
+
+    def _unlinked(self, rxs: List[RX]) -> List[RX]:
+        if not rxs:
+            return []
+        status = _refresh(rxs, RX_STATUS)
+        return [rx for rx in rxs if status[rx] == NO_LINK]
+
+    def detect(self) -> List[Tuple[RX, TX]]:
+        """
+        Returns:
+            List of (RX, TX) pairs found, in the order of the RXs
+
+        """
+        if not self.rxs or not self.txs:
+            return []
+
+        self._report("Starting link detection...", 0.0)
+        original_patterns = _refresh(self.rxs + self.txs, PATTERN)
+        try:
+            _set_patterns({obj: CHECK_PATTERN for obj in self.rxs + self.txs})
+            self._tx_patterns = {tx: CHECK_PATTERN for tx in self.txs}
+            return self._detect()
+        finally:
+            _set_patterns(original_patterns)
+
+    def _detect(self) -> List[Tuple[RX, TX]]:
+        unlinked = set(self._unlinked(self.rxs))
+        candidates = [rx for rx in self.rxs if rx not in unlinked]
+        if not candidates:
+            return []
+
+        # Code of the TX driving each RX
+        codes = {rx: 0 for rx in candidates}
+        rounds = len(self.txs).bit_length()
+        for bit in range(rounds):
+            self._report("Running link detection...", bit * 50.0 / rounds)
+            self._set_tx_code_bit_patterns(bit, flip_when_set=True)
+            for rx in self._unlinked(candidates):
+                codes[rx] |= 1 << bit
+
+        pairs: Dict[RX, TX] = dict()
+        claimed = set()
+        unresolved = list()
+        for rx in candidates:
+            code = codes[rx]
+            if code == 0:
+                continue
+            tx = self.txs[code - 1] if code <= len(self.txs) else None
+            if tx is None or tx in claimed:
+                unresolved.append(rx)
+            else:
+                pairs[rx] = tx
+                claimed.add(tx)
+
+        # Verify - repeat the rounds with the complement codes. Each RX must lose the link in the
+        # rounds where the code bit of its TX is clear, and keep it where the bit is set.
+        failed = set()
+        for bit in range(rounds):
+            self._report("Verifying links...", 50.0 + bit * 45.0 / rounds)
+            self._set_tx_code_bit_patterns(bit, flip_when_set=False)
+            unlinked = set(self._unlinked([rx for rx in pairs if rx not in failed]))
+            for rx in pairs:
+                if rx not in failed and (rx in unlinked) == bool(codes[rx] >> bit & 1):
+                    failed.add(rx)
+        for rx in [rx for rx in pairs if rx in failed]:
+            del pairs[rx]
+            unresolved.append(rx)
+
+        if unresolved:
+            self._report("Resolving links serially...", 95.0)
+            pairs.update(self._serial_detect(unresolved, set(pairs.values())))
+
+        self._report("Link detection done", 100.0)
+        return [(rx, pairs[rx]) for rx in self.rxs if rx in pairs]
+
+    def _serial_detect(self, rxs: List[RX], claimed: set) -> Dict[RX, TX]:
+        pairs = dict()
+        self._set_tx_patterns({tx: CHECK_PATTERN for tx in self.txs})
+        for rx in rxs:
+            if self._unlinked([rx]):
+                continue
+            for tx in self.txs:
+                if tx in claimed:
+                    continue
+                self._set_tx_patterns({tx: FLIP_PATTERN})
+                lost_link = bool(self._unlinked([rx]))
+                self._set_tx_patterns({tx: CHECK_PATTERN})
+                if lost_link:
+                    pairs[rx] = tx
+                    claimed.add(tx)
+                    break
+        return pairs
@@ -14,13 +14,16 @@
 # limitations under the License.
 
 from __future__ import annotations
-from typing import ClassVar, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, List, Optional, Union, TYPE_CHECKING
 from dataclasses import dataclass
 
 from chipscopy.api.containers import QueryList
 from chipscopy.api.ibert.link import RX, TX, Link, LinkGroup
+from chipscopy.api.ibert.link.detection import LinkDetector
+from chipscopy.api.ibert.link.monitor import LinkMonitor
+from chipscopy.api.ibert.serial_object_base import BulkPropertyCommands
+from chipscopy.api.ibert.aliases import RX_BER, RX_PATTERN_CHECKER_ERROR_COUNT, RX_STATUS
 from chipscopy.dm import request
-from chipscopy.api.ibert.aliases import PATTERN, RX_STATUS
 
 if TYPE_CHECKING:
     from chipscopy.api.session import Session
@@ -140,6 +143,58 @@ class LinkManager:
         if len(LinkManager.links) == 0:
             LinkManager.last_link_number = -1
 
+    @staticmethod
+    def refresh_links(
+        links: Optional[UnionLinkListLink] = None,
+        property_names: Union[str, List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Refresh RX properties of many links at once, with one request per IBERT core.
+
+        Args:
+            links: **(Optional)** Links to refresh. Default is all links.
+            property_names: **(Optional)** RX property names or aliases.
+                Default is status, BER and error count.
+
+        Returns:
+            Dictionary with link name and (property name -> refreshed value) dict as key, value
+            pairs.
+            Links without RX are left out.
+
+        """
+        if links is None:
+            links = LinkManager.links.values()
+        elif isinstance(links, Link):
+            links = [links]
+        if property_names is None:
+            property_names = [RX_STATUS, RX_BER, RX_PATTERN_CHECKER_ERROR_COUNT]
+
+        links_with_rx = [link for link in links if link.rx is not None]
+        values = BulkPropertyCommands([link.rx for link in links_with_rx]).refresh(property_names)
+        return {link.name: values[link.rx] for link in links_with_rx}
+
+    @staticmethod
+    def monitor_links(links: Optional[UnionLinkListLink] = None, **kwargs) -> LinkMonitor:
+        """
+        Start a :py:class:`~chipscopy.api.ibert.link.monitor.LinkMonitor` for many links. The
+        monitor gets status, BER and error count updates from cs_server, no polling needed.
+
+        Args:
+            links: **(Optional)** Links to monitor. Default is all links.
+            **kwargs: Arguments for :py:class:`~chipscopy.api.ibert.link.monitor.LinkMonitor`
+
+        Returns:
+            The running monitor. Call ``stop()`` on it when done.
+
+        """
+        if links is None:
+            links = LinkManager.links.values()
+        elif isinstance(links, Link):
+            links = [links]
+        monitor = LinkMonitor(links, **kwargs)
+        monitor.start()
+        return monitor
+
     def detect_links(
         target: [list[Session | Device | IBERT | GTGroup | GT]] = None,
         done: request.DoneFutureCallback = None,
@@ -269,113 +324,45 @@ class LinkManager:
             txs: [Union[TX, List[TX]]] = None, rxs: [Union[RX, List[RX]]] = None
         ) -> bool or QueryList[Link]:
             nonlocal detect_future
-            tx_pattern_map = dict()
-            rx_pattern_map = dict()
             percent_complete = 0.0
 
-            error = None
-
-            if detect_future:
-                detect_future.set_progress(
-                    progress_status=LinkDetectionProgress(
-                        info="Starting link detection...", progress=percent_complete, new_link=None
-                    )
-                )
-
-            for rx in rxs:
-                # create a dict with tx_handle and original pattern
-                rx_pattern_map.update(
-                    {
-                        rx.handle: list(
-                            rx.property.refresh(rx.property_for_alias[PATTERN]).values()
-                        )[0]
-                    }
-                )
-
-                # set pattern values to "first pattern" = PRBS7 for all rx in list
-                props = {rx.property_for_alias[PATTERN]: "PRBS 7"}
-                rx.property.set(**props)
-                rx.property.commit(list(props.keys()))
-
-            for tx in txs:
-                # create a dict with tx_handle and original pattern
-                tx_pattern_map.update(
-                    {
-                        tx.handle: list(
-                            tx.property.refresh(tx.property_for_alias[PATTERN]).values()
-                        )[0]
-                    }
-                )
-
-                # set pattern values to "first pattern" = PRBS7 for all tx in list
-                props = {tx.property_for_alias[PATTERN]: "PRBS 7"}
-                tx.property.set(**props)
-                tx.property.commit(list(props.keys()))
-
-            total_rx = len(rxs)
-            txs_to_skip = set()
-            rxs_processed = set()
-
-            for rx in filter(lambda rx: rx.handle not in rxs_processed, rxs):
-                percent_complete = "{:.2f}".format((len(rxs_processed) / total_rx) * 100)
+            def detection_progress(info: str, percent: float):
+                nonlocal percent_complete
+                percent_complete = percent
                 if detect_future:
                     detect_future.set_progress(
                         progress_status=LinkDetectionProgress(
-                            info="Running link detection...",
-                            progress=percent_complete,
-                            new_link=None,
+                            info=info, progress=percent, new_link=None
                         )
                     )
 
-                _, status = rx.property.refresh(rx.property_for_alias[RX_STATUS]).popitem()
-                if status != "No link":
-                    for tx in filter(lambda tx: tx.handle not in txs_to_skip, txs):
-                        props = {tx.property_for_alias[PATTERN]: "PRBS 15"}
-                        tx.property.set(**props)
-                        tx.property.commit(list(props.keys()))
-
-                        _, status = rx.property.refresh(rx.property_for_alias[RX_STATUS]).popitem()
-                        if status == "No link":
-                            # link found
-                            txs_to_skip.add(tx.handle)
-                            LinkManager.last_link_number += 1
-                            link_name = (
-                                f"{LinkManager.link_name_prefix}{LinkManager.last_link_number}"
-                            )
-
-                            try:
-                                new_link = Link(rx, tx, link_name)
-                                new_links.append(new_link)
-                                LinkManager.links.update({link.name: link for link in new_links})
-                                if detect_future:
-                                    detect_future.set_progress(
-                                        progress_status=LinkDetectionProgress(
-                                            info="Found new link!",
-                                            progress=percent_complete,
-                                            new_link=new_link,
-                                        )
-                                    )
-                            except Exception as e:
-                                # IF creation fails, decrement by 1 since we didn't create a link
-                                LinkManager.last_link_number -= 1
-                                error = e
-                            break
-
-                rxs_processed.add(rx.handle)
-                if error:
+            error = None
+            try:
+                pairs = LinkDetector(rxs, txs, progress=detection_progress).detect()
+            except Exception as e:
+                pairs = []
+                error = e
+
+            for rx, tx in pairs:
+                LinkManager.last_link_number += 1
+                link_name = f"{LinkManager.link_name_prefix}{LinkManager.last_link_number}"
+
+                try:
+                    new_link = Link(rx, tx, link_name)
+                except Exception as e:
+                    # IF creation fails, decrement by 1 since we didn't create a link
+                    LinkManager.last_link_number -= 1
+                    error = e
                     break
 
-            # reset rx pattern for to original value for all Rxs
-            for rx in rxs:
-                props = {rx.property_for_alias[PATTERN]: rx_pattern_map[rx.handle]}
-                rx.property.set(**props)
-                rx.property.commit(list(props.keys()))
-
-            # reset tx pattern for to original value for all Txs
-            for tx in txs:
-                props = {tx.property_for_alias[PATTERN]: tx_pattern_map[tx.handle]}
-                tx.property.set(**props)
-                tx.property.commit(list(props.keys()))
+                new_links.append(new_link)
+                LinkManager.links[new_link.name] = new_link
+                if detect_future:
+                    detect_future.set_progress(
+                        progress_status=LinkDetectionProgress(
+                            info="Found new link!", progress=percent_complete, new_link=new_link
+                        )
+                    )
 
             if error:
                 if detect_future:
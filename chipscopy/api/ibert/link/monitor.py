@@ -0,0 +1,468 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+BER monitoring of many links, for long running soak tests.
+
+The status, BER, error count and bit count of every RX go on the cs_server watchlist, with one
+pipelined request per IBERT core. cs_server pushes property update events with the changed
+properties only, so nothing is polled. Each update becomes one row in the time series of the link,
+if any value changed, and the statistics of the link and of all links are updated as the rows come
+in - reading them costs nothing, no matter how long the monitor has been running.
+
+::
+
+    with LinkMonitor(get_all_links()) as monitor:
+        time.sleep(24 * 3600)
+        stats = monitor.get_stats()
+        print(stats.errors, stats.ber, stats.worst_link)
+
+    ber = monitor["Link_0"].ber()
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from chipscopy.api.ibert.aliases import (
+    RX_BER,
+    RX_PATTERN_CHECKER_ERROR_COUNT,
+    RX_RECEIVED_BIT_COUNT,
+    RX_STATUS,
+)
+from chipscopy.api.ibert.serial_object_base import BulkPropertyCommands
+from chipscopy.utils.coalesced_callback import CoalescedCallback
+from chipscopy.utils.printer import printer
+from chipscopy.utils.ring_buffer import RingBuffer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.ibert.link import Link
+    from chipscopy.dm import Node
+
+DEFAULT_LINK_MONITOR_DEPTH = 86400
+"""
+Default number of samples kept per link. A sample takes 32 bytes, so a full series is about
+2.8 MB per link. Storage grows with the samples - a row is only added when a value changed - so
+a monitor over hundreds of links starts at about 9 KB per link.
+"""
+
+DEFAULT_LINK_MONITOR_STATUS_DEPTH = 1000
+"""Default number of status changes kept per link"""
+
+_MONITORED_ALIASES = (RX_STATUS, RX_BER, RX_PATTERN_CHECKER_ERROR_COUNT, RX_RECEIVED_BIT_COUNT)
+
+
+def _to_count(value: Any) -> Optional[int]:
+    # Counters are hex strings from cs_server
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value, 16)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_ber(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+@dataclass
+class LinkStats:
+    """Statistics of one link, since the monitor was started"""
+
+    name: str
+    status: Optional[str] = None
+    """Last status"""
+
+    ber: float = math.nan
+    """Last BER reported by the RX"""
+
+    min_ber: float = math.nan
+    max_ber: float = math.nan
+
+    errors: int = 0
+    """Errors counted by the monitor. Counter resets are handled."""
+
+    bits: int = 0
+    """Bits counted by the monitor. Counter resets are handled."""
+
+    error_events: int = 0
+    """Number of updates in which the error count went up"""
+
+    last_error_time: Optional[float] = None
+    """Time of the last update in which the error count went up, in seconds since the epoch"""
+
+    status_changes: int = 0
+
+    @property
+    def measured_ber(self) -> float:
+        """Errors / bits counted by the monitor"""
+        return self.errors / self.bits if self.bits else math.nan
+
+
+@dataclass
+class MonitorStats:
+    """Statistics of all links of a :py:class:`LinkMonitor`, since it was started"""
+
+    time: float
+    """Time of the last update, in seconds since the epoch"""
+
+    link_count: int
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    """Number of links by status"""
+
+    errors: int = 0
+    bits: int = 0
+    links_with_errors: int = 0
+    worst_link: Optional[str] = None
+    """Name of the link with the highest measured BER"""
+
+    worst_ber: float = math.nan
+
+    @property
+    def ber(self) -> float:
+        """Errors / bits of all links"""
+        return self.errors / self.bits if self.bits else math.nan
+
+
+class LinkSeries:
+    """
+    Time series of one link. Rows are stored in typed arrays, and a row is only added when a
+    value changed. Status changes are kept separately.
+    """
+
+    def __init__(self, link: Link, depth: int, status_depth: int):
+        self.link = link
+        self.name = link.name
+        rx = link.rx
+        self._props: Tuple[str, ...] = tuple(
+            rx.property_for_alias[alias] for alias in _MONITORED_ALIASES
+        )
+        self.buffer = RingBuffer(depth, {"time": "d", "ber": "d", "errors": "Q", "bits": "Q"})
+        self.status_buffer = RingBuffer(status_depth, {"time": "d", "status": None})
+        self._stats = LinkStats(link.name)
+        self._last_values: Optional[Tuple[float, int, int]] = None
+        self._last_counters: Optional[Tuple[int, int]] = None
+
+    def __repr__(self) -> str:
+        return f"LinkSeries({self.name}, samples={len(self.buffer)})"
+
+    @property
+    def stats(self) -> LinkStats:
+        """Copy of the statistics of this link"""
+        return replace(self._stats)
+
+    def times(self, last: Optional[int] = None) -> array:
+        """Sample times, in seconds since the epoch"""
+        return self.buffer.get_column("time", last)
+
+    def ber(self, last: Optional[int] = None) -> array:
+        """BER reported by the RX"""
+        return self.buffer.get_column("ber", last)
+
+    def errors(self, last: Optional[int] = None) -> array:
+        """Raw error counter values"""
+        return self.buffer.get_column("errors", last)
+
+    def bits(self, last: Optional[int] = None) -> array:
+        """Raw received bit counter values"""
+        return self.buffer.get_column("bits", last)
+
+    def status_history(self) -> List[Tuple[float, str]]:
+        """(time, new status) of the status changes"""
+        return list(self.status_buffer)
+
+    def _update(self, values: Dict[str, Any], timestamp: float) -> Tuple[int, int, Optional[str]]:
+        # Returns (new errors, new bits, previous status or None if status didn't change).
+        # Caller holds the monitor lock.
+        status_prop, ber_prop, errors_prop, bits_prop = self._props
+        stats = self._stats
+
+        previous_status = None
+        status = values.get(status_prop, stats.status)
+        if status is not None and status != stats.status:
+            previous_status = stats.status if stats.status is not None else ""
+            stats.status = status
+            if previous_status:
+                stats.status_changes += 1
+            self.status_buffer.append(timestamp, status)
+
+        ber = _to_ber(values[ber_prop]) if ber_prop in values else stats.ber
+        stats.ber = ber
+        if not math.isnan(ber):
+            stats.min_ber = ber if math.isnan(stats.min_ber) else min(stats.min_ber, ber)
+            stats.max_ber = ber if math.isnan(stats.max_ber) else max(stats.max_ber, ber)
+
+        errors = _to_count(values.get(errors_prop))
+        bits = _to_count(values.get(bits_prop))
+        if self._last_counters is not None:
+            errors = self._last_counters[0] if errors is None else errors
+            bits = self._last_counters[1] if bits is None else bits
+        if errors is None or bits is None:
+            return 0, 0, previous_status
+
+        new_errors = new_bits = 0
+        if self._last_counters is not None:
+            last_errors, last_bits = self._last_counters
+            # A counter that went down was reset, it counted from zero since the last update
+            new_errors = errors - last_errors if errors >= last_errors else errors
+            new_bits = bits - last_bits if bits >= last_bits else bits
+        self._last_counters = (errors, bits)
+
+        stats.errors += new_errors
+        stats.bits += new_bits
+        if new_errors:
+            stats.error_events += 1
+            stats.last_error_time = timestamp
+
+        row = (ber, errors, bits)
+        if row != self._last_values:
+            self._last_values = row
+            self.buffer.append(timestamp, ber, errors, bits)
+
+        return new_errors, new_bits, previous_status
+
+
+class LinkMonitor:
+    """
+    Monitors status, BER, error count and bit count of many links, from property update events
+    pushed by cs_server.
+
+    Args:
+        links: Links to monitor. Links without RX are skipped.
+        depth: Number of samples kept per link. Older samples are dropped. Each sample takes 32
+            bytes, and storage grows with the samples up to ``depth``.
+        status_depth: Number of status changes kept per link.
+        updates_callback: **(Optional)** Called with this monitor when new data came in. Runs on
+            a separate thread, one call at a time. Updates that arrive while a call is queued are
+            handled by that call.
+
+    """
+
+    def __init__(
+        self,
+        links: Iterable[Link],
+        *,
+        depth: int = DEFAULT_LINK_MONITOR_DEPTH,
+        status_depth: int = DEFAULT_LINK_MONITOR_STATUS_DEPTH,
+        updates_callback: Callable[[LinkMonitor], None] = None,
+    ):
+        self.series: Dict[str, LinkSeries] = dict()
+        """Time series by link name"""
+
+        skipped = list()
+        for link in links:
+            if link.rx is None or any(
+                alias not in link.rx.property_for_alias for alias in _MONITORED_ALIASES
+            ):
+                skipped.append(link.name)
+                continue
+            self.series[link.name] = LinkSeries(link, depth, status_depth)
+        if skipped:
+            names = "\n".join(skipped)
+            printer(
+                f"Link monitoring isn't supported for following link(s)\n{names}", level="warning"
+            )
+
+        self.updates_callback = updates_callback
+        self.start_time: Optional[float] = None
+        """Time the monitor was started, in seconds since the epoch"""
+
+        self._lock = threading.Lock()
+        self._running = False
+        # Endpoint node ctx -> property name -> series of links with that property
+        self._series_for_prop: Dict[str, Dict[str, List[LinkSeries]]] = dict()
+        self._nodes: List[Node] = list()
+        self._updates_call = CoalescedCallback(
+            lambda: self.updates_callback(self), "link monitor update"
+        )
+        self._reset_stats()
+
+    def __repr__(self) -> str:
+        return f"LinkMonitor(links={len(self.series)}, running={self._running})"
+
+    def __enter__(self) -> LinkMonitor:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    def __getitem__(self, link: Union[Link, str]) -> LinkSeries:
+        return self.series[link if isinstance(link, str) else link.name]
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def _reset_stats(self):
+        self._errors = 0
+        self._bits = 0
+        self._status_counts: Counter = Counter()
+        self._last_update = 0.0
+
+    def _bulk(self) -> BulkPropertyCommands:
+        return BulkPropertyCommands(series.link.rx for series in self.series.values())
+
+    def start(self):
+        """
+        Put the properties of all links on the cs_server watchlist, and read their current
+        values. Clears the data of a previous run.
+        """
+        if self._running:
+            return
+
+        for series in self.series.values():
+            series.buffer.clear()
+            series.status_buffer.clear()
+            series._stats = LinkStats(series.name)
+            series._last_values = series._last_counters = None
+        self._reset_stats()
+
+        self._series_for_prop.clear()
+        self._nodes.clear()
+        for series in self.series.values():
+            node = series.link.rx.property.endpoint_tcf_node
+            if node.ctx not in self._series_for_prop:
+                self._series_for_prop[node.ctx] = dict()
+                self._nodes.append(node)
+            for prop in series._props:
+                self._series_for_prop[node.ctx].setdefault(prop, list()).append(series)
+
+        self.start_time = time.time()
+        bulk = self._bulk()
+        bulk.add_to_watchlist(list(_MONITORED_ALIASES))
+        values = bulk.refresh(list(_MONITORED_ALIASES))
+
+        # Start values, from one refresh for all links. They are applied before the listeners
+        # are added, so a watchlist update can never be followed by an older start value - that
+        # would look like a counter reset and add the whole counter to the totals.
+        timestamp = time.time()
+        with self._lock:
+            for series in self.series.values():
+                rx_values = values[series.link.rx]
+                self._update(
+                    series,
+                    {
+                        prop: rx_values[alias]
+                        for prop, alias in zip(series._props, _MONITORED_ALIASES)
+                    },
+                    timestamp,
+                )
+
+        for node in self._nodes:
+            node.add_listener(self._on_props_updated)
+        self._running = True
+
+    def stop(self, *, remove_from_watchlist: bool = True):
+        """
+        Stop monitoring. The data and statistics are kept.
+
+        Args:
+            remove_from_watchlist: Remove the properties from the cs_server watchlist. Properties
+                that are also on the watchlist of the RX objects are left on it.
+
+        """
+        if not self._running:
+            return
+        self._running = False
+        for node in self._nodes:
+            node.remove_listener(self._on_props_updated)
+
+        if remove_from_watchlist:
+            self._bulk().remove_from_watchlist(list(_MONITORED_ALIASES), keep_watched=True)
+
+    def _update(self, series: LinkSeries, values: Dict[str, Any], timestamp: float):
+        # Caller holds the lock
+        new_errors, new_bits, previous_status = series._update(values, timestamp)
+        self._errors += new_errors
+        self._bits += new_bits
+        if previous_status is not None:
+            if previous_status:
+                self._status_counts[previous_status] -= 1
+            self._status_counts[series._stats.status] += 1
+        self._last_update = timestamp
+
+    def _on_props_updated(self, node: Node, updated_properties: Set[str]):
+        # NOTE - This is called on the TCF event dispatcher thread
+        series_for_prop = self._series_for_prop.get(node.ctx)
+        if not self._running or not series_for_prop:
+            return
+
+        updated_series = dict()
+        for prop in updated_properties:
+            for series in series_for_prop.get(prop, ()):
+                updated_series[series.name] = series
+        if not updated_series:
+            return
+
+        try:
+            timestamp = time.time()
+            with self._lock:
+                for series in updated_series.values():
+                    values = {
+                        prop: node.props[prop] for prop in series._props if prop in node.props
+                    }
+                    self._update(series, values, timestamp)
+        except Exception as e:
+            printer(
+                f"Unhandled link monitor update exception on TCF thread!\nException - {str(e)}",
+                level="warning",
+            )
+            return
+
+        if callable(self.updates_callback):
+            self._updates_call.request()
+
+    def get_stats(self) -> MonitorStats:
+        """
+        Statistics of all links. The totals are kept up to date as updates come in, so this only
+        looks for the worst link.
+        """
+        with self._lock:
+            stats = MonitorStats(
+                time=self._last_update,
+                link_count=len(self.series),
+                status_counts={status: n for status, n in self._status_counts.items() if n},
+                errors=self._errors,
+                bits=self._bits,
+            )
+            for series in self.series.values():
+                link_stats = series._stats
+                if link_stats.errors:
+                    stats.links_with_errors += 1
+                measured_ber = link_stats.measured_ber
+                if math.isnan(measured_ber):
+                    continue
+                if math.isnan(stats.worst_ber) or measured_ber > stats.worst_ber:
+                    stats.worst_ber = measured_ber
+                    stats.worst_link = series.name
+        return stats
+
+    def link_stats(self) -> Dict[str, LinkStats]:
+        """Copy of the statistics of every link, by link name"""
+        with self._lock:
+            return {name: series.stats for name, series in self.series.items()}
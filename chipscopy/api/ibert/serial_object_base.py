@@ -21,6 +21,7 @@ from typing import (
     Any,
     Dict,
     Generic,
+    Iterable,
     List,
     Set,
     Tuple,
@@ -43,11 +44,13 @@ from chipscopy.api.ibert.aliases import (
     PROPERTIES,
 )
 from chipscopy.client.ibert_core_client import IBERTCoreClient
+from chipscopy.dm.request import null_callback
 from typing_extensions import Final
 
 if TYPE_CHECKING:  # pragma: no cover
     from chipscopy.api.ibert import IBERT
     from chipscopy.api.ibert.gt_group import GTGroup
+    from chipscopy.api.ibert.link import Link
 
 
 class IBERTWatchlist(Watchlist["IBERTPropertyCommands"]):
@@ -235,6 +238,222 @@ class IBERTPropertyCommands(PropertyCommands["SerialObjectBase"]):
         return self.core_tcf_node.report_property(sanitized_data, self.endpoint_name)
 
 
+class BulkPropertyCommands:
+    """
+    Property commands for many serial objects at once, e.g. all RXs of a board.
+
+    Property names can be aliases or property names. Aliases are translated for every object,
+    and values are returned under the name that was passed in. Commands for the same endpoint are
+    merged, and the commands for all endpoints of all IBERT cores are pipelined, so the cost is
+    about one round trip instead of one per object.
+
+    ::
+
+        bulk = BulkPropertyCommands([link.rx for link in get_all_links()])
+        status = bulk.refresh([RX_STATUS, RX_BER])
+        for rx, values in status.items():
+            print(rx.name, values[RX_STATUS], values[RX_BER])
+
+    :meth:`for_rxs`, :meth:`for_txs` and :meth:`for_gt_groups` build the commands for the
+    endpoints of a list of links, e.g. ``BulkPropertyCommands.for_rxs(get_all_links())``.
+
+    Args:
+        objs: Serial objects, e.g. RXs, TXs, GTs or GT groups
+
+    """
+
+    def __init__(self, objs: Iterable[SerialObjectBase]):
+        self.objs: List[SerialObjectBase] = list(objs)
+
+    @classmethod
+    def for_rxs(cls, links: Iterable[Link]) -> BulkPropertyCommands:
+        """
+        Property commands for the RXs of links. Links without an RX are skipped.
+
+        Args:
+            links: Links, e.g. from ``get_all_links()``
+
+        """
+        return cls(link.rx for link in links if link.rx is not None)
+
+    @classmethod
+    def for_txs(cls, links: Iterable[Link]) -> BulkPropertyCommands:
+        """
+        Property commands for the TXs of links. Links without a TX are skipped.
+
+        Args:
+            links: Links, e.g. from ``get_all_links()``
+
+        """
+        return cls(link.tx for link in links if link.tx is not None)
+
+    @classmethod
+    def for_gt_groups(cls, links: Iterable[Link]) -> BulkPropertyCommands:
+        """
+        Property commands for the GT groups of the TXs and RXs of links. Each GT group is included
+        once, in the order of the links.
+
+        Args:
+            links: Links, e.g. from ``get_all_links()``
+
+        """
+        gt_groups = dict()
+        for link in links:
+            for endpoint in (link.tx, link.rx):
+                if endpoint is not None:
+                    gt_groups[endpoint.parent.parent] = None
+        return cls(gt_groups)
+
+    def _group(
+        self, property_names: Union[str, List[str]]
+    ) -> Dict[str, Tuple[IBERTCoreClient, Dict[str, List[str]]]]:
+        # core ctx -> (core_tcf_node, endpoint name -> property names)
+        property_names = PropertyCommands.sanitize_input(property_names, list)
+        groups = dict()
+        for obj in self.objs:
+            node = obj.core_tcf_node
+            if node.ctx not in groups:
+                groups[node.ctx] = (node, dict())
+            endpoint_names = groups[node.ctx][1].setdefault(obj.property.endpoint_name, list())
+            for name in property_names:
+                prop = obj.property_for_alias.get(name, name)
+                if prop not in endpoint_names:
+                    endpoint_names.append(prop)
+        return groups
+
+    def _run(self, command: str, groups: Dict[str, Tuple[IBERTCoreClient, Dict]]) -> Dict:
+        # Send the command to all cores, then wait for all of them. Requests on one core run one
+        # at a time, so each core gets one request for all of its endpoints.
+        pending = [
+            (ctx, getattr(node.future(done=null_callback), command)(args))
+            for ctx, (node, args) in groups.items()
+        ]
+        return {ctx: future.result for ctx, future in pending}
+
+    def _values_by_obj(self, property_names: Union[str, List[str]], results: Dict) -> Dict:
+        property_names = PropertyCommands.sanitize_input(property_names, list)
+        values = dict()
+        for obj in self.objs:
+            endpoint_values = results[obj.core_tcf_node.ctx][obj.property.endpoint_name]
+            values[obj] = {
+                name: endpoint_values[obj.property_for_alias.get(name, name)]
+                for name in property_names
+            }
+        return values
+
+    def get(self, property_names: Union[str, List[str]]) -> Dict[SerialObjectBase, Dict[str, Any]]:
+        """
+        Get the property values cached in cs_server
+
+        Returns:
+            Dictionary with object and (property name -> value) dict as key, value pairs.
+
+        """
+        return self._values_by_obj(
+            property_names, self._run("get_property_multi", self._group(property_names))
+        )
+
+    def refresh(
+        self, property_names: Union[str, List[str]]
+    ) -> Dict[SerialObjectBase, Dict[str, Any]]:
+        """
+        Refresh the value of properties from HW
+
+        Returns:
+            Dictionary with object and (property name -> refreshed value) dict as key, value pairs.
+
+        """
+        return self._values_by_obj(
+            property_names, self._run("refresh_property_multi", self._group(property_names))
+        )
+
+    def set(self, **property_dict):
+        """
+        Set the same new values on all objects in cs_server
+
+        Args:
+            **property_dict:
+             Unpacked dict with key as property or alias and value as new property value
+
+        """
+        self.set_each({obj: property_dict for obj in self.objs})
+
+    def set_each(self, values: Dict[SerialObjectBase, Dict[str, Any]], *, commit: bool = False):
+        """
+        Set new values, different for each object, in cs_server
+
+        Args:
+            values: Dictionary with object and (property name -> new value) dict as key, value pairs
+
+            commit: Also commit the new values to HW, in the same round trip
+
+        """
+        groups = dict()
+        for obj, property_dict in values.items():
+            node = obj.core_tcf_node
+            if node.ctx not in groups:
+                groups[node.ctx] = (node, dict())
+            endpoint_props = groups[node.ctx][1].setdefault(obj.property.endpoint_name, dict())
+            for name, value in property_dict.items():
+                endpoint_props[obj.property_for_alias.get(name, name)] = value
+        pending = [
+            node.future(done=null_callback).set_property_multi(property_dicts, commit=commit)
+            for node, property_dicts in groups.values()
+        ]
+        for future in pending:
+            _ = future.result
+
+    def commit(self, property_names: Union[str, List[str]]):
+        """
+        Commit the value of properties to HW
+
+        Args:
+            property_names: Property name(s) or alias(es)
+
+        """
+        self._run("commit_property_multi", self._group(property_names))
+
+    def add_to_watchlist(self, property_names: Union[str, List[str]]):
+        """
+        Add properties to the cs_server watchlist. Updates are sent as property change events of
+        the endpoint nodes. This does not add the properties to the ``watchlist`` of the objects.
+
+        Args:
+            property_names: Property name(s) or alias(es)
+
+        """
+        self._run("add_to_property_watchlist_multi", self._group(property_names))
+
+    def remove_from_watchlist(
+        self, property_names: Union[str, List[str]], *, keep_watched: bool = False
+    ):
+        """
+        Remove properties from the cs_server watchlist
+
+        Args:
+            property_names: Property name(s) or alias(es)
+
+            keep_watched: Leave the properties that are on the ``watchlist`` of any of the
+                objects on the cs_server watchlist
+
+        """
+        groups = self._group(property_names)
+        if keep_watched:
+            watched: Set[str] = set()
+            for obj in self.objs:
+                watched.update(obj.property.watchlist.active_properties)
+            for ctx, (node, property_names_for_endpoint) in list(groups.items()):
+                for endpoint_name, props in list(property_names_for_endpoint.items()):
+                    props = [prop for prop in props if prop not in watched]
+                    if props:
+                        property_names_for_endpoint[endpoint_name] = props
+                    else:
+                        del property_names_for_endpoint[endpoint_name]
+                if not property_names_for_endpoint:
+                    del groups[ctx]
+        self._run("remove_from_property_watchlist_multi", groups)
+
+
 parent_type = TypeVar("parent_type")
 child_type = TypeVar("child_type")
 
@@ -352,11 +571,19 @@ class SerialObjectBase(Generic[parent_type, child_type]):
             if obj_info.get(MODIFIABLE_ALIASES):
                 self._modifiable_aliases = obj_info[MODIFIABLE_ALIASES]
 
+    def _setup_from_obj_info(self, obj_info: Dict[str, Any]) -> List[SerialObjectBase]:
+        # Returns the new children. They must be set up before this object is done.
+        self._update_all_props(obj_info)
+        self._build_aliases(obj_info)
+        return []
+
+    def _finish_setup(self):
+        self.setup_done = True
+
     def setup(self):
         if self.setup_done:
             return
 
-        obj_info = self._get_obj_info_with_props()
-        self._update_all_props(obj_info)
-        self._build_aliases(obj_info)
-        self.setup_done = True
+        for child in self._setup_from_obj_info(self._get_obj_info_with_props()):
+            child.setup()
+        self._finish_setup()
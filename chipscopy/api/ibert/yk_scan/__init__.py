@@ -12,9 +12,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import math
+import time
+from array import array
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Callable, Dict, Any, Optional, TYPE_CHECKING, Set, List
+from typing import Callable, Dict, Any, Optional, TYPE_CHECKING, Set, List, Iterator, Union
 
 from chipscopy.api.ibert.aliases import (
     MB_ELF_VERSION,
@@ -24,18 +27,144 @@ from chipscopy.api.ibert.aliases import (
     YK_SCAN_SNR_VALUE,
 )
 from chipscopy.api.ibert.rx import RX
+from chipscopy.utils.coalesced_callback import CoalescedCallback
 from chipscopy.utils.printer import printer
+from chipscopy.utils.ring_buffer import RingBuffer
 
 if TYPE_CHECKING:
     from chipscopy.dm import Node
 
 
+DEFAULT_YK_SCAN_DEPTH = 10000
+"""Default number of YK samples kept per scan"""
+
+
 @dataclass
 class YKSample:
     slicer: List[float]
     snr: float
 
 
+class YKScanData:
+    """
+    Bounded store of the YK samples of a scan. Keeps the newest ``depth`` samples in typed
+    arrays, so a scan left running for hours has fixed memory use.
+
+    Indexing and iteration give :py:class:`YKSample` objects, like the list this replaces,
+    ``scan_data[-1]`` is the newest sample. The array methods return copies, oldest first.
+    """
+
+    def __init__(self, depth: int = DEFAULT_YK_SCAN_DEPTH):
+        if depth < 1:
+            raise ValueError(f"YK scan depth must be 1 or larger, not {depth}")
+        self.depth = depth
+        self.slicer_width: Optional[int] = None
+        """Number of slicer values per sample, set by the first sample"""
+
+        self._buffer: Optional[RingBuffer] = None
+
+    def __repr__(self) -> str:
+        return f"YKScanData(samples={len(self)}, depth={self.depth})"
+
+    def append(self, slicer: List[float], snr: float, timestamp: float = None):
+        if self._buffer is None:
+            self.slicer_width = max(len(slicer), 1)
+            self._buffer = RingBuffer(
+                self.depth, {"time": "d", "snr": "d", "slicer": ("d", self.slicer_width)}
+            )
+        values = array("d", slicer[: self.slicer_width])
+        if len(values) < self.slicer_width:
+            values.extend([math.nan] * (self.slicer_width - len(values)))
+        self._buffer.append(time.time() if timestamp is None else timestamp, snr, values)
+
+    def clear(self):
+        if self._buffer is not None:
+            self._buffer.clear()
+
+    def __len__(self) -> int:
+        return len(self._buffer) if self._buffer is not None else 0
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[YKSample, List[YKSample]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._buffer is None:
+            raise IndexError("YK scan data index out of range")
+        _, snr, slicer = self._buffer.get_row(index)
+        return YKSample(slicer.tolist(), snr)
+
+    def __iter__(self) -> Iterator[YKSample]:
+        if self._buffer is None:
+            return iter(())
+        return (YKSample(slicer.tolist(), snr) for _, snr, slicer in self._buffer)
+
+    @property
+    def total_count(self) -> int:
+        """Number of samples received, including the ones dropped from the store"""
+        return self._buffer.total_count if self._buffer is not None else 0
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of samples dropped from the store because it was full"""
+        return self._buffer.dropped_count if self._buffer is not None else 0
+
+    def times(self, last: Optional[int] = None) -> array:
+        """Receive time of the samples, in seconds since the epoch"""
+        return self._column("time", last)
+
+    def snr(self, last: Optional[int] = None) -> array:
+        """SNR value of the samples"""
+        return self._column("snr", last)
+
+    def slicer(self, last: Optional[int] = None) -> List[array]:
+        """Slicer data of the samples, one array per sample"""
+        return self._buffer.get_rows("slicer", last) if self._buffer is not None else []
+
+    def _column(self, name: str, last: Optional[int]) -> array:
+        return self._buffer.get_column(name, last) if self._buffer is not None else array("d")
+
+    def decimated(self, step: int, last: Optional[int] = None) -> List[YKSample]:
+        """Every ``step``-th sample, ending with the newest one. For plotting long scans."""
+        if step < 1:
+            raise ValueError(f"Decimation step must be 1 or larger, not {step}")
+        count = len(self) if last is None else min(last, len(self))
+        return [self[index] for index in range(len(self) - 1, len(self) - count - 1, -step)][::-1]
+
+    def snr_windows(self, window: int, last: Optional[int] = None) -> Dict[str, array]:
+        """
+        Aggregate the SNR values in windows of ``window`` samples. The oldest window may be
+        shorter.
+
+        Returns:
+            {"time": end time, "mean": mean SNR, "min": min SNR, "max": max SNR} of each window
+
+        """
+        if window < 1:
+            raise ValueError(f"Window size must be 1 or larger, not {window}")
+        times = self.times(last)
+        snrs = self.snr(last)
+        result = {name: array("d") for name in ("time", "mean", "min", "max")}
+        start = len(snrs) % window
+        bounds = ([0] if start else []) + list(range(start, len(snrs), window))
+        for begin in bounds:
+            end = begin + window if begin >= start else start
+            values = snrs[begin:end]
+            result["time"].append(times[end - 1])
+            result["mean"].append(sum(values) / len(values))
+            result["min"].append(min(values))
+            result["max"].append(max(values))
+        return result
+
+    def slicer_mean(self, last: Optional[int] = None) -> array:
+        """Mean of each slicer value over the samples"""
+        rows = self.slicer(last)
+        if not rows:
+            return array("d")
+        return array("d", (sum(values) / len(rows) for values in zip(*rows)))
+
+
 @dataclass
 class YKScan:
     """
@@ -76,8 +205,11 @@ class YKScan:
 
     filter_by: Dict[str, Any] = field(default_factory=dict)
 
-    scan_data: List[YKSample] = field(default_factory=list)
-    """YK scan data samples in the order they are received"""
+    depth: int = DEFAULT_YK_SCAN_DEPTH
+    """Number of samples kept in ``scan_data``, older samples are dropped"""
+
+    scan_data: YKScanData = None
+    """YK scan data samples in the order they are received, the newest ``depth`` samples"""
 
     stop_time: datetime = None
     """Time stamp of when YK scan was stopped in cs_server"""
@@ -89,6 +221,7 @@ class YKScan:
     """ELF version read from the MicroBlaze"""
 
     _handle_from_cs_server: Optional[str] = None
+    _updates_call: Optional[CoalescedCallback] = field(default=None, repr=False)
 
     def __repr__(self):
         return self.name
@@ -98,6 +231,13 @@ class YKScan:
 
         self.filter_by = {"rx": self.rx, "name": self.name}
 
+        if self.scan_data is None:
+            self.scan_data = YKScanData(self.depth)
+
+        self._updates_call = CoalescedCallback(
+            lambda: self.updates_callback(self), "YK scan update"
+        )
+
         self.rx.property.endpoint_tcf_node.add_listener(self._update_event_listener)
 
     def start(self):
@@ -127,20 +267,13 @@ class YKScan:
                 self.elf_version = report[MB_ELF_VERSION]
 
             if YK_SCAN_SLICER_DATA in report and YK_SCAN_SNR_VALUE in report:
-                self.scan_data.append(
-                    YKSample(report[YK_SCAN_SLICER_DATA], report[YK_SCAN_SNR_VALUE])
-                )
+                self.scan_data.append(report[YK_SCAN_SLICER_DATA], report[YK_SCAN_SNR_VALUE])
 
-            # If user has registered done callback function call it.
+            # If user has registered done callback function, call it on the callback thread.
+            # A slow callback does not hold up the TCF thread - updates that arrive while a call
+            # is pending are picked up by that call.
             if callable(self.updates_callback):
-                try:
-                    self.updates_callback(self)
-                except Exception as e:
-                    printer(
-                        f"Unhandled exception during YK scan update callback!\n"
-                        f"Exception - {str(e)}",
-                        level="warning",
-                    )
+                self._updates_call.request()
 
         except Exception as e:
             printer(
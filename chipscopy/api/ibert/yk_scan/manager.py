@@ -18,7 +18,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Union
 
 from chipscopy.api.containers import QueryList
-from chipscopy.api.ibert.yk_scan import YKScan
+from chipscopy.api.ibert.yk_scan import DEFAULT_YK_SCAN_DEPTH, YKScan
 from chipscopy.utils import printer
 
 if TYPE_CHECKING:
@@ -49,7 +49,9 @@ class YKScanManager:
         return QueryList(YKScanManager.scans.values())
 
     @staticmethod
-    def create_yk_scans(*, target_objs: Union[RX, List[RX]]) -> QueryList[YKScan]:
+    def create_yk_scans(
+        *, target_objs: Union[RX, List[RX]], depth: int = DEFAULT_YK_SCAN_DEPTH
+    ) -> QueryList[YKScan]:
         """
         Create an instance of :py:class:`YKScan` and attach it to the ``yk_scan`` attribute
         of the ``target_obj``
@@ -57,6 +59,7 @@ class YKScanManager:
         Args:
             target_objs: The object to use for attaching the YK scan instance.
                 The object **must** be an instance of ``RX`` class.
+            depth: **(Optional)** Number of samples kept per scan. Older samples are dropped.
 
         Returns:
             List of YK scan object(s) created
@@ -79,7 +82,7 @@ class YKScanManager:
             scan_name = f"{YKScanManager.scan_name_prefix}{YKScanManager.last_scan_number}"
 
             try:
-                new_scan = YKScan(rx=rx, name=scan_name)
+                new_scan = YKScan(rx=rx, name=scan_name, depth=depth)
             except Exception as e:
                 YKScanManager.last_scan_number -= 1
                 raise e
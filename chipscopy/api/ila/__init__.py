@@ -38,6 +38,12 @@ from chipscopy.api.ila.ila_probe import (
     ILAProbeRadix,
 )
 from chipscopy.api.ila.ila_waveform import ILAWaveform, ILAWaveformProbe
+from chipscopy.api.ila.ila_waveform_compare import (
+    ILAWaveformAlignment,
+    ILAWaveformCompareResult,
+    ILAProbeCompareResult,
+    ILAProbeMismatch,
+)
 from chipscopy.api.ila.ila import (
     ILA,
     ILAStaticInfo,
@@ -22,7 +22,6 @@ from dataclasses import dataclass, asdict
 from pprint import pformat
 from typing import Dict, List, Union, Optional, Tuple
 
-from chipscopy.api.ila.tsm.ila_tsm_reader import ILATsmReader
 from chipscopy.dm import request
 from chipscopy.shared.ila_util import to_bin_str
 from chipscopy.api._detail.ltx import Ltx, LtxStreamRef
@@ -159,6 +158,8 @@ class ILA(DebugCore["AxisIlaCoreClient"]):
             return
 
         # Initialize ILA service, for this ILA, in the cs_server
+        # Unlike VIO port info, nothing here is shared per core UUID: static info comes in the
+        # same request as status and control, and probes are defined per core in cs_server.
         self.core_tcf_node.initialize()
         init_vals = ILA._init(self.core_tcf_node, self.core_info, self._device.ltx)
 
@@ -341,6 +342,9 @@ class ILA(DebugCore["AxisIlaCoreClient"]):
         if not self.static_info.has_advanced_trigger:
             raise ValueError(f'ILA {self.name} does not support "Advanced Trigger Mode".')
 
+        # The TSM parser (antlr) is imported on first use
+        from chipscopy.api.ila.tsm.ila_tsm_reader import ILATsmReader
+
         self._tsm_state_names = {}
         probe_enums = {
             name: pval.enum_def for name, pval in self.probe_values.items() if pval.enum_def
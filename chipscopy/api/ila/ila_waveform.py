@@ -1494,6 +1494,59 @@ class ILAWaveform:
         )
         return res_dict[probe_name]
 
+    def compare(
+        self,
+        golden: "ILAWaveform",
+        probe_names: Optional[List[str]] = None,
+        probe_name_map: Optional[Dict[str, str]] = None,
+        masks: Optional[Dict[str, Union[int, str]]] = None,
+        alignment: "ILAWaveformAlignment" = None,
+        start_window_idx: int = 0,
+        window_count: Optional[int] = None,
+        golden_start_window_idx: int = 0,
+        max_mismatches: int = 10,
+    ) -> "ILAWaveformCompareResult":
+        """
+        Compare probe values of this waveform against a golden waveform.
+        Samples are compared directly in the binary waveform data, without creating value lists.
+        Gap samples, in either waveform, are skipped.
+
+        Args:
+            golden (ILAWaveform): Golden waveform, e.g. loaded with :meth:`import_waveform`.
+            probe_names (Optional[List[str]]): Probes to compare. Default 'None' means all probes.
+            probe_name_map (Optional[Dict[str, str]]): Dict of {probe name, golden probe name},
+                for probes with a different name in the golden waveform.
+            masks (Optional[Dict[str, Union[int, str]]]): Dict of {probe name, care mask}.
+                An int mask compares the set bits. A str mask has one character per bit, msb first,
+                where 'X' marks a don't-care bit. E.g. ``"1XX0"``.
+            alignment (ILAWaveformAlignment): Align windows on trigger sample (default),
+                or on first sample.
+            start_window_idx (int): First window to compare. Default is first window.
+            window_count (Optional[int]): Number of windows to compare. Default is all windows
+                present in both waveforms.
+            golden_start_window_idx (int): First golden window to compare against.
+            max_mismatches (int): Max number of mismatches recorded per probe. Default is 10.
+                All mismatches are counted.
+
+        Returns (ILAWaveformCompareResult):
+            Mismatch counts and first mismatches, per probe.
+
+        """
+        from chipscopy.api.ila.ila_waveform_compare import compare_waveforms, ILAWaveformAlignment
+
+        return compare_waveforms(
+            self,
+            golden,
+            probe_names,
+            probe_name_map,
+            masks,
+            alignment if alignment else ILAWaveformAlignment.TRIGGER,
+            start_window_idx,
+            window_count,
+            golden_start_window_idx,
+            max_mismatches,
+        )
+
     def __str__(self) -> str:
         items = {key: val for key, val in self.__dict__.items() if key != "data"}
         return pformat(items, 2)
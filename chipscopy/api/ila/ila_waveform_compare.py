@@ -0,0 +1,332 @@
+# Copyright (C) 2025, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import enum
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chipscopy.api.ila.ila_waveform import ILAWaveform, ILAWaveformProbe
+
+
+class ILAWaveformAlignment(enum.Enum):
+    """
+    How samples of two waveform windows are lined up before comparing.
+
+    =====================  ================================
+    Enum Value             Description
+    =====================  ================================
+    TRIGGER                Align windows on their trigger sample. Default.
+    START                  Align windows on their first sample.
+    =====================  ================================
+
+    """
+
+    TRIGGER = 0
+    START = 1
+
+
+@dataclass
+class ILAProbeMismatch:
+    """One sample where a probe differs from the golden waveform."""
+
+    window_index: int
+    """Window index, in the compared waveform."""
+    sample_index: int
+    """Sample index within the window, in the compared waveform."""
+    golden_sample_index: int
+    """Sample index within the window, in the golden waveform."""
+    value: int
+    """Probe value in the compared waveform."""
+    golden_value: int
+    """Probe value in the golden waveform."""
+
+
+@dataclass
+class ILAProbeCompareResult:
+    """Comparison result for one probe."""
+
+    probe_name: str
+    """Probe name in the compared waveform."""
+    golden_probe_name: str
+    """Probe name in the golden waveform."""
+    care_mask: int
+    """Bits of the probe value which were compared. Other bits are don't-care."""
+    compared_sample_count: int = 0
+    """Number of samples compared."""
+    mismatch_count: int = 0
+    """Number of samples where the masked probe values differ."""
+    mismatches: List[ILAProbeMismatch] = field(default_factory=list)
+    """First mismatches, in sample order. Limited by ``max_mismatches`` argument."""
+
+    @property
+    def passed(self) -> bool:
+        return self.mismatch_count == 0
+
+    @property
+    def first_mismatch(self) -> Optional[ILAProbeMismatch]:
+        return self.mismatches[0] if self.mismatches else None
+
+
+@dataclass
+class ILAWaveformCompareResult:
+    """Result of :meth:`ILAWaveform.compare`."""
+
+    alignment: ILAWaveformAlignment
+    """Alignment used for the compare."""
+    window_count: int
+    """Number of windows compared."""
+    compared_sample_count: int = 0
+    """Number of sample pairs compared."""
+    gap_sample_count: int = 0
+    """Number of sample pairs skipped, since one of the samples is a gap."""
+    probes: Dict[str, ILAProbeCompareResult] = field(default_factory=dict)
+    """Dict of {probe name, probe result}"""
+
+    @property
+    def passed(self) -> bool:
+        return all(res.passed for res in self.probes.values())
+
+    @property
+    def mismatch_count(self) -> int:
+        """Total number of probe mismatches, summed for all probes."""
+        return sum(res.mismatch_count for res in self.probes.values())
+
+    def get_failed_probes(self) -> List[ILAProbeCompareResult]:
+        return [res for res in self.probes.values() if not res.passed]
+
+    def __str__(self) -> str:
+        lines = [
+            f"Waveform compare {'PASSED' if self.passed else 'FAILED'}: "
+            f"{self.window_count} window(s), {self.compared_sample_count} sample(s) compared, "
+            f"{self.gap_sample_count} gap sample(s) skipped."
+        ]
+        for res in self.get_failed_probes():
+            line = f"  {res.probe_name}: {res.mismatch_count} mismatch(es)"
+            first = res.first_mismatch
+            if first:
+                line += (
+                    f", first at window {first.window_index} sample {first.sample_index}:"
+                    f" 0x{first.value:X} != golden 0x{first.golden_value:X}"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def _make_care_mask(probe_name: str, width: int, mask: Union[int, str, None]) -> int:
+    """
+    A mask is either an int, where set bits are compared, or a string with one character per bit,
+    msb first, where 'X', 'x' or '-' marks a don't-care bit. Underscores are ignored.
+    """
+    full_mask = (1 << width) - 1
+    if mask is None:
+        return full_mask
+    if isinstance(mask, int):
+        return mask & full_mask
+    bit_chars = mask.replace("_", "")
+    if len(bit_chars) != width:
+        raise ValueError(
+            f'ILAWaveform.compare() mask "{mask}" for probe "{probe_name}" '
+            f"must have {width} bit characters."
+        )
+    care_mask = 0
+    for ch in bit_chars:
+        care_mask = (care_mask << 1) | (0 if ch in "Xx-" else 1)
+    return care_mask
+
+
+def _probe_extractor(probe: "ILAWaveformProbe") -> List[Tuple[int, int, int]]:
+    """
+    List of (sample bit index, bit mask, value shift) for each bit range of the probe.
+    First bit range holds the least significant bits, same as in ILAWaveform.get_data().
+    """
+    result = []
+    shift = 0
+    for br in probe.map_range:
+        result.append((br.index, (1 << br.length) - 1, shift))
+        shift += br.length
+    return result
+
+
+def _extract(sample: int, extractor: List[Tuple[int, int, int]]) -> int:
+    value = 0
+    for index, mask, shift in extractor:
+        value |= ((sample >> index) & mask) << shift
+    return value
+
+
+def _sample_space_mask(extractor: List[Tuple[int, int, int]], care_mask: int) -> int:
+    """Translate a probe care mask to a mask over the raw sample bits."""
+    result = 0
+    for index, mask, shift in extractor:
+        result |= ((care_mask >> shift) & mask) << index
+    return result
+
+
+def _window_length(waveform: "ILAWaveform", window_idx: int) -> int:
+    # Last window may be partial.
+    start = window_idx * waveform.window_size
+    return max(0, min(waveform.window_size, waveform.sample_count - start))
+
+
+def compare_waveforms(
+    waveform: "ILAWaveform",
+    golden: "ILAWaveform",
+    probe_names: Optional[List[str]] = None,
+    probe_name_map: Optional[Dict[str, str]] = None,
+    masks: Optional[Dict[str, Union[int, str]]] = None,
+    alignment: ILAWaveformAlignment = ILAWaveformAlignment.TRIGGER,
+    start_window_idx: int = 0,
+    window_count: Optional[int] = None,
+    golden_start_window_idx: int = 0,
+    max_mismatches: int = 10,
+) -> ILAWaveformCompareResult:
+    """Arguments documented in :meth:`ILAWaveform.compare`"""
+    probe_name_map = probe_name_map if probe_name_map else {}
+    masks = masks if masks else {}
+    if not probe_names:
+        probe_names = list(waveform.probes.keys())
+
+    bad_names = [name for name in probe_names if name not in waveform.probes]
+    if bad_names:
+        raise KeyError(
+            f"ILAWaveform.compare() called with non-existent probe name(s):\n  {bad_names}"
+        )
+    golden_names = [probe_name_map.get(name, name) for name in probe_names]
+    bad_names = [name for name in golden_names if name not in golden.probes]
+    if bad_names:
+        raise KeyError(f"ILAWaveform.compare() golden waveform is missing probe(s):\n  {bad_names}")
+
+    max_window_count = min(
+        waveform.get_window_count() - start_window_idx,
+        golden.get_window_count() - golden_start_window_idx,
+    )
+    if window_count is None:
+        window_count = max_window_count
+    if window_count < 1 or window_count > max_window_count:
+        raise ValueError(
+            f'ILAWaveform.compare() function argument "window_count={window_count}" '
+            f"must be in the range [1-{max_window_count}]"
+        )
+
+    result = ILAWaveformCompareResult(alignment=alignment, window_count=window_count)
+
+    # Per probe: (result, extractor, golden extractor, care mask, sample space masks)
+    compare_specs = []
+    same_layout = True
+    for name, golden_name in zip(probe_names, golden_names):
+        probe = waveform.probes[name]
+        golden_probe = golden.probes[golden_name]
+        width = probe.length()
+        if golden_probe.length() != width:
+            raise ValueError(
+                f'ILAWaveform.compare() probe "{name}" is {width} bits wide, '
+                f'but golden probe "{golden_name}" is {golden_probe.length()} bits wide.'
+            )
+        care_mask = _make_care_mask(name, width, masks.get(name))
+        extractor = _probe_extractor(probe)
+        golden_extractor = _probe_extractor(golden_probe)
+        same_layout = same_layout and extractor == golden_extractor
+        probe_result = ILAProbeCompareResult(name, golden_name, care_mask)
+        result.probes[name] = probe_result
+        compare_specs.append(
+            (
+                probe_result,
+                extractor,
+                golden_extractor,
+                care_mask,
+                _sample_space_mask(extractor, care_mask),
+            )
+        )
+
+    # When both waveforms place the probes on the same sample bits, the whole sample is compared
+    # with one xor. Probe values are only extracted for samples with a difference.
+    sample_care_mask = 0
+    if same_layout:
+        for spec in compare_specs:
+            sample_care_mask |= spec[4]
+
+    bytes_per_sample = waveform.bytes_per_sample()
+    golden_bytes_per_sample = golden.bytes_per_sample()
+    raw = memoryview(waveform.data)
+    golden_raw = memoryview(golden.data)
+    gap_index = waveform.gap_index
+    golden_gap_index = golden.gap_index
+    from_bytes = int.from_bytes
+
+    for window_offset in range(window_count):
+        window_idx = start_window_idx + window_offset
+        golden_window_idx = golden_start_window_idx + window_offset
+        length = _window_length(waveform, window_idx)
+        golden_length = _window_length(golden, golden_window_idx)
+        if alignment == ILAWaveformAlignment.TRIGGER:
+            delta = (
+                waveform.trigger_position[window_idx] - golden.trigger_position[golden_window_idx]
+            )
+        else:
+            delta = 0
+        first = max(0, delta)
+        last = min(length, golden_length + delta)
+        base = window_idx * waveform.window_size
+        golden_base = golden_window_idx * golden.window_size - delta
+
+        for sample_idx in range(first, last):
+            pos = (base + sample_idx) * bytes_per_sample
+            golden_pos = (golden_base + sample_idx) * golden_bytes_per_sample
+            sample = from_bytes(raw[pos : pos + bytes_per_sample], "little")
+            golden_sample = from_bytes(
+                golden_raw[golden_pos : golden_pos + golden_bytes_per_sample], "little"
+            )
+            if (gap_index and (sample >> gap_index) & 1) or (
+                golden_gap_index and (golden_sample >> golden_gap_index) & 1
+            ):
+                result.gap_sample_count += 1
+                continue
+            result.compared_sample_count += 1
+            if same_layout:
+                diff = (sample ^ golden_sample) & sample_care_mask
+                if not diff:
+                    continue
+                for probe_result, extractor, _, _, sample_mask in compare_specs:
+                    if diff & sample_mask:
+                        probe_result.mismatch_count += 1
+                        if len(probe_result.mismatches) < max_mismatches:
+                            probe_result.mismatches.append(
+                                ILAProbeMismatch(
+                                    window_idx,
+                                    sample_idx,
+                                    sample_idx - delta,
+                                    _extract(sample, extractor),
+                                    _extract(golden_sample, extractor),
+                                )
+                            )
+            else:
+                for probe_result, extractor, golden_extractor, care_mask, _ in compare_specs:
+                    value = _extract(sample, extractor)
+                    golden_value = _extract(golden_sample, golden_extractor)
+                    if (value ^ golden_value) & care_mask:
+                        probe_result.mismatch_count += 1
+                        if len(probe_result.mismatches) < max_mismatches:
+                            probe_result.mismatches.append(
+                                ILAProbeMismatch(
+                                    window_idx,
+                                    sample_idx,
+                                    sample_idx - delta,
+                                    value,
+                                    golden_value,
+                                )
+                            )
+
+    for probe_result, *_ in compare_specs:
+        probe_result.compared_sample_count = result.compared_sample_count
+    return result
@@ -32,7 +32,6 @@ from chipscopy.utils.logger import log
 
 # %%
 DOMAIN = "noc_perfmon"
-log.register_domain(DOMAIN)
 epoch = datetime.utcfromtimestamp(0)
 
 # %%
@@ -142,9 +141,14 @@ class NoCElement(ABC):
         self.samples["avg_read_latency"].append(avg_read_latency)
         self.samples["avg_write_latency"].append(avg_write_latency)
         log[DOMAIN].info(
-            f"{self.name}: rb: {read_bytes}, wb: {write_bytes}, "
-            + f"rbw: {read_bytes_per_s}, wbw: {write_bytes_per_s}, "
-            + f"arl: {avg_read_latency}, awl: {avg_write_latency}"
+            "{}: rb: {}, wb: {}, rbw: {}, wbw: {}, arl: {}, awl: {}",
+            self.name,
+            read_bytes,
+            write_bytes,
+            read_bytes_per_s,
+            write_bytes_per_s,
+            avg_read_latency,
+            avg_write_latency,
         )
 
     def trim_and_log(self, raw_trace_data):
@@ -37,7 +37,7 @@ from rich.box import SQUARE as BOX_SQUARE
 
 import chipscopy
 from chipscopy.utils.printer import printer
-from chipscopy.utils.version import ServerVersionInfo
+from chipscopy.utils.version import ServerVersionInfo, get_server_version_info
 
 if TYPE_CHECKING:
     from chipscopy.api.device.device import Device
@@ -89,7 +89,7 @@ def report_versions(session: Optional["Session"] = None):
     report.add_row("ChipScoPy", chipscopy_report)
 
     if session and session.hw_server:
-        hw_server_version_info = ServerVersionInfo(session.hw_server, "hw_server")
+        hw_server_version_info = get_server_version_info(session.hw_server, "hw_server")
         hw_server_report = _create_server_report(hw_server_version_info)
         report.add_row("", "")
         report.add_row(
@@ -98,7 +98,7 @@ def report_versions(session: Optional["Session"] = None):
         )
 
     if session and session.cs_server:
-        cs_server_version_info = ServerVersionInfo(session.cs_server, "cs_server")
+        cs_server_version_info = get_server_version_info(session.cs_server, "cs_server")
         cs_server_report = _create_server_report(cs_server_version_info)
         report.add_row("", "")
         report.add_row(f"cs_server @ {session.cs_server.url}", cs_server_report)
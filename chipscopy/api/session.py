@@ -17,8 +17,9 @@ import json
 import sys
 import threading
 import traceback
-import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
 from typing import Optional, Dict, Any, List, Union, Callable, Set, Tuple
 
 from chipscopy.api import DMNodeListener
@@ -28,18 +29,26 @@ from chipscopy.utils.logger import log
 from chipscopy.utils.version import version_consistency_check
 from chipscopy.client import stimgen
 from chipscopy.client import connect as client_connect
-from chipscopy.client import disconnect as client_disconnect
-from chipscopy.client.util import connect_hw, process_param_str, parse_params
+from chipscopy.client.util import connect_hw
 from chipscopy.client.view_info import ViewInfo
 from chipscopy.client.server_info import ServerInfo
+from chipscopy.api.channel_pool import ChannelPool
 from chipscopy.api.containers import QueryList
-from chipscopy.api.device.device import Device, FeatureNotAvailableError, DeviceState
+from chipscopy.api.device.device import (
+    Device,
+    FeatureNotAvailableError,
+    DeviceState,
+    DeviceFamily,
+    DEFAULT_CORE_SETUP_WORKERS,
+    setup_core_wrappers,
+)
 from chipscopy.api.device.device_util import get_jtag_view_dict
+from chipscopy.api.device.topology_cache import TopologyCache
 from chipscopy.api.memory import Memory
+from chipscopy.api.vio import clear_port_info_cache
 from chipscopy.api.cable import Cable, discover_devices, wait_for_all_cables_ready, discover_cables
 
 DOMAIN_NAME = "client"
-log.register_domain(DOMAIN_NAME)
 
 
 class Session:
@@ -55,11 +64,10 @@ class Session:
     #    dict[hex(id(session))] = (hw_server, cs_server, session)
     _connected_session_dict: Dict[str, Tuple[ServerInfo, ServerInfo, "Session"]] = {}
 
-    # cs_server channel reference counting.
-    # cs_server instances are shared for the same host/port.
-    # Format:
-    #    dict[(normalized_host,port)] = (count, cs_server)
-    _cs_server_channel_ref_count: Dict[Tuple[str, int], Tuple[int, ServerInfo]] = {}
+    # Server channels of all sessions. cs_server channels are reference counted and shared
+    # for the same host/port. Set channel_pool.max_idle_channels to keep released channels
+    # open for the next session to the same server.
+    channel_pool = ChannelPool()
 
     def __init__(
         self,
@@ -75,6 +83,7 @@ class Session:
         pre_device_scan_delay: int,
         cs_server_sharing: bool,
         enable_experimental_protocol_decode: bool = False,
+        topology_cache: Optional[TopologyCache] = None,
     ):
         self._cs_server_sharing: bool = cs_server_sharing
         self._disable_core_scan: bool = disable_core_scan
@@ -89,6 +98,7 @@ class Session:
         self._initial_device_scan = initial_device_scan
         self._pre_device_scan_delay = pre_device_scan_delay
         self.enable_experimental_protocol_decode = enable_experimental_protocol_decode
+        self._topology_cache: Optional[TopologyCache] = topology_cache
         self.hw_server: Optional[ServerInfo] = None
         self.cs_server: Optional[ServerInfo] = None
 
@@ -187,15 +197,7 @@ class Session:
                     # TODO: Look into root cause later - happens intermittently in pytest infra causing tests to fail
                     pass
             cls._connected_session_dict = {}
-            cls._cs_server_channel_ref_count = {}
-
-    @staticmethod
-    def _parse_url(url: str) -> Tuple[str, int]:
-        param_str = process_param_str(url)
-        host_port_dict = parse_params(param_str)
-        host = host_port_dict.get("Host")
-        port = int(host_port_dict.get("Port"))
-        return host, port
+            cls.channel_pool.clear()
 
     def connect_hw_server(self):
         if not self._hw_server_url:
@@ -203,14 +205,19 @@ class Session:
             raise ValueError("hw_server_url must point to a valid hw_server")
         if self.hw_server:
             raise RuntimeError("hw_server already connected")
-        server = Session._connect_server("hw_server", self._hw_server_url, connect_hw)
+        server = Session.channel_pool.acquire(
+            "hw_server",
+            self._hw_server_url,
+            lambda url: Session._connect_server("hw_server", url, connect_hw),
+            share=False,
+        )
         self.hw_server = server
 
     def disconnect_hw_server(self):
         if not self.hw_server:
             # silently ignore disconnect calls if no server was ever connected - no harm
             return
-        client_disconnect(self.hw_server)
+        Session.channel_pool.release("hw_server", self._hw_server_url, self.hw_server)
         self.hw_server = None
 
     def connect_cs_server(self):
@@ -219,68 +226,74 @@ class Session:
             return
         if self.cs_server:
             raise RuntimeError("cs_server already connected")
+        self._attach_cs_server(self._acquire_cs_server())
 
+    def _acquire_cs_server(self) -> ServerInfo:
         # Due to a client limitation, we can not connect multiple times to the
         # server from the same process. This causes errors due to the manager being
         # removed on second connect.
         #
         # WORKAROUND:
-        # Reference count to safely share the cs_server connection
+        # The channel pool reference counts the shared cs_server connection
         #
-        host, port = Session._parse_url(self._cs_server_url)
-        ip = socket.gethostbyname(host)
-
-        # entry = Tuple(ref_count, cs_server)
-        entry = Session._cs_server_channel_ref_count.get((ip, port))
-        if entry is None or not self._cs_server_sharing:
-            # This is the first session - create ref_cnt entry and server
-            server = Session._connect_server("cs_server", self._cs_server_url, client_connect)
-            entry = (0, server)
-
-        # Increment reference count for every session connection to same cs_server
-        server = entry[1]
-        entry = (entry[0] + 1, server)
-        Session._cs_server_channel_ref_count[(ip, port)] = entry
-
-        server.connect_remote(self.hw_server.url)
-        if self._xvc_mm_server_url and server:
-            server.connect_xvc(self._xvc_mm_server_url, self._hw_server_url)
+        return Session.channel_pool.acquire(
+            "cs_server",
+            self._cs_server_url,
+            lambda url: Session._connect_server("cs_server", url, client_connect),
+            share=self._cs_server_sharing,
+        )
+
+    def _attach_cs_server(self, server: ServerInfo):
+        try:
+            # The cs_server channel may be shared - remote connects to it are serialized
+            with Session.channel_pool.get_remote_lock("cs_server", self._cs_server_url):
+                server.connect_remote(self.hw_server.url)
+                if self._xvc_mm_server_url:
+                    server.connect_xvc(self._xvc_mm_server_url, self._hw_server_url)
+        except Exception:
+            Session.channel_pool.release("cs_server", self._cs_server_url, server)
+            raise
         self.cs_server = server
 
     def disconnect_cs_server(self):
         if not self.cs_server:
             # silently ignore disconnect calls if no server was ever connected - no harm
             return
-        host, port = Session._parse_url(self._cs_server_url)
-        ip = socket.gethostbyname(host)
-
-        # entry = Tuple(ref_count, cs_server)
-        entry: Tuple[int, ServerInfo] = Session._cs_server_channel_ref_count.get((ip, port))
-        if not entry:
-            # This should not be possible - no entry indicates something unbalanced happened.
-            raise RuntimeError("Error during disconnect - no ref_cnt for session.cs_server")
-
-        ref_cnt, server = entry
-        ref_cnt -= 1
-
-        server.disconnect_remote(f"TCP:{self.hw_server.url}")
+        server = self.cs_server
         self.cs_server = None
+        try:
+            with Session.channel_pool.get_remote_lock("cs_server", self._cs_server_url):
+                server.disconnect_remote(f"TCP:{self.hw_server.url}")
+        finally:
+            Session.channel_pool.release("cs_server", self._cs_server_url, server)
 
-        if ref_cnt == 0 or not self._cs_server_sharing:
-            # This is the last session - delete the ref count tracking entry from dict
-            del Session._cs_server_channel_ref_count[(ip, port)]
-            client_disconnect(server)
-        else:
-            # This is not the last session - just decrement the ref count
-            Session._cs_server_channel_ref_count[(ip, port)] = (ref_cnt, server)
+    def _connect_servers(self):
+        if not self._cs_server_url:
+            self.connect_hw_server()
+            return
+        if self.cs_server:
+            # Checked before connecting, so hw_server is not left connected
+            raise RuntimeError("cs_server already connected")
 
-    def connect(self):
-        self.connect_hw_server()
+        # The hw_server and cs_server channels are opened at the same time.
+        # Only connect_remote needs both.
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="session_connect") as executor:
+            hw_future = executor.submit(self.connect_hw_server)
+            cs_future = executor.submit(self._acquire_cs_server)
+            wait((hw_future, cs_future))
+
+        hw_error = hw_future.exception()
+        cs_error = cs_future.exception()
+        if hw_error or cs_error:
+            if not cs_error:
+                Session.channel_pool.release("cs_server", self._cs_server_url, cs_future.result())
+            if not hw_error:
+                self.disconnect_hw_server()
+            raise hw_error or cs_error
+        self._attach_cs_server(cs_future.result())
 
-        with Session._session_lock:
-            # cs_server changes are locked because they use a reference counted
-            # shared cs_server - this is delicate
-            self.connect_cs_server()
+    def connect(self):
+        self._connect_servers()
 
         Session._add_connection(self.hw_server, self.cs_server, self)
 
@@ -318,12 +331,10 @@ class Session:
             if self.cs_server:
                 self.cs_server.get_view("chipscope").remove_node_listener(self._dm_node_listener)
 
-        with Session._session_lock:
-            # cs_server changes are locked because they use a reference counted
-            # shared cs_server - this is delicate
-            self.disconnect_cs_server()
+        self.disconnect_cs_server()
         self.disconnect_hw_server()
         Session._remove_connection(self)
+        clear_port_info_cache()
 
     def set_param(self, params: Dict[str, Any]):
         """Generic parameter get and set for low level chipscope server params"""
@@ -419,8 +430,13 @@ class Session:
         return retval
 
     def scan_devices(self) -> QueryList[Device]:
+        device_records = None
         if not self._cables_are_initialized:
-            wait_for_all_cables_ready(self.hw_server, self._cable_timeout)
+            if self._topology_cache:
+                # First scan of the session - a valid cached topology skips the hardware scan
+                device_records = self._topology_cache.load(self.hw_server, self.cs_server)
+            if device_records is None:
+                wait_for_all_cables_ready(self.hw_server, self._cable_timeout)
             self._cables_are_initialized = True
         devices = discover_devices(
             hw_server=self.hw_server,
@@ -429,6 +445,8 @@ class Session:
             cable_ctx=None,
             disable_cache=self._disable_cache,
             enable_experimental_protocol_decode=self.enable_experimental_protocol_decode,
+            device_records=device_records,
+            topology_cache=self._topology_cache,
         )  # Gating logic goes Here
         self._set_device_with_lock(devices)
         return QueryList(self._devices)
@@ -457,6 +475,28 @@ class Session:
             devices = self._get_devices_with_lock()
         return devices
 
+    def setup_core_wrappers(
+        self, *, initialize: bool = True, max_workers: int = DEFAULT_CORE_SETUP_WORKERS
+    ) -> int:
+        """Create the debug core wrappers of all devices in the session concurrently.
+        Call after discover_and_setup_cores() on the devices of interest.
+        See :meth:`Device.setup_core_wrappers`.
+
+        Args:
+            initialize: Also run the deferred initialization of cores which support it (like ILA)
+            max_workers: Max number of cores set up at the same time, across all devices
+
+        Returns:
+            Number of debug core wrappers created
+        """
+        if not self.cs_server:
+            raise RuntimeError("cs_server is not connected")
+        devices = []
+        for device in self.devices:
+            if device.device_family in (DeviceFamily.VERSAL, DeviceFamily.UPLUS):
+                devices.append(device)
+        return setup_core_wrappers(devices, initialize=initialize, max_workers=max_workers)
+
     @property
     def memory(self) -> QueryList[Memory]:
         memory_node_list = QueryList()
@@ -571,6 +611,9 @@ def create_session(*, hw_server_url: str, cs_server_url: Optional[str] = None, *
         disable_cache: Control client caching (experimental)
         auto_connect: Automatically connect to server(s) when session is created
         cs_server_sharing: Enable reference count to share cs_server connections
+        topology_cache: True, a cache directory path, or a TopologyCache. Saves the device
+            topology on disk, and reuses it in later sessions to the same servers after a
+            quick validation. Default is no cache.
 
     Returns:
         New session object.
@@ -586,6 +629,13 @@ def create_session(*, hw_server_url: str, cs_server_url: Optional[str] = None, *
     auto_connect = kwargs.get("auto_connect", True)
     cs_server_sharing = kwargs.get("cs_server_sharing", False)
     enable_experimental_protocol_decode = kwargs.get("enable_experimental_protocol_decode", False)
+    topology_cache = kwargs.get("topology_cache", None)
+    if topology_cache is True:
+        topology_cache = TopologyCache()
+    elif isinstance(topology_cache, (str, Path)):
+        topology_cache = TopologyCache(topology_cache)
+    elif not topology_cache:
+        topology_cache = None
     # Create session even if there already exists a session with the same cs_server and hw_server
     # It *should* be safe.
     session = Session(
@@ -600,6 +650,7 @@ def create_session(*, hw_server_url: str, cs_server_url: Optional[str] = None, *
         pre_device_scan_delay=pre_device_scan_delay,
         cs_server_sharing=cs_server_sharing,
         enable_experimental_protocol_decode=enable_experimental_protocol_decode,
+        topology_cache=topology_cache,
     )
     if auto_connect:
         session.connect()
@@ -14,15 +14,21 @@
 # limitations under the License.
 
 import dataclasses
+import functools
 from dataclasses import dataclass, asdict
 import json
 import re
-from typing import Union, List, Dict, TYPE_CHECKING
+import threading
+import time
+from typing import Union, List, Dict, Iterable, Optional, Tuple, TYPE_CHECKING
 from collections import defaultdict
 
 from chipscopy.api import CoreType
 from chipscopy.api._detail.ltx import Ltx, LtxCore, LtxProbe
 from chipscopy.api._detail.debug_core import DebugCore
+from chipscopy.dm.request import null_callback
+from chipscopy.tcf import protocol
+from chipscopy.utils.ring_buffer import RingBuffer
 
 if TYPE_CHECKING:
     from chipscopy.client.axis_vio_core_client import AxisVIOCoreClient
@@ -106,6 +112,25 @@ class VIOProbe:
         return f"probe_{self.direction}{self.port_index}"
 
 
+# Static port info (port_in_widths, port_out_widths, has_activity) by VIO core UUID.
+_VIO_PORT_INFO_BY_UUID: Dict[str, Tuple[List[int], List[int], bool]] = {}
+
+
+def clear_port_info_cache():
+    """Forget the port info of all VIO cores. Called when a device is programmed or a session
+    is disconnected, so the next VIO read gets the port info from hardware again."""
+    _VIO_PORT_INFO_BY_UUID.clear()
+
+
+def ensure_vio_init(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._initialize()
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class VIO(DebugCore["AxisVIOCoreClient"]):
     """This class contains the main API to use the VIO (Virtual Input/Output)
     debug core. VIO monitors elements of a running design in hardware with
@@ -119,6 +144,9 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
     methods are available to debug at the higher level HDL context. HDL nets and
     bus names from Vivado are automatically converted to the correct VIO probe
     port when reading or writing.
+
+    Port information and probe definitions are fetched from hardware on first
+    use, so enumerating ``device.vio_cores`` does not access the VIO cores.
     """
 
     def __init__(self, vio_tcf_node, *, ltx: Ltx = None):
@@ -128,16 +156,41 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
         self.instance_name = None
         self.ltx_core = None
         self.uuid = self.core_info.uuid
-        (
-            self.port_in_widths,
-            self.port_out_widths,
-            self.has_activity,
-        ) = self._read_port_info_from_hardware()
-        self._setup_vio_from_ltx(ltx)
+        # Port info and probe definitions are set up on first use. See _initialize().
+        self._port_info: Optional[Tuple[List[int], List[int], bool]] = None
+        self._initialize_complete = False
+        if ltx:
+            ltx_core: LtxCore = ltx.get_core(core_type=self.core_type, uuid=self.uuid)
+            assert ltx_core is not None
+            self.ltx_core = ltx_core
+            self.instance_name = ltx_core.cell_name
+            self.name = ltx_core.cell_name
 
         # This is used by the filter_by method in QueryList
         self.filter_by = {"name": self.name, "uuid": self.uuid, "instance_name": self.instance_name}
 
+    def _initialize(self):
+        if self._initialize_complete:
+            return
+        self._get_port_info()
+        self._setup_vio_probes()
+        self._initialize_complete = True
+
+    @property
+    def port_in_widths(self) -> List[int]:
+        """Bit width of each VIO input port"""
+        return self._get_port_info()[0]
+
+    @property
+    def port_out_widths(self) -> List[int]:
+        """Bit width of each VIO output port"""
+        return self._get_port_info()[1]
+
+    @property
+    def has_activity(self) -> bool:
+        """True if the VIO input ports have activity detectors"""
+        return self._get_port_info()[2]
+
     def __repr__(self) -> str:
         return self.to_json()
 
@@ -213,6 +266,7 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
         """
         self.core_tcf_node.reset_core()
 
+    @ensure_vio_init
     def read_ports(self, port_names: Union[str, List[str]] = None) -> Dict[str, Dict]:
         """Read VIO port values from hardware. Gets the current values from
         hardware for selected input_ports and output_ports.
@@ -252,8 +306,13 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
             port_names = [port_names]
         if port_names is None:
             port_names = self.port_names
-        port_in_data = self.core_tcf_node.refresh_port_in_data()
-        port_out_data = self.core_tcf_node.refresh_port_out_data()
+        # Only refresh the port directions which are read.
+        port_in_data = {}
+        port_out_data = {}
+        if any(port_name.startswith("probe_in") for port_name in port_names):
+            port_in_data = self.core_tcf_node.refresh_port_in_data()
+        if any(port_name.startswith("probe_out") for port_name in port_names):
+            port_out_data = self.core_tcf_node.refresh_port_out_data()
         port_data = {}
         for port_name in port_names:
             port_name_split = re.split("^probe_(in|out)(\\d+)$", port_name)
@@ -274,6 +333,7 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
                 raise ValueError(f"Invalid port name - {port_name}")
         return port_data
 
+    @ensure_vio_init
     def write_ports(self, port_values: Dict[str, int]):
         """Write values to VIO port outputs in hardware. Port names follow
         the VIO convention port in and port out naming.
@@ -397,6 +457,7 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
             retval[k] = v["value"]
         return retval
 
+    @ensure_vio_init
     def read_probes(self, probe_names: List[str] or str = None) -> Dict[str, Dict]:
         """Read probe values from hardware. Gets the current integer and activity values from
         hardware for selected probes. Output probes to not support activity and will return
@@ -443,6 +504,7 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
             retval[probe_name] = {"value": probe_value, "activity": probe_activity}
         return retval
 
+    @ensure_vio_init
     def write_probes(self, probe_values: Dict[str, int] = None):
         """Write values to VIO probe outputs in hardware. See
         ``vio_probe_names``.
@@ -463,6 +525,18 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
         assert isinstance(probe_values, dict)
         self.core_tcf_node.commit_probe(probe_values)
 
+    def _get_port_info(self) -> Tuple[List[int], List[int], bool]:
+        # Port info is static for a VIO IP configuration, so it is shared by all VIO
+        # wrappers with the same UUID - e.g. after a device rescan or with another session.
+        if self._port_info is None:
+            port_info = _VIO_PORT_INFO_BY_UUID.get(self.uuid) if self.uuid else None
+            if port_info is None:
+                port_info = self._read_port_info_from_hardware()
+                if self.uuid:
+                    _VIO_PORT_INFO_BY_UUID[self.uuid] = port_info
+            self._port_info = port_info
+        return self._port_info
+
     def _read_port_info_from_hardware(self):
         ports_info_dict = self.core_tcf_node.get_ports_info()
         port_in_widths: List[int] = []
@@ -507,16 +581,343 @@ class VIO(DebugCore["AxisVIOCoreClient"]):
                 }
                 self.core_tcf_node.define_probe([probe_to_create])
 
-    def _setup_vio_from_ltx(self, ltx: Ltx):
-        # Clear out any old LTX leftovers
-        self.instance_name = None
+    def _setup_vio_probes(self):
+        # Clear out any old LTX leftovers in cs_server, and define the LTX probes
         self.core_tcf_node.undefine_probe(probe_name="All")
-        self.ltx_core = None
-        if ltx:
-            ltx_core: LtxCore = ltx.get_core(core_type=self.core_type, uuid=self.uuid)
-            self.ltx_core = ltx_core
-            assert ltx_core is not None
-            self.instance_name = ltx_core.cell_name
-            self.name = ltx_core.cell_name
-            probe_to_port_map = self._get_probe_to_port_map(ltx_core.probes)
+        if self.ltx_core:
+            probe_to_port_map = self._get_probe_to_port_map(self.ltx_core.probes)
             self._create_probes(probe_to_port_map)
+
+
+class VIOGroup:
+    """Reads and writes probes of many VIO cores together.
+
+    The refresh, report and commit requests for all cores in the group are sent
+    before waiting for any reply, so the cost of a group read is about one round
+    trip instead of one per core. Probes are addressed by name, so probe names must
+    be unique within the group. Requires VIO cores set up with an LTX file.
+
+    ::
+
+        group = VIOGroup(device.vio_cores)
+        values = group.read_probe_values(["counter", "status"])
+        group.write_probes({"enable": 1, "mode": 2})
+
+    """
+
+    def __init__(self, vios: Iterable[VIO]):
+        self.vios: List[VIO] = list(vios)
+        self._vio_by_probe_name: Dict[str, VIO] = {}
+        self._direction_by_probe_name: Dict[str, str] = {}
+        for vio in self.vios:
+            for ltx_probe in vio.ltx_core.probes if vio.ltx_core else []:
+                probe_name = ltx_probe.name
+                if probe_name in self._vio_by_probe_name:
+                    raise ValueError(
+                        f"Probe {probe_name} is in VIO {vio.name} and "
+                        f"{self._vio_by_probe_name[probe_name].name}. "
+                        f"Probe names must be unique in a VIOGroup."
+                    )
+                self._vio_by_probe_name[probe_name] = vio
+                self._direction_by_probe_name[probe_name] = ltx_probe.direction.lower()
+
+    def __len__(self) -> int:
+        return len(self.vios)
+
+    @property
+    def probe_names(self) -> List[str]:
+        """List of probe names of all VIO cores in the group"""
+        return list(self._vio_by_probe_name.keys())
+
+    def _group_by_vio(self, probe_names: Iterable[str]) -> List[Tuple[VIO, List[str]]]:
+        names_by_vio = {}
+        for probe_name in probe_names:
+            vio = self._vio_by_probe_name.get(probe_name)
+            if vio is None:
+                raise KeyError(f"Probe {probe_name} is not in any VIO core of the group")
+            names_by_vio.setdefault(id(vio), (vio, []))[1].append(probe_name)
+        return list(names_by_vio.values())
+
+    def read_probes(self, probe_names: Union[List[str], str] = None) -> Dict[str, Dict]:
+        """Read probe values and activity from hardware, for probes of all cores
+        in the group. Only cores with a requested probe are accessed.
+
+        NOTE: Reading values will cause IP to reset activity tracking for the vio cores
+
+        Args:
+            probe_names: Optional list of probe names. Default is all probes in the group.
+
+        Returns:
+            dict:
+                (probe_name, {'value': value, 'activity': activity}).
+                Same format as :meth:`VIO.read_probes`.
+        """
+        if isinstance(probe_names, str):
+            probe_names = [probe_names]
+        elif probe_names is None:
+            probe_names = self.probe_names
+        vio_selection = self._group_by_vio(probe_names)
+
+        # Send all requests first. Requests on one core run in order.
+        pending = []
+        for vio, names in vio_selection:
+            vio._initialize()
+            node = vio.core_tcf_node
+            # Only refresh the port directions which are read, like VIO.read_ports
+            directions = {self._direction_by_probe_name[name] for name in names}
+            refresh_futures = []
+            if "in" in directions:
+                refresh_futures.append(node.future(done=null_callback).refresh_port_in_data())
+            if "out" in directions:
+                refresh_futures.append(node.future(done=null_callback).refresh_port_out_data())
+            report_future = node.future(done=null_callback).report_probe()
+            pending.append((names, refresh_futures, report_future))
+
+        retval: Dict = {}
+        for names, refresh_futures, report_future in pending:
+            for refresh_future in refresh_futures:
+                _ = refresh_future.result
+            report_results = report_future.result
+            for probe_name in names:
+                retval[probe_name] = {
+                    "value": report_results[probe_name]["value"],
+                    "activity": report_results[probe_name]["activity"],
+                }
+        return retval
+
+    def read_probe_values(self, probe_names: Union[List[str], str] = None) -> Dict[str, int]:
+        """Read probe values from hardware, for probes of all cores in the group.
+        See :meth:`read_probes`.
+
+        Returns:
+            dict:
+                dict: {probe_name:  value, ...}.
+        """
+        return {name: v["value"] for name, v in self.read_probes(probe_names).items()}
+
+    def write_probes(self, probe_values: Dict[str, int]):
+        """Write values to VIO probe outputs in hardware, for probes of all cores in
+        the group. One commit is sent to each core with written probes.
+
+        Args:
+            probe_values: dict. key=probe_name, value=probe_value.
+
+        Returns:
+            Nothing
+        """
+        assert isinstance(probe_values, dict)
+        pending = []
+        for vio, names in self._group_by_vio(probe_values.keys()):
+            vio._initialize()
+            values = {name: probe_values[name] for name in names}
+            pending.append(vio.core_tcf_node.future(done=null_callback).commit_probe(values))
+        for future in pending:
+            _ = future.result
+
+
+class VIOSampler:
+    """Samples VIO input probes at a fixed rate, into a ring buffer.
+
+    Polling runs on the TCF dispatch thread, so the calling thread is free while
+    sampling. Each sample is stored as one row (timestamp, value, ...) in a
+    preallocated :class:`~chipscopy.utils.ring_buffer.RingBuffer` of ``depth`` rows.
+    When the buffer is full, the oldest samples are overwritten.
+
+    Sampling rate is limited by the round trip time to the hardware server. If a
+    sample takes longer than ``period_ms``, the next sample starts right away.
+
+    ::
+
+        sampler = VIOSampler(vio, ["counter", "status"], period_ms=5, depth=10000)
+        sampler.start()
+        ...
+        sampler.stop()
+        data = sampler.get_data()   # {"timestamp": array, "counter": array, ...}
+
+    Probe names are LTX input probe names, or input port names like ``probe_in0``.
+    """
+
+    TIMESTAMP = "timestamp"
+    """Column name for the sample time, in seconds since ``start_time``."""
+
+    def __init__(
+        self,
+        vio: VIO,
+        probe_names: Union[List[str], str] = None,
+        *,
+        period_ms: float = 10.0,
+        depth: int = 10000,
+    ):
+        if period_ms < 0:
+            raise ValueError(f"period_ms must be 0 or larger, not {period_ms}")
+        vio._initialize()
+        self.vio = vio
+        self.period_ms = period_ms
+        if isinstance(probe_names, str):
+            probe_names = [probe_names]
+        elif probe_names is None:
+            probe_names = self._input_probe_names()
+
+        # (port_index, lsb, mask) for each sampled probe - values are sliced from the ports.
+        self._slices: List[Tuple[int, int, int]] = []
+        columns = {VIOSampler.TIMESTAMP: "d"}
+        for probe_name in probe_names:
+            port_index, lsb, width = self._get_probe_slice(probe_name)
+            self._slices.append((port_index, lsb, (1 << width) - 1))
+            columns[probe_name] = "Q" if width <= 64 else None
+        self.probe_names: List[str] = list(probe_names)
+        self.buffer = RingBuffer(depth, columns)
+
+        self.start_time: Optional[float] = None
+        """Wall clock time (time.time()) of the first sample."""
+        self.error = None
+        """Error which stopped sampling, if any."""
+        self._start_counter = 0.0
+        self._next_due = 0.0
+        self._running = False
+        self._stopped = threading.Event()
+        self._stopped.set()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _input_probe_names(self) -> List[str]:
+        if self.vio.ltx_core:
+            return [p.name for p in self.vio.ltx_core.probes if p.direction.lower() == "in"]
+        return [f"probe_in{idx}" for idx in range(self.vio.port_in_count)]
+
+    def _get_probe_slice(self, probe_name: str) -> Tuple[int, int, int]:
+        if self.vio.ltx_core:
+            for ltx_probe in self.vio.ltx_core.probes:
+                if ltx_probe.name == probe_name:
+                    if ltx_probe.direction.lower() != "in":
+                        raise ValueError(f"VIO probe {probe_name} is not an input probe")
+                    lsb = ltx_probe.port_lsb_index
+                    return ltx_probe.port_index, lsb, ltx_probe.port_msb_index - lsb + 1
+        match = re.match("^probe_in(\\d+)$", probe_name)
+        if match and int(match.group(1)) < self.vio.port_in_count:
+            port_index = int(match.group(1))
+            return port_index, 0, self.vio.port_in_widths[port_index]
+        raise KeyError(f"{probe_name} is not an input probe or input port of VIO {self.vio.name}")
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples taken since start(), including overwritten samples."""
+        return self.buffer.total_count
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of samples overwritten, since the ring buffer was full."""
+        return self.buffer.dropped_count
+
+    def start(self, clear: bool = True):
+        """Start sampling. Returns right away.
+
+        Args:
+            clear: Discard samples from a previous run. Default is True.
+        """
+        if self._running:
+            return
+        if clear:
+            self.buffer.clear()
+        self.error = None
+        self._running = True
+        self._stopped.clear()
+        protocol.invokeLater(self._start_on_dispatch_thread)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop sampling. Waits for an outstanding sample to complete.
+
+        Args:
+            timeout: Max seconds to wait. Default is no limit.
+        """
+        self._running = False
+        if not protocol.isDispatchThread():
+            self._stopped.wait(timeout)
+
+    def _start_on_dispatch_thread(self):
+        node = self.vio.core_tcf_node
+        self._client = node.manager.cs_manager.get_node(node.ctx, node.node_cls)
+        self.start_time = time.time()
+        self._start_counter = time.perf_counter()
+        self._next_due = self._start_counter
+        self._sample()
+
+    def _sample(self):
+        if not self._running:
+            self._stopped.set()
+            return
+        self._request_time = time.perf_counter()
+        self._next_due += self.period_ms / 1000.0
+        try:
+            self._client.refresh_port_in_data(done=self._sample_done)
+        except Exception as ex:
+            self._stop_with_error(ex)
+
+    def _sample_done(self, token, error, results):
+        if error:
+            self._stop_with_error(error)
+            return
+        now = time.perf_counter()
+        # Sample time is the middle of the request round trip.
+        timestamp = (self._request_time + now) / 2 - self._start_counter
+        ports = results["In"]
+        self.buffer.append(
+            timestamp, *[(ports[port] >> lsb) & mask for port, lsb, mask in self._slices]
+        )
+        delay_ms = int((self._next_due - now) * 1000)
+        if delay_ms > 0:
+            protocol.invokeLaterWithDelay(delay_ms, self._sample)
+        else:
+            # Running behind. Do not try to catch up with a burst of samples.
+            self._next_due = now
+            protocol.invokeLater(self._sample)
+
+    def _stop_with_error(self, error):
+        self.error = error
+        self._running = False
+        self._stopped.set()
+
+    def get_data(self, last: Optional[int] = None) -> Dict:
+        """Get the buffered samples, oldest first.
+
+        Args:
+            last: Only the newest 'last' samples. Default is all buffered samples.
+
+        Returns:
+            dict:
+                {"timestamp": array, probe_name: array, ...}. Probes wider than
+                64 bits are returned as lists of int.
+        """
+        return self.buffer.to_dict(last)
+
+    def to_numpy(self, last: Optional[int] = None) -> Dict:
+        """Same as :meth:`get_data`, with numpy arrays. Requires numpy."""
+        return self.buffer.to_numpy(last)
+
+    def stream(self, poll_interval: float = 0.1) -> Iterable[Tuple]:
+        """Generator of samples, as they are taken. Ends when sampling stops.
+        Samples overwritten before they are read are skipped.
+
+        Args:
+            poll_interval: Seconds between checks for new samples.
+
+        Yields:
+            tuple: (timestamp, value, ...) in the order of ``probe_names``.
+        """
+        seen = self.buffer.total_count - len(self.buffer)
+        while True:
+            running = self._running
+            seen, columns = self.buffer.read_new(seen)
+            yield from zip(*columns.values())
+            if not running:
+                return
+            time.sleep(poll_interval)
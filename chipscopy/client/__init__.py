@@ -36,6 +36,14 @@ proxies.init()
 
 _connections = {}
 _lock = threading.Lock()
+_event_queue_lock = threading.Lock()
+
+
+def _start_event_queue():
+    # Sessions open hw_server and cs_server channels from several threads at once
+    with _event_queue_lock:
+        if not protocol.getEventQueue():
+            protocol.startEventQueue()
 
 
 def _setup_channel_listener(params, chan: channel):
@@ -59,16 +67,14 @@ try:
     from chipscopy.tcf.native.ChannelPyTcf import ChannelPyTcf
 
     def connect_channel(params, wait=True):
-        if not protocol.getEventQueue():
-            protocol.startEventQueue()
+        _start_event_queue()
         params = parse_params(process_param_str(params))
         return pytcf.connect_tcf(params[peer.ATTR_ID])
 
 except ModuleNotFoundError:
 
     def connect_channel(params, done: request.DoneCallback = None):
-        if not protocol.getEventQueue():
-            protocol.startEventQueue()
+        _start_event_queue()
         wait = ~protocol.isDispatchThread() and not done
         p = peer.TransientPeer(parse_params(process_param_str(params)))
         if wait:
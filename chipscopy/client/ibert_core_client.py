@@ -13,12 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Union, List, Dict, Literal
+from typing import Any, Union, List, Dict, Literal
 
 from chipscopy import dm
 from chipscopy.api.ibert.aliases import DISPLAY_NAME
 from chipscopy.client import core
 from chipscopy.client.core import CoreClient
+from chipscopy.dm import request
 from chipscopy.dm.request import DoneCallback
 from chipscopy.utils import listify
 from chipscopy.utils.logger import log
@@ -135,6 +136,60 @@ class IBERTCoreClient(CoreClient):
         token = service.get_obj_info(options, done_cb)
         return self.add_pending(token)
 
+    def setup_gt_group_multi(
+        self, gt_groups: List[str], *, skip_post_ops: bool = False, done: DoneCallback = None
+    ):
+        """
+        Set up many GT Groups, with one pipelined command per GT Group.
+
+        Args:
+            gt_groups (list[str]): Names of the GT Groups
+
+            skip_post_ops (bool): **(Optional)** Passed on to each setup command
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        """
+
+        def setup_gt_group(_, gt_group, done):
+            self.setup_gt_group(gt_group, done, skip_post_ops=skip_post_ops)
+
+        self._for_each_endpoint([(setup_gt_group, None, name) for name in gt_groups], done)
+
+    def get_obj_info_multi(
+        self,
+        handles: List[str],
+        *,
+        include_alias: bool = True,
+        include_property: Literal["no", "all", "client_visible"] = "no",
+        done: DoneCallback = None,
+    ):
+        """
+        Get the info of many objects, with one pipelined command per object.
+
+        Args:
+            handles (list[str]): Object handles
+
+            include_alias (bool): **(Optional)** Passed on to each get_obj_info command
+
+            include_property (str): **(Optional)** Passed on to each get_obj_info command
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        Returns:
+            dict(str, dict): Object handle -> object info
+
+        """
+
+        def get_obj_info(_, handle, done):
+            self.get_obj_info(
+                handle, done, include_alias=include_alias, include_property=include_property
+            )
+
+        self._for_each_endpoint([(get_obj_info, None, handle) for handle in handles], done)
+
     def setup(self, done: DoneCallback = None):
         service, done_cb = self.make_done(done)
         options = {"node_id": self.ctx}
@@ -611,6 +666,172 @@ class IBERTCoreClient(CoreClient):
         token = service.commit_property(options, done_cb)
         return self.add_pending(token)
 
+    def _for_each_endpoint(self, calls: List[tuple], done: DoneCallback):
+        # Send all calls (command, arg, key), before any result comes back. The key is the
+        # endpoint name for property commands, or the object handle/name for the others.
+        # done is called once, with a dict of key -> result, or the first error.
+        done = request._make_callback(done)
+        results = dict()
+        errors = list()
+        remaining = len(calls)
+
+        def make_call_done(endpoint_name):
+            def call_done(token, error, result):
+                nonlocal remaining
+                remaining -= 1
+                if error:
+                    errors.append(error)
+                else:
+                    results[endpoint_name] = result
+                if remaining == 0 and done:
+                    done.done_request(token, errors[0] if errors else None, results)
+
+            return call_done
+
+        if remaining == 0:
+            if done:
+                done.done_request(None, None, results)
+            return
+
+        for command, arg, endpoint_name in calls:
+            command(arg, endpoint_name, done=make_call_done(endpoint_name))
+
+    @staticmethod
+    def _property_values(property_names: List[str], result) -> Dict[str, Any]:
+        # A command for one property returns the bare value
+        if len(property_names) == 1 and not isinstance(result, dict):
+            return {property_names[0]: result}
+        return result
+
+    def get_property_multi(
+        self, property_names: Dict[str, List[str]], *, done: DoneCallback = None
+    ):
+        """
+        Get value of properties of many endpoints, with one pipelined command per endpoint.
+
+        Args:
+            property_names (dict): Endpoint display name -> list of property names
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        Returns:
+            dict(str, dict(str, str)): Endpoint display name -> property name -> value
+
+        """
+        property_names = {endpoint: listify(names) for endpoint, names in property_names.items()}
+
+        def done_get(token, error, results):
+            if not error:
+                results = {
+                    endpoint: self._property_values(property_names[endpoint], result)
+                    for endpoint, result in results.items()
+                }
+            if done:
+                done.done_request(token, error, results)
+
+        done = request._make_callback(done)
+        self._for_each_endpoint(
+            [(self.get_property, names, ep) for ep, names in property_names.items()], done_get
+        )
+
+    def set_property_multi(
+        self,
+        property_dicts: Dict[str, Dict[str, Union[int, str]]],
+        *,
+        commit: bool = False,
+        done: DoneCallback = None,
+    ):
+        """
+        Set new values for properties of many endpoints, with one pipelined command per endpoint.
+
+        Args:
+            property_dicts (dict): Endpoint display name -> dict of property name and new value
+
+            commit (bool): **(Optional)** Also commit the new values to HW. The commit command
+                for each endpoint is sent right after its set command.
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        """
+        calls = list()
+        for endpoint_name, property_dict in property_dicts.items():
+            calls.append((self.set_property, property_dict, endpoint_name))
+            if commit:
+                calls.append((self.commit_property, list(property_dict), endpoint_name))
+        self._for_each_endpoint(calls, done)
+
+    def commit_property_multi(
+        self, property_names: Dict[str, List[str]], *, done: DoneCallback = None
+    ):
+        """
+        Commit the value of properties of many endpoints to HW, with one pipelined command per
+        endpoint.
+
+        Args:
+            property_names (dict): Endpoint display name -> list of property names
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        """
+        property_names = {endpoint: listify(names) for endpoint, names in property_names.items()}
+        self._for_each_endpoint(
+            [(self.commit_property, names, ep) for ep, names in property_names.items()], done
+        )
+
+    def refresh_property_multi(
+        self, property_names: Dict[str, List[str]], *, done: DoneCallback = None
+    ):
+        """
+        Refresh the value of properties of many endpoints from HW, with one pipelined command
+        per endpoint.
+
+        Args:
+            property_names (dict): Endpoint display name -> list of property names
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        Returns:
+            dict(str, dict(str, str)): Endpoint display name -> property name -> refreshed value
+
+        Usage
+            ::
+
+                >>> ibert.refresh_property_multi(
+                >>>     {
+                >>>         "Quad_0": ["<Property 1 name>", "<Property 2 name>"],
+                >>>         "Quad_1": ["<Property 3 name>"],
+                >>>     }
+                >>> )
+                {
+                    "Quad_0": {
+                        "<Property 1 name>": "<Refreshed value>",
+                        "<Property 2 name>": "<Refreshed value>",
+                    },
+                    "Quad_1": {"<Property 3 name>": "<Refreshed value>"},
+                }
+
+        """
+        property_names = {endpoint: listify(names) for endpoint, names in property_names.items()}
+
+        def done_refresh(token, error, results):
+            if not error:
+                results = {
+                    endpoint: self._property_values(property_names[endpoint], result)
+                    for endpoint, result in results.items()
+                }
+            if done:
+                done.done_request(token, error, results)
+
+        done = request._make_callback(done)
+        self._for_each_endpoint(
+            [(self.refresh_property, names, ep) for ep, names in property_names.items()],
+            done_refresh,
+        )
+
     def list_property_groups(self, *, done: DoneCallback = None):
         """
         Lists the available property groups.
@@ -669,6 +890,49 @@ class IBERTCoreClient(CoreClient):
         token = service.remove_from_property_watchlist(options, done_cb)
         return self.add_pending(token)
 
+    def add_to_property_watchlist_multi(
+        self, property_names: Dict[str, List[str]], *, done: DoneCallback = None
+    ):
+        """
+        Add properties of many endpoints to the watchlist, with one pipelined command per
+        endpoint. cs_server sends property update events for watched properties.
+
+        Args:
+            property_names (dict): Endpoint display name -> list of property names
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        """
+        property_names = {endpoint: listify(names) for endpoint, names in property_names.items()}
+        self._for_each_endpoint(
+            [(self.add_to_property_watchlist, names, ep) for ep, names in property_names.items()],
+            done,
+        )
+
+    def remove_from_property_watchlist_multi(
+        self, property_names: Dict[str, List[str]], *, done: DoneCallback = None
+    ):
+        """
+        Remove properties of many endpoints from the watchlist, with one pipelined command per
+        endpoint.
+
+        Args:
+            property_names (dict): Endpoint display name -> list of property names
+
+            done: **(Optional)** If callback is desired once operation is complete,
+                then function/method should be provided.
+
+        """
+        property_names = {endpoint: listify(names) for endpoint, names in property_names.items()}
+        self._for_each_endpoint(
+            [
+                (self.remove_from_property_watchlist, names, ep)
+                for ep, names in property_names.items()
+            ],
+            done,
+        )
+
     def report_property(
         self,
         property_names: Union[str, List[str]],
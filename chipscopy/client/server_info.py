@@ -32,6 +32,8 @@ class ServerInfo(dm.Node):
         self._props_ready = threading.Event()
         self._update_static_info()
         self.views = {}
+        # ServerVersionInfo, see chipscopy.utils.version.get_server_version_info()
+        self.version_info = None
 
     def __getattr__(self, attr):
         self._props_ready.wait(5)
@@ -22,11 +22,10 @@ from ..mem import MemoryNode
 
 def find_pmc_tap(hws):
     view = hws.get_view(jtag)
-    for node in view.get_all():
-        if JtagDevice.is_compatible(node) and (
-            node.arch_name and (node.arch_name == "everest" or node.arch_name == "versal")
-        ):
-            return view.get_node(node.ctx, JtagDevice)
+    for arch_name in ("everest", "versal"):
+        for node in view.get_nodes_by_prop("arch_name", arch_name):
+            if JtagDevice.is_compatible(node):
+                return view.get_node(node.ctx, JtagDevice)
     raise (Exception("Could not find pmc_tap"))
 
 
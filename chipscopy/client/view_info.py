@@ -14,6 +14,7 @@
 # limitations under the License.
 
 import copy
+import threading
 from collections import deque
 from itertools import islice
 from typing import List, Set, Type, Callable, ClassVar
@@ -22,6 +23,13 @@ from chipscopy.dm import request
 from chipscopy.tcf import protocol
 from chipscopy.utils.logger import log
 
+# Property values of these types are shared with the TCF thread node rather than copied.
+_IMMUTABLE_PROP_TYPES = frozenset((int, float, bool, str, bytes, tuple, frozenset, type(None)))
+
+
+def _snapshot(value):
+    return value if type(value) in _IMMUTABLE_PROP_TYPES else copy.copy(value)
+
 
 class TargetFilter(object):
     def __init__(
@@ -147,8 +155,9 @@ class SyncNode(dm.Node):
 
         class PropsRequest(request.CsRequestSync):
             def run(self):
+                props = self.node._props
                 for prop_name in sync_node._changed_props:
-                    sync_node[prop_name] = copy.copy(self.node[prop_name])
+                    sync_node._props[prop_name] = _snapshot(props[prop_name])
                 sync_node._changed_props.clear()
                 sync_node._has_changed = False
                 return True
@@ -168,6 +177,11 @@ class ViewInfo(dm.CsManager):
         self.target_ctx_map = {}
         self.event_queue = deque()
         self.running_events = False
+        # Node changes from the TCF thread, merged per node until run_events() applies them.
+        self._pending_changes = {}
+        self._pending_changes_lock = threading.Lock()
+        # Nodes with changed indexed properties, reindexed by the next index lookup.
+        self._stale_index_ctxs = {}  # ctx -> None, an ordered set
         mi = self
 
         class NodeListener(dm.NodeListener):
@@ -191,8 +205,9 @@ class ViewInfo(dm.CsManager):
                 mi.queue_event(mi._node_removed)  # notify view node listeners
 
             def node_changed(self, node: dm.Node, updated_keys: Set[str]):
-                log.view_info.info(f"{mi.name}: Changing node {node.ctx}: {updated_keys}")
-                mi.queue_event(mi.node_changed, node.ctx, copy.copy(updated_keys))
+                if log.is_domain_enabled("view_info", "INFO"):
+                    log.view_info.info(f"{mi.name}: Changing node {node.ctx}: {updated_keys}")
+                mi.queue_node_changed(node.ctx, updated_keys)
 
         cs_manager.add_node_listener(NodeListener())
 
@@ -219,7 +234,7 @@ class ViewInfo(dm.CsManager):
                     parent = self.cs_manager
                 elif isinstance(parent, str):
                     parent = self.cs_manager[parent]
-                mi.queue_event(mi.set_children, parent.ctx, parent.children)
+                mi.queue_event(mi.set_children, parent.ctx, tuple(parent.children))
                 for child in self.cs_manager.get_children(parent):
                     props = copy.copy(child.props)
                     mi.queue_event(
@@ -236,17 +251,40 @@ class ViewInfo(dm.CsManager):
         self.run_events()
 
     def queue_event(self, event, *args, **kwargs):
-        log.view_info.debug(f"{self.name}: queue_event {event}")
+        if log.is_domain_enabled("view_info", "DEBUG"):
+            log.view_info.debug(f"{self.name}: queue_event {event}")
         self.event_queue.appendleft((event, args, kwargs))
 
+    def queue_node_changed(self, ctx: str, updated_keys: Set[str]):
+        # Merges the keys into the pending change of the node. One event is queued per batch,
+        # which applies the changes of all nodes in the batch.
+        with self._pending_changes_lock:
+            should_queue = len(self._pending_changes) == 0
+            keys = self._pending_changes.get(ctx)
+            if keys is None:
+                self._pending_changes[ctx] = set(updated_keys)
+            else:
+                keys.update(updated_keys)
+        if should_queue:
+            self.queue_event(self._apply_node_changes)
+
+    def _apply_node_changes(self):
+        with self._pending_changes_lock:
+            pending_changes = self._pending_changes
+            self._pending_changes = {}
+        for ctx, updated_keys in pending_changes.items():
+            self.node_changed(ctx, updated_keys)
+
     def run_events(self):
         if self.running_events:
             return
+        debug_enabled = log.is_domain_enabled("view_info", "DEBUG")
         try:
             self.running_events = True
             while True:
                 event, args, kwargs = self.event_queue.pop()
-                log.view_info.debug(f"{self.name}: run_event {event}")
+                if debug_enabled:
+                    log.view_info.debug(f"{self.name}: run_event {event}")
                 event(*args, **kwargs)
         except IndexError:
             pass
@@ -258,6 +296,10 @@ class ViewInfo(dm.CsManager):
             sync_node = self[ctx]
             sync_node.add_changed_props(updated_keys)
             self._node_changed(sync_node)
+            if "node_cls" in updated_keys or not self.indexed_props.isdisjoint(updated_keys):
+                # Fetching the new values needs a round trip to the TCF thread, so it is left to
+                # the next index lookup instead of holding up the event loop.
+                self._stale_index_ctxs[ctx] = None
         except KeyError:
             pass
 
@@ -266,6 +308,28 @@ class ViewInfo(dm.CsManager):
             for listener in self._node_listeners:
                 listener.node_changed(node, node._changed_props)
 
+    def _index_class(self, node: dm.Node) -> type:
+        # Sync nodes are indexed by the class of the node they mirror
+        return node._props.get("node_cls", type(node))
+
+    def _reindex_stale_nodes(self):
+        self.run_events()
+        while self._stale_index_ctxs:
+            ctx = next(iter(self._stale_index_ctxs))
+            del self._stale_index_ctxs[ctx]
+            sync_node = self._nodes.get(ctx)
+            if sync_node is not None:
+                sync_node.update_changed_props()
+                self.index_node(sync_node)
+
+    def get_nodes_by_class(self, cls: Type[dm.Node]) -> List[dm.Node]:
+        self._reindex_stale_nodes()
+        return super(ViewInfo, self).get_nodes_by_class(cls)
+
+    def get_nodes_by_prop(self, key: str, value) -> List[dm.Node]:
+        self._reindex_stale_nodes()
+        return super(ViewInfo, self).get_nodes_by_prop(key, value)
+
     def get_sync_node(self, ctx: str, sync_node_cls: ClassVar[SyncNode]):
         return super().get_node(ctx, sync_node_cls)
 
@@ -275,6 +339,7 @@ class ViewInfo(dm.CsManager):
             sync_node = self.upgrade_node(sync_node, SyncNode)
         sync_node["node_cls"] = cls
         sync_node._props.update(props)
+        self.index_node(sync_node)
 
         if sync_node.ctx not in self.ctx_target_map.keys():
             self.ctx_target_map[sync_node.ctx] = self.next_target_id
@@ -358,8 +423,11 @@ class ViewInfo(dm.CsManager):
         """
         # nodes = [self.get_node(node.ctx, cls) for node in self.get_children(parent) if cls.is_compatible(node)]
         # return nodes
+        # Nodes already upgraded to the class are found in the class index and skip the
+        # compatibility check
+        upgraded_ctxs = {node.ctx for node in self.get_nodes_by_class(cls)}
         for node in self.get_children(parent):
-            if cls.is_compatible(node):
+            if node.ctx in upgraded_ctxs or cls.is_compatible(node):
                 yield self.get_node(node.ctx, cls)
 
     def print_tree(self, print_props: bool = False, printer: Callable[[str], None] = print):
@@ -40,7 +40,7 @@ CsManagerListener
 """
 
 import re
-from typing import Dict, Type, Any, List, Set, Tuple, NewType, Callable
+from typing import Dict, Type, Any, List, Set, Tuple, NewType, Callable, Iterable, Iterator
 from collections import deque
 from chipscopy.tcf import protocol
 
@@ -102,6 +102,57 @@ def parse_node_id(node_id: str) -> Tuple[str, str]:
     return mn, ctx
 
 
+class ChildSet(object):
+    """
+    Ordered set of child context handles of a |Node|.  Membership tests, append and remove take constant time.  Also
+    supports indexing and iteration like the list it replaces.  Iteration is over a snapshot, so the set may be
+    changed while iterating.
+    """
+
+    __slots__ = ("_ctxs", "_snapshot")
+
+    def __init__(self, ctxs: Iterable[str] = ()):
+        self._ctxs = dict.fromkeys(ctxs)
+        self._snapshot = None
+
+    def _get_snapshot(self) -> Tuple[str, ...]:
+        if self._snapshot is None:
+            self._snapshot = tuple(self._ctxs)
+        return self._snapshot
+
+    def __contains__(self, ctx) -> bool:
+        return ctx in self._ctxs
+
+    def __len__(self) -> int:
+        return len(self._ctxs)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_snapshot())
+
+    def __getitem__(self, index):
+        return self._get_snapshot()[index]
+
+    def __eq__(self, other):
+        if isinstance(other, ChildSet):
+            return self._get_snapshot() == other._get_snapshot()
+        return list(self._get_snapshot()) == other
+
+    def __repr__(self):
+        return repr(list(self._get_snapshot()))
+
+    def append(self, ctx: str):
+        if ctx not in self._ctxs:
+            self._ctxs[ctx] = None
+            self._snapshot = None
+
+    def remove(self, ctx: str):
+        try:
+            del self._ctxs[ctx]
+        except KeyError:
+            raise ValueError(f"{ctx} not in children")
+        self._snapshot = None
+
+
 class Node(object):
     """
     A node is a generic hardware Context.  Node base class provides storage for Context properties provided by the
@@ -126,7 +177,7 @@ class Node(object):
         self.ctx = ctx
         self.parent_ctx = parent_ctx
         self.manager = manager
-        self.children = []
+        self.children = ChildSet()
         self._props = {}
         self._updated_props = set()
         self.dirty = False
@@ -198,9 +249,10 @@ class Node(object):
         :param props: Properties to update.
         """
         self._props.update(props)
-        keys = set(props.keys())
-        if self.manager and keys not in self._updated_props:
-            self._updated_props.update(keys)
+        if self.manager:
+            if not self.manager.indexed_props.isdisjoint(props):
+                self.manager.index_node(self)
+            self._updated_props.update(props.keys())
             self._props_updated()
 
     def __getattr__(self, attr):
@@ -215,9 +267,12 @@ class Node(object):
 
     def __setitem__(self, key, value):
         self._props[key] = value
-        if self.manager and key not in self._updated_props:
-            self._updated_props.add(key)
-            self._props_updated()
+        if self.manager:
+            if key in self.manager.indexed_props:
+                self.manager.index_node(self)
+            if key not in self._updated_props:
+                self._updated_props.add(key)
+                self._props_updated()
 
     def __str__(self):
         return "{}({}, {} props)".format(self.__class__.__name__, self.ctx, len(self._props))
@@ -293,6 +348,9 @@ class CsManager(Node):
 
     node_auto_upgrader: NodeAutoUpgrader = None
 
+    indexed_props: frozenset = frozenset(("Name", "arch_name", "DNA"))
+    """Property keys with an index for fast lookups with :meth:`get_nodes_by_prop`"""
+
     def __init__(self, name: str = "", channel=None):
         super(CsManager, self).__init__(ctx="", manager=self)
         self.channel = channel
@@ -300,6 +358,13 @@ class CsManager(Node):
         self._node_listeners = []
         self._added_nodes = deque()
         self._removed_nodes = deque()
+        self._changed_nodes = {}  # ctx -> None, an ordered set of changed nodes
+        # Secondary indexes. Values are ordered sets of ctx, as dict keys.
+        self._ctxs_by_class: Dict[type, Dict[str, None]] = {}
+        self._ctxs_by_prop: Dict[str, Dict[Any, Dict[str, None]]] = {
+            key: {} for key in self.indexed_props
+        }
+        self._index_entries: Dict[str, Tuple[type, Dict[str, Any]]] = {}
         self.name = name
         self.default_node_cls = Node
         for listener in _manager_listeners:
@@ -331,6 +396,7 @@ class CsManager(Node):
         if props:
             node.props.update(props)
         self._nodes[ctx] = node
+        self.index_node(node)
 
         # add to parent's children if not already
         parent = self._nodes.get(parent_ctx)
@@ -357,6 +423,7 @@ class CsManager(Node):
             return
 
         node.invalid = True
+        self._unindex_node(ctx)
 
         # remove from parent
         parent = self._nodes.get(node.parent_ctx)
@@ -376,8 +443,8 @@ class CsManager(Node):
         """
         Removes all nodes from manager
         """
-        while self.children:
-            self.remove_node(self.children[0])
+        for child in self.children:
+            self.remove_node(child)
 
     def upgrade_node(self, node: Node, upgrade_cls: type, **kwargs) -> Node:
         """
@@ -391,6 +458,7 @@ class CsManager(Node):
         new = upgrade_cls(**kwargs)
         new.__dict__.update(node.__dict__)
         self._nodes[new.ctx] = new
+        self.index_node(new)
         new.post_init()
         node.invalid = True
         return new
@@ -408,6 +476,7 @@ class CsManager(Node):
             {key: node.__dict__[key] for key in node.__dict__ if key in new.__dict__}
         )
         self._nodes[new.ctx] = new
+        self.index_node(new)
         new.post_init()
         node.invalid = True
         return new
@@ -460,6 +529,77 @@ class CsManager(Node):
 
         return None
 
+    def _index_class(self, node: Node) -> type:
+        return type(node)
+
+    def index_node(self, node: Node):
+        """
+        Updates the class and property indexes of a node.  Called when a node is added, upgraded, or when an indexed
+        property is set through the node.
+
+        :param node: Node to index
+        """
+        if self._nodes.get(node.ctx) is not node or node is self:
+            return
+        self._unindex_node(node.ctx)
+        cls = self._index_class(node)
+        self._ctxs_by_class.setdefault(cls, {})[node.ctx] = None
+        indexed_values = {}
+        for key in self.indexed_props:
+            value = node._props.get(key)
+            if value is None:
+                continue
+            try:
+                self._ctxs_by_prop[key].setdefault(value, {})[node.ctx] = None
+            except TypeError:  # unhashable value
+                continue
+            indexed_values[key] = value
+        self._index_entries[node.ctx] = (cls, indexed_values)
+
+    def _unindex_node(self, ctx: str):
+        entry = self._index_entries.pop(ctx, None)
+        if not entry:
+            return
+        cls, indexed_values = entry
+        ctxs = self._ctxs_by_class[cls]
+        del ctxs[ctx]
+        if not ctxs:
+            del self._ctxs_by_class[cls]
+        for key, value in indexed_values.items():
+            ctxs = self._ctxs_by_prop[key][value]
+            del ctxs[ctx]
+            if not ctxs:
+                del self._ctxs_by_prop[key][value]
+
+    def get_nodes_by_class(self, cls: Type[Node]) -> List[Node]:
+        """
+        Gets nodes which are instances of a class, without walking the tree.  Nodes which are compatible but not yet
+        upgraded to the class are not included.
+
+        :param cls: Node class
+        :return: List of nodes
+        """
+        nodes = []
+        for node_cls, ctxs in self._ctxs_by_class.items():
+            if issubclass(node_cls, cls):
+                nodes.extend(self._nodes[ctx] for ctx in ctxs)
+        return nodes
+
+    def get_nodes_by_prop(self, key: str, value: Any) -> List[Node]:
+        """
+        Gets nodes with a property value.  Uses an index for keys in ``indexed_props``, otherwise searches all nodes.
+
+        :param key: Property key
+        :param value: Property value
+        :return: List of nodes
+        """
+        index = self._ctxs_by_prop.get(key)
+        if index is None:
+            return [
+                node for node in self.get_all() if node is not self and node.props.get(key) == value
+            ]
+        return [self._nodes[ctx] for ctx in index.get(value, ())]
+
     def set_children(self, parent: Node or str, children: List[str]):
         """
         Sets the children list of a parent node.  If existing child is not on the new list of children it is removed.
@@ -470,6 +610,7 @@ class CsManager(Node):
         if isinstance(parent, str):
             parent = self[parent]
 
+        children = ChildSet(children)
         remove_children = [child for child in parent.children if child not in children]
         for child in remove_children:
             self.remove_node(child)
@@ -478,16 +619,27 @@ class CsManager(Node):
 
     def notify_node_changed(self, node: Node):
         if self._node_listeners:
-            protocol.invokeLater(self._node_updated, node.ctx)
+            # Changes are sent to listeners in batches, once per dispatch cycle. A node is only
+            # in the batch once, with all keys updated since the last batch.
+            should_post = len(self._changed_nodes) == 0
+            self._changed_nodes[node.ctx] = None
+            if should_post:
+                protocol.invokeLater(self._nodes_updated)
         else:
             node.clear_update()
 
+    def _nodes_updated(self):
+        changed_nodes = self._changed_nodes
+        self._changed_nodes = {}
+        for node_ctx in changed_nodes:
+            self._node_updated(node_ctx)
+
     def _node_updated(self, node_ctx: str):
         node = self._nodes.get(node_ctx)
         if node:
             if node._updated_props:
+                node.call_listeners()
                 for listener in self._node_listeners:
-                    node.call_listeners()
                     listener.node_changed(node, node._updated_props)
             node.clear_update()
 
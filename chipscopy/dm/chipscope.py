@@ -70,7 +70,7 @@ class ChipScopeListener(CSListener):
         self.manager = manager
 
     def node_added(self, node_ctx, props):
-        log.dm.debug(f"{self.manager.name}: Adding Node {node_ctx}")
+        log.dm.debug("{}: Adding Node {}", self.manager.name, node_ctx)
         parent_ctx = props.get("parent_ctx")
         if not parent_ctx:
             parent_ctx = ""
@@ -79,7 +79,7 @@ class ChipScopeListener(CSListener):
         self.manager._node_added()  # send notifications immediately
 
     def node_changed(self, node_ctx, props):
-        log.dm.debug(f"{self.manager.name}: Changing Node {node_ctx}: {props}")
+        log.dm.debug("{}: Changing Node {}: {}", self.manager.name, node_ctx, props)
         try:
             node = self.manager[node_ctx]
             node.update(props)
@@ -96,7 +96,7 @@ class ChipScopeListener(CSListener):
             self.manager._node_added()  # send notifications immediately
 
     def node_removed(self, node_ctx):
-        log.dm.debug(f"{self.manager.name}: Removing Node {node_ctx}")
+        log.dm.debug("{}: Removing Node {}", self.manager.name, node_ctx)
         try:
             node = self.manager[node_ctx]
             # node.invalidate()
@@ -88,7 +88,7 @@ class DebugNodeListener(dc_service.DebugNodeListener):
 
     def node_added(self, node_ctx, props):
         if log.is_domain_enabled("dm", "DEBUG"):
-            log.dm.debug(f"{self.manager.name}: Adding Node {node_ctx}: {props}")
+            log.dm.debug("{}: Adding Node {}: {}", self.manager.name, node_ctx, props)
         parent_ctx = props.get("ParentID")
         if not parent_ctx:
             parent_ctx = ""
@@ -101,7 +101,7 @@ class DebugNodeListener(dc_service.DebugNodeListener):
 
     def node_changed(self, node_ctx, props):
         if id_domain_enable("dm", "DEBUG"):
-            log.dm.debug(f"{self.manager.name}: Changing Node {node_ctx}: {props}")
+            log.dm.debug("{}: Changing Node {}: {}", self.manager.name, node_ctx, props)
         parent_ctx = props.get("ParentID")
         if not parent_ctx:
             parent_ctx = ""
@@ -113,7 +113,7 @@ class DebugNodeListener(dc_service.DebugNodeListener):
                 node.update(additional_props)
 
     def node_removed(self, node_ctx):
-        log.dm.debug(f"{self.manager.name}: Removing Node {node_ctx}")
+        log.dm.debug("{}: Removing Node {}", self.manager.name, node_ctx)
         try:
             node = self.manager[node_ctx]
 
@@ -133,7 +133,12 @@ class CsRequest(object):
         self.called = True
 
         log.request.info(
-            f"Starting request {self} {self.cs_manager} {self.node_id} {self.node_cls} {self.run_args}"
+            "Starting request {} {} {} {} {}",
+            self,
+            self.cs_manager,
+            self.node_id,
+            self.node_cls,
+            self.run_args,
         )
 
         if not protocol.isDispatchThread():
@@ -144,7 +149,7 @@ class CsRequest(object):
 
     def _invoke(self):
         if not self.cs_manager.is_ready:
-            log.request.debug(f"cs_manager not ready {self}")
+            log.request.debug("cs_manager not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
@@ -157,11 +162,11 @@ class CsRequest(object):
         request_queue = self.get_request_queue(node)
 
         if not request_queue.is_first(self):
-            log.request.info(f"Queuing {self} {node.queue_group}")
+            log.request.info("Queuing {} {}", self, node.queue_group)
             return
 
         if not node.is_ready:
-            log.request.debug(f"Node not ready {self}")
+            log.request.debug("Node not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
@@ -181,14 +186,14 @@ class CsRequest(object):
             return
 
         if not node.is_ready:
-            log.request.debug(f"Node class switch not ready {self}")
+            log.request.debug("Node class switch not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
         self.node = node
         args, kwargs = self.run_args
         try:
-            log.request.info(f"Running {self} {self.run}")
+            log.request.info("Running {} {}", self, self.run)
             result = self.run(*args, **kwargs)
             if result is not None:
                 self.result = result
@@ -219,13 +224,13 @@ class CsRequest(object):
             kwargs["progress_update"] = self.progress_update
 
         if self.run_func:
-            log.request.debug(f"Run func {self.run_func} ({args}, {kwargs}")
+            log.request.debug("Run func {} ({}, {}", self.run_func, args, kwargs)
             self.run_func(*args, **kwargs)
         else:
             self.error = Exception("No run function set for request")
 
     def done_run(self, token=None, error=None, result=None):
-        log.request.info(f"Done Run {self} {error} {result}")
+        log.request.info("Done Run {} {} {}", self, error, result)
         self.run_func = self.default_run_func
         if self.request_queue:
             self.request_queue.done_request(self)
@@ -234,7 +239,7 @@ class CsRequest(object):
         self.called = False
 
     def progress_update(self, result=None):
-        log.request.info(f"Progress Update {self} {result}")
+        log.request.info("Progress Update {} {}", self, result)
         self.run_func = self.default_run_func
         if self.progress:
             self.progress(result)
@@ -285,7 +290,7 @@ class CsRequestSync(CsRequest):
                         # Case 5
                         should_wait = False
 
-        log.request.info(f"Request sync start {self} timeout {timeout}")
+        log.request.info("Request sync start {} timeout {}", self, timeout)
         if not should_wait:
             super(CsRequestSync, self).__call__(*args, **kwargs)
             return self
@@ -294,7 +299,7 @@ class CsRequestSync(CsRequest):
             super(CsRequestSync, self).__call__(*args, **kwargs)
             completed = self.cond.wait(timeout)
         log.request.debug(
-            f"Request sync done {self.error} {self.result} completed {completed} {self}"
+            "Request sync done {} {} completed {} {}", self.error, self.result, completed, self
         )
         if self.error:
             if isinstance(self.error, str):
@@ -508,7 +513,7 @@ class CsFutureSync(CsFuture):
             self.timeout = timeout
         completed = self.cond.wait(self.timeout)
         log.request.debug(
-            f"Request sync done {self._error} {self._result} completed {completed} {self}"
+            "Request sync done {} {} completed {} {}", self._error, self._result, completed, self
         )
         if not completed and not self._error:
             self.cancel()
@@ -562,7 +567,12 @@ class CsFutureRequest(CsFuture):
         self.called = True
 
         log.request.info(
-            f"Starting request {self} {self.cs_manager} {self.node_id} {self.node_cls} {self.run_args}"
+            "Starting request {} {} {} {} {}",
+            self,
+            self.cs_manager,
+            self.node_id,
+            self.node_cls,
+            self.run_args,
         )
 
         if not protocol.isDispatchThread():
@@ -573,7 +583,7 @@ class CsFutureRequest(CsFuture):
 
     def _invoke(self):
         if not self.cs_manager.is_ready:
-            log.request.debug(f"cs_manager not ready {self}")
+            log.request.debug("cs_manager not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
@@ -586,11 +596,11 @@ class CsFutureRequest(CsFuture):
         request_queue = self.get_request_queue(node)
 
         if not request_queue.is_first(self):
-            log.request.info(f"Queuing {self} {node.queue_group}")
+            log.request.info("Queuing {} {}", self, node.queue_group)
             return
 
         if not node.is_ready:
-            log.request.debug(f"Node not ready {self}")
+            log.request.debug("Node not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
@@ -607,14 +617,14 @@ class CsFutureRequest(CsFuture):
             return
 
         if not node.is_ready:
-            log.request.debug(f"Node class switch not ready {self}")
+            log.request.debug("Node class switch not ready {}", self)
             protocol.invokeLaterWithDelay(1, self._invoke)
             return
 
         self.node = node
         args, kwargs = self.run_args
         try:
-            log.request.info(f"Running {self} {self.run}")
+            log.request.info("Running {} {}", self, self.run)
             node.request = self
             result = self.run(*args, **kwargs)
             if result is not None:
@@ -656,7 +666,7 @@ class CsFutureRequest(CsFuture):
 
         result = None
         if self.run_func:
-            log.request.debug(f"Run func {self.run_func} ({args}, {kwargs}")
+            log.request.debug("Run func {} ({}, {}", self.run_func, args, kwargs)
             result = self.run_func(*args, **kwargs)
             if not self.node.is_ready:
                 result = None
@@ -665,7 +675,7 @@ class CsFutureRequest(CsFuture):
         return result
 
     def _invoke_done(self):
-        log.request.info(f"Done Run {self}")
+        log.request.info("Done Run {}", self)
         super()._invoke_done()
         self.node.request = None
         self.run_func = None
@@ -715,7 +725,7 @@ class CsFutureRequestSync(CsFutureRequest):
             self.timeout = timeout
         completed = self.cond.wait(self.timeout)
         log.request.debug(
-            f"Request sync done {self._error} {self._result} completed {completed} {self}"
+            "Request sync done {} {} completed {} {}", self._error, self._result, completed, self
         )
         if not completed and not self._error:
             self.cancel()
@@ -757,7 +767,7 @@ class CsFutureRequestSync(CsFutureRequest):
                 if done_index is not None and len(args) > done_index:
                     should_wait = False
 
-        log.request.info(f"Request sync start {self} timeout {self.timeout}")
+        log.request.info("Request sync start {} timeout {}", self, self.timeout)
 
         super(CsFutureRequestSync, self).__call__(*args, **kwargs)
 
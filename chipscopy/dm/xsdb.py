@@ -73,7 +73,7 @@ class XsdbNodeListener(dc_service.XsdbNodeListener):
 
     def node_added(self, node_ctx, props):
         if log.is_domain_enabled("dm", "DEBUG"):
-            log.dm.debug(f"{self.manager.name}: Adding Node {node_ctx}: {props}")
+            log.dm.debug("{}: Adding Node {}: {}", self.manager.name, node_ctx, props)
         parent_ctx = props.get("ParentID")
         if not parent_ctx:
             parent_ctx = ""
@@ -85,7 +85,7 @@ class XsdbNodeListener(dc_service.XsdbNodeListener):
 
     def node_changed(self, node_ctx, props):
         if id_domain_enable("dm", "DEBUG"):
-            log.dm.debug(f"{self.manager.name}: Changing Node {node_ctx}: {props}")
+            log.dm.debug("{}: Changing Node {}: {}", self.manager.name, node_ctx, props)
         parent_ctx = props.get("ParentID")
         if not parent_ctx:
             parent_ctx = ""
@@ -96,7 +96,7 @@ class XsdbNodeListener(dc_service.XsdbNodeListener):
             node.update(additional_props)
 
     def node_removed(self, node_ctx):
-        log.dm.debug(f"{self.manager.name}: Removing Node {node_ctx}")
+        log.dm.debug("{}: Removing Node {}", self.manager.name, node_ctx)
         try:
             node = self.manager[node_ctx]
             # node.invalidate()
@@ -27,11 +27,13 @@ class EventQueue(object):
         self.__on_shutdown = on_shutdown
         self.__lock = threading.Condition()
         self.__queue = []
+        self.profiler = None
 
     def start(self):
         self.__thread.start()
 
     def shutdown(self):
+        self.stopProfiler()
         try:
             if self.__on_shutdown:
                 self.__on_shutdown()
@@ -64,10 +66,15 @@ class EventQueue(object):
                         self.__is_waiting = True
                         self.__lock.wait()
                     r, args, kwargs = self.__queue.pop(0)
+                    queue_depth = len(self.__queue)
                 if log.is_domain_enabled("events", "DEBUG"):
                     str_args = ",".join(str(arg) for arg in args)
                     log.events.debug(f"{str(r)}({str_args},{kwargs})")
-                r(*args, **kwargs)
+                profiler = self.profiler
+                if profiler is None:
+                    r(*args, **kwargs)
+                else:
+                    profiler.run(r, args, kwargs, queue_depth)
             except Exception as x:
                 self.__error(x)
 
@@ -81,6 +88,30 @@ class EventQueue(object):
                 self.__is_waiting = False
                 self.__lock.notify_all()
 
+    def startProfiler(self, **kwargs):
+        """
+        Start profiling the callbacks run by the dispatch thread.
+        @param kwargs - DispatchProfiler arguments, e.g. slow_threshold.
+        @return the DispatchProfiler.
+        """
+        from .profiler import DispatchProfiler
+        self.stopProfiler()
+        profiler = DispatchProfiler(**kwargs)
+        profiler.startWatchdog(self.__thread)
+        self.profiler = profiler
+        return profiler
+
+    def stopProfiler(self):
+        """
+        Stop profiling. The stopped profiler keeps its results.
+        @return the stopped DispatchProfiler, or None.
+        """
+        profiler = self.profiler
+        self.profiler = None
+        if profiler:
+            profiler.stopWatchdog()
+        return profiler
+
     def isDispatchThread(self):
         return threading.current_thread() is self.__thread
 
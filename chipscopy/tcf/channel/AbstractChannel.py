@@ -20,6 +20,7 @@ from .. import compat, protocol, transport, services, peer, errors
 from ..services import locator
 from ..channel import STATE_CLOSED, STATE_OPEN, STATE_OPENING
 from ..channel import Token, fromJSONSequence, toJSONSequence, ChannelListener
+from . import metrics as channel_metrics
 
 EOS = -1  # End Of Stream
 EOM = -2  # End Of Message
@@ -37,11 +38,27 @@ class Message(object):
         self.is_sent = None
         self.token = None
         self.trace = ()
+        self.send_time = None
+        self.receive_time = None
 
     def __str__(self):
         return "%s %s %s %s" % (self.type, str(self.token), self.service, self.name)
 
 
+def _messageSize(msg):
+    # Size of the message on the wire, without escape bytes
+    size = 3  # type, separator and end of message
+    if msg.token is not None:
+        size += len(msg.token.getID()) + 1
+    if msg.service:
+        size += len(msg.service) + 1
+    if msg.name:
+        size += len(msg.name) + 1
+    if msg.data:
+        size += len(msg.data)
+    return size
+
+
 class ReaderThread(threading.Thread):
     def __init__(self, channel, handleInput):
         super(ReaderThread, self).__init__(name="TCF Reader Thread")
@@ -110,6 +127,10 @@ class ReaderThread(threading.Thread):
                     msg.data = self.readBytes(EOM)
                 else:
                     self.error()
+                metrics = self.channel.metrics
+                if metrics is not None:
+                    msg.receive_time = time.perf_counter()
+                    metrics.onMessageReceived(_messageSize(msg))
                 protocol.invokeLater(self.handleInput, msg)
                 delay = self.channel.local_congestion_level
                 if delay > 0:
@@ -148,6 +169,9 @@ class AbstractChannel(object):
     .. see also: see StreamChannel for stream oriented transport protocols.
     """
 
+    # ChannelMetrics, when enabled - see enableMetrics()
+    metrics = None
+
     def __init__(self, remote_peer, local_peer=None):
         self.remote_peer = remote_peer
         self.local_peer = local_peer  # TODO
@@ -180,6 +204,8 @@ class AbstractChannel(object):
         self.local_service_by_class = {}
         self.trace_listeners = []
         self.linked_channels = {}
+        if channel_metrics.enabled_by_default:
+            self.enableMetrics()
 
     def add_linked_channel(self, other_channel):
         channel = self
@@ -234,6 +260,9 @@ class AbstractChannel(object):
                 if msg.data:
                     self.write(msg.data)
                 self.write(EOM)
+                metrics = self.metrics
+                if metrics is not None:
+                    metrics.onMessageSent(_messageSize(msg))
                 delay = 0
                 level = self.remote_congestion_level
                 if level > 0:
@@ -405,6 +434,47 @@ class AbstractChannel(object):
     def getState(self):
         return self.state
 
+    def enableMetrics(self):
+        """
+        Start collecting channel metrics: command round trip latency, traffic,
+        in-flight commands and event queue wait time.
+        @return ChannelMetrics of this channel.
+        """
+        if self.metrics is None:
+            name = self.remote_peer.getID() if self.remote_peer else ""
+            self.metrics = channel_metrics.ChannelMetrics(name)
+        return self.metrics
+
+    def disableMetrics(self):
+        self.metrics = None
+
+    def getMetrics(self):
+        """
+        Snapshot of the channel metrics as a dict, including the current
+        congestion levels.
+        @return metrics dict, or None if metrics are not enabled.
+        """
+        metrics = self.metrics
+        if metrics is None:
+            return None
+        return metrics.snapshot(self.getCongestionLevels())
+
+    def getCongestionLevels(self):
+        """
+        Current congestion levels, -100..100. Can be called from any thread.
+        - local: in-bound congestion reported to the peer
+        - remote: congestion reported by the peer
+        - pending_commands: commands waiting for a result vs. the limit
+        """
+        out_tokens = getattr(self, "out_tokens", None) or {}
+        limit = getattr(self, "pending_command_limit", 32)
+        pending = len(out_tokens) * 100 / limit - 100
+        return {
+            "local": getattr(self, "local_congestion_level", -100),
+            "remote": getattr(self, "remote_congestion_level", -100),
+            "pending_commands": int(min(pending, 100)),
+        }
+
     def addChannelListener(self, listener):
         assert protocol.isDispatchThread()
         assert listener
@@ -652,6 +722,9 @@ class AbstractChannel(object):
         token = CancelableToken(listener)
         msg.token = token
         self.out_tokens[token.getID()] = msg
+        if self.metrics is not None:
+            msg.send_time = time.perf_counter()
+            self.metrics.onCommandSent(len(self.out_tokens))
         self.addToOutQueue(msg)
         return token
 
@@ -713,6 +786,9 @@ class AbstractChannel(object):
             return
         if self.trace_listeners:
             self.__traceMessageReceived(msg)
+        metrics = self.metrics
+        if metrics is not None and msg.receive_time is not None:
+            metrics.onDispatchWait(time.perf_counter() - msg.receive_time)
         try:
             token = None
             typeCode = msg.type
@@ -723,6 +799,11 @@ class AbstractChannel(object):
                     raise Exception("Invalid token received: " + token_id)
                 if typeCode != 'P':
                     del self.out_tokens[token_id]
+                    if metrics is not None and cmd.send_time is not None:
+                        metrics.onCommandDone(
+                            cmd.service, cmd.name,
+                            time.perf_counter() - cmd.send_time,
+                            len(self.out_tokens), typeCode == 'N')
                 token = cmd.token
             if typeCode == 'C':
                 if self.state == STATE_OPENING:
@@ -783,6 +864,8 @@ class AbstractChannel(object):
                                              x)
                         self.notifying_channel_opened = False
                 else:
+                    if metrics is not None:
+                        metrics.onEventReceived(msg.service, msg.name)
                     lst = self.event_listeners.get(msg.service)
                     if lst:
                         for l in lst:
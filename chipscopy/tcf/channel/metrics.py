@@ -0,0 +1,269 @@
+# *****************************************************************************
+# * Copyright (C) 2026, Advanced Micro Devices, Inc., All rights reserved.
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *     http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *****************************************************************************
+"""
+Channel metrics - command round trip latency, traffic and queueing of a TCF
+channel.
+
+Metrics are off by default. Enable them for one channel, or for every new
+channel with the CHIPSCOPY_TCF_METRICS=1 environment variable::
+
+    metrics = session.hw_server.channel.enableMetrics()
+    ...
+    print(metrics.toJSON())
+    print(metrics.toPrometheus())
+
+Round trip latency of a command is measured from sendCommand() to the
+dispatch of its result. Dispatch wait is the time a received message waits in
+the event queue before it is handled. A long round trip with a short dispatch
+wait points at the server or the network, a long dispatch wait at the client.
+"""
+
+import bisect
+import json
+import os
+import threading
+import time
+
+enabled_by_default = os.environ.get("CHIPSCOPY_TCF_METRICS", "") == "1"
+
+# Upper bounds of the histogram buckets in seconds. The last bucket is +Inf.
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram(object):
+    """Fixed bucket histogram of durations in seconds. Not thread safe."""
+
+    __slots__ = ("counts", "count", "sum", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """
+        Estimate of the p-th percentile (0..100), as the upper bound of the
+        bucket containing it. Returns None if nothing was observed.
+        """
+        if not self.count:
+            return None
+        rank = self.count * p / 100.0
+        total = 0
+        for idx, cnt in enumerate(self.counts):
+            total += cnt
+            if total >= rank and cnt:
+                if idx < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[idx], self.max)
+                return self.max
+        return self.max
+
+    def toDict(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": dict(zip([str(b) for b in LATENCY_BUCKETS] + ["+Inf"],
+                                self.counts)),
+        }
+
+
+class ChannelMetrics(object):
+    """
+    Metrics of one channel. Updated from the reader, writer and dispatch
+    threads, so all updates take a lock.
+    """
+
+    def __init__(self, name=""):
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.start_time = time.time()
+            self.command_latency = {}   # (service, command) -> histogram
+            self.dispatch_wait = LatencyHistogram()
+            self.events_received = {}   # (service, event) -> count
+            self.messages_sent = 0
+            self.messages_received = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.commands_sent = 0
+            self.commands_rejected = 0
+            self.in_flight = 0
+            self.in_flight_peak = 0
+
+    def onCommandSent(self, in_flight):
+        with self._lock:
+            self.commands_sent += 1
+            self.in_flight = in_flight
+            if in_flight > self.in_flight_peak:
+                self.in_flight_peak = in_flight
+
+    def onCommandDone(self, service, name, seconds, in_flight,
+                      rejected=False):
+        key = (service, name)
+        with self._lock:
+            histogram = self.command_latency.get(key)
+            if histogram is None:
+                histogram = self.command_latency[key] = LatencyHistogram()
+            histogram.observe(seconds)
+            self.in_flight = in_flight
+            if rejected:
+                self.commands_rejected += 1
+
+    def onEventReceived(self, service, name):
+        key = (service, name)
+        with self._lock:
+            self.events_received[key] = self.events_received.get(key, 0) + 1
+
+    def onDispatchWait(self, seconds):
+        with self._lock:
+            self.dispatch_wait.observe(seconds)
+
+    def onMessageSent(self, size):
+        with self._lock:
+            self.messages_sent += 1
+            self.bytes_sent += size
+
+    def onMessageReceived(self, size):
+        with self._lock:
+            self.messages_received += 1
+            self.bytes_received += size
+
+    def snapshot(self, congestion=None):
+        """
+        Copy of the metrics as a dict of plain types.
+        @param congestion - optional dict of congestion levels to include.
+        """
+        with self._lock:
+            result = {
+                "channel": self.name,
+                "uptime": time.time() - self.start_time,
+                "messages_sent": self.messages_sent,
+                "messages_received": self.messages_received,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "commands_sent": self.commands_sent,
+                "commands_rejected": self.commands_rejected,
+                "in_flight": self.in_flight,
+                "in_flight_peak": self.in_flight_peak,
+                "dispatch_wait": self.dispatch_wait.toDict(),
+                "commands": {
+                    "%s.%s" % key: histogram.toDict()
+                    for key, histogram in sorted(self.command_latency.items())
+                },
+                "events": {
+                    "%s.%s" % key: cnt
+                    for key, cnt in sorted(self.events_received.items())
+                },
+            }
+        if congestion:
+            result["congestion"] = congestion
+        return result
+
+    def toJSON(self, congestion=None, indent=2):
+        return json.dumps(self.snapshot(congestion), indent=indent)
+
+    def toPrometheus(self, congestion=None, prefix="chipscopy_tcf"):
+        """Metrics in the Prometheus text exposition format."""
+        snap = self.snapshot(congestion)
+        channel = _label_value(self.name)
+        lines = []
+
+        def metric(name, value, help_text, kind="counter"):
+            lines.append("# HELP %s_%s %s" % (prefix, name, help_text))
+            lines.append("# TYPE %s_%s %s" % (prefix, name, kind))
+            lines.append('%s_%s{channel="%s"} %s' %
+                         (prefix, name, channel, value))
+
+        metric("messages_sent_total", snap["messages_sent"],
+                "Messages sent")
+        metric("messages_received_total", snap["messages_received"],
+                "Messages received")
+        metric("bytes_sent_total", snap["bytes_sent"], "Bytes sent")
+        metric("bytes_received_total", snap["bytes_received"],
+                "Bytes received")
+        metric("commands_rejected_total", snap["commands_rejected"],
+                "Commands rejected by the peer")
+        metric("commands_in_flight", snap["in_flight"],
+                "Commands waiting for a result", "gauge")
+        for level_name, level in sorted((congestion or {}).items()):
+            metric("congestion_%s" % level_name, level,
+                    "Congestion level, -100..100", "gauge")
+
+        def histogram(name, help_text, items):
+            lines.append("# HELP %s_%s %s" % (prefix, name, help_text))
+            lines.append("# TYPE %s_%s histogram" % (prefix, name))
+            for labels, hist in items:
+                total = 0
+                bounds = [repr(b) for b in LATENCY_BUCKETS] + ["+Inf"]
+                for bound, cnt in zip(bounds, hist.counts):
+                    total += cnt
+                    lines.append('%s_%s_bucket{%s,le="%s"} %d' %
+                                 (prefix, name, labels, bound, total))
+                lines.append("%s_%s_sum{%s} %r" %
+                             (prefix, name, labels, hist.sum))
+                lines.append("%s_%s_count{%s} %d" %
+                             (prefix, name, labels, hist.count))
+
+        with self._lock:
+            latency_items = [
+                ('channel="%s",service="%s",command="%s"' %
+                 (channel, _label_value(service), _label_value(command)),
+                 _copy_histogram(hist))
+                for (service, command), hist in
+                sorted(self.command_latency.items())]
+            wait_items = [('channel="%s"' % channel,
+                           _copy_histogram(self.dispatch_wait))]
+        histogram("command_latency_seconds",
+                  "Command round trip latency", latency_items)
+        histogram("dispatch_wait_seconds",
+                  "Time received messages wait in the event queue",
+                  wait_items)
+        return "\n".join(lines) + "\n"
+
+
+def _copy_histogram(hist):
+    copy = LatencyHistogram()
+    copy.counts = list(hist.counts)
+    copy.count = hist.count
+    copy.sum = hist.sum
+    copy.min = hist.min
+    copy.max = hist.max
+    return copy
+
+
+def _label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"') \
+        .replace("\n", "\\n")
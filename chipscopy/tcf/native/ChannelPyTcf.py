@@ -13,6 +13,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import time
+
 import pytcf
 from .. import protocol
 from .. import services
@@ -20,6 +22,7 @@ from ..peer import Peer
 from .. import _parse_params
 from ..channel.AbstractChannel import AbstractChannel, ChannelListener
 from ..channel import STATE_OPEN
+from ..channel import metrics as channel_metrics
 
 _listeners_active = False
 
@@ -44,6 +47,8 @@ class ChannelPyTcf(AbstractChannel, pytcf.ChannelInfo):
         self.state = STATE_OPEN
         services.onChannelOpened(self, self.services, self.remote_service_by_name)
         self.__makeServiceByClassMap(self.remote_service_by_name, self.remote_service_by_class)
+        if channel_metrics.enabled_by_default:
+            self.enableMetrics()
 
     # @property
     # def is_closed(self):
@@ -54,8 +59,14 @@ class ChannelPyTcf(AbstractChannel, pytcf.ChannelInfo):
 
     def sendCommand(self, service, name, args, listener):
         s = self.remote_service_by_name.get(service)
+        metrics = self.metrics
+        if metrics is not None:
+            send_time = time.perf_counter()
+            metrics.onCommandSent(0)
 
         def done(token, error, args):
+            if metrics is not None:
+                metrics.onCommandDone(str(service), name, time.perf_counter() - send_time, 0)
             listener.done(error, args)
 
         listener.token = s.send_command(name, args, done)
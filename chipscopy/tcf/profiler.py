@@ -0,0 +1,224 @@
+# *****************************************************************************
+# * Copyright (C) 2026, Advanced Micro Devices, Inc., All rights reserved.
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *     http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *****************************************************************************
+"""
+Dispatch thread profiler for the TCF EventQueue.
+
+All TCF callbacks run on one dispatch thread, so one slow callback delays
+every channel. The profiler records the execution time of each callback by
+qualified name, the queue depth over time and the slowest calls. A watchdog
+thread warns, with the stack of the dispatch thread, while a callback runs
+longer than a threshold::
+
+    profiler = protocol.getEventQueue().startProfiler(slow_threshold=0.05)
+    ...
+    print(profiler.report())
+    protocol.getEventQueue().stopProfiler()
+
+Only the python event queue can be profiled, not the native pytcf one.
+"""
+
+import heapq
+import sys
+import threading
+import time
+import traceback
+
+from chipscopy.utils.ring_buffer import RingBuffer
+from . import protocol
+
+
+def callbackName(r):
+    """Qualified name of a callable, e.g. module.Class.method"""
+    func = getattr(r, "__func__", r)
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        # Callable object
+        func = type(r)
+        qualname = func.__qualname__
+    module = getattr(func, "__module__", None)
+    return "%s.%s" % (module, qualname) if module else qualname
+
+
+class _HandlerStats(object):
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class DispatchProfiler(object):
+    """
+    Records callback execution times on the dispatch thread.
+
+    @param slow_threshold - seconds. Callbacks running longer are logged as
+           a warning, by the watchdog while they run. None disables warnings.
+    @param top_n - number of slowest calls to keep.
+    @param depth_samples - number of queue depth samples to keep.
+    @param sample_interval - minimum seconds between queue depth samples.
+    """
+
+    def __init__(self, slow_threshold=0.1, top_n=20, depth_samples=10000,
+                 sample_interval=0.01):
+        self.slow_threshold = slow_threshold
+        self.top_n = top_n
+        self.sample_interval = sample_interval
+        self._lock = threading.Lock()
+        self._names = {}  # id(code or type) -> (code or type, name)
+        self._current = None  # (call_id, name, start) of the running callback
+        self._call_id = 0
+        self._dispatch_thread_id = None
+        self._watchdog = None
+        self._watchdog_stop = threading.Event()
+        self.queue_depth = RingBuffer(depth_samples, {"time": "d", "depth": "L"})
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.start_time = time.time()
+            self._stats = {}  # name -> _HandlerStats
+            self._slowest = []  # min heap of (duration, call_id, name, time)
+            self._last_sample = 0.0
+            self.queue_depth.clear()
+
+    def _name(self, r):
+        # Names are cached by code object or type, which are long lived.
+        # Closures created for each call share the code object.
+        func = getattr(r, "__func__", r)
+        if hasattr(func, "__qualname__"):
+            key = getattr(func, "__code__", func)
+        else:
+            key = type(r)
+        entry = self._names.get(id(key))
+        if entry is None or entry[0] is not key:
+            entry = (key, callbackName(r))
+            self._names[id(key)] = entry
+        return entry[1]
+
+    def run(self, r, args, kwargs, queue_depth):
+        """Run one callback on the dispatch thread and record it."""
+        name = self._name(r)
+        self._call_id += 1
+        call_id = self._call_id
+        start = time.perf_counter()
+        if start - self._last_sample >= self.sample_interval:
+            self._last_sample = start
+            self.queue_depth.append(time.time(), queue_depth)
+        self._current = (call_id, name, start)
+        try:
+            r(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            self._current = None
+            self._record(call_id, name, duration)
+
+    def _record(self, call_id, name, duration):
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _HandlerStats()
+            stats.count += 1
+            stats.total += duration
+            if duration > stats.max:
+                stats.max = duration
+            entry = (duration, call_id, name, time.time())
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, entry)
+            elif duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def startWatchdog(self, dispatch_thread):
+        """Start the watchdog thread, if a slow_threshold is set."""
+        self._dispatch_thread_id = dispatch_thread.ident
+        if self.slow_threshold is None or self._watchdog:
+            return
+        self._watchdog_stop.clear()
+        self._watchdog = threading.Thread(target=self._watch,
+                                          name="TCF Dispatch Watchdog")
+        self._watchdog.daemon = True
+        self._watchdog.start()
+
+    def stopWatchdog(self):
+        self._watchdog_stop.set()
+        if self._watchdog:
+            self._watchdog.join()
+            self._watchdog = None
+
+    def _watch(self):
+        warned_call_id = None
+        interval = max(self.slow_threshold / 2.0, 0.001)
+        while not self._watchdog_stop.wait(interval):
+            current = self._current
+            if current is None:
+                continue
+            call_id, name, start = current
+            elapsed = time.perf_counter() - start
+            if elapsed < self.slow_threshold or call_id == warned_call_id:
+                continue
+            warned_call_id = call_id
+            frame = sys._current_frames().get(self._dispatch_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=8)) \
+                if frame is not None else ""
+            protocol.log("TCF dispatch thread blocked for %.3f s in %s\n%s" %
+                         (elapsed, name, stack))
+
+    def getStats(self):
+        """
+        Execution time per callback name, sorted by total time.
+        @return list of dicts with name, count, total, mean and max seconds.
+        """
+        with self._lock:
+            items = [(name, s.count, s.total, s.max)
+                     for name, s in self._stats.items()]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return [{"name": name, "count": count, "total": total,
+                 "mean": total / count, "max": max_}
+                for name, count, total, max_ in items]
+
+    def getSlowest(self):
+        """
+        The slowest calls, slowest first.
+        @return list of dicts with name, duration and time of the call.
+        """
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [{"name": name, "duration": duration, "time": when}
+                for duration, _, name, when in entries]
+
+    def getQueueDepth(self):
+        """
+        Queue depth samples, oldest first.
+        @return dict with "time" and "depth" arrays.
+        """
+        return self.queue_depth.to_dict()
+
+    def report(self, top=20):
+        """Text table of the callbacks with the most total time."""
+        stats = self.getStats()[:top]
+        depth = self.queue_depth.get_column("depth")
+        lines = ["Dispatch thread profile over %.1f s" %
+                 (time.time() - self.start_time)]
+        if depth:
+            lines.append("Queue depth: max %d, mean %.1f" %
+                         (max(depth), sum(depth) / len(depth)))
+        lines.append("%10s %10s %10s %10s  %s" %
+                     ("calls", "total ms", "mean ms", "max ms", "callback"))
+        for s in stats:
+            lines.append("%10d %10.1f %10.3f %10.3f  %s" %
+                         (s["count"], s["total"] * 1000.0, s["mean"] * 1000.0,
+                          s["max"] * 1000.0, s["name"]))
+        return "\n".join(lines)
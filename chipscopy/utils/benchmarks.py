@@ -0,0 +1,104 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Micro benchmarks for chipscopy startup and logging overhead. No hardware is needed.
+
+::
+
+    python -m chipscopy.utils.benchmarks
+"""
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Dict, List
+
+DEFAULT_IMPORT_STATEMENTS = [
+    "import chipscopy",
+    "import chipscopy.client",
+    "from chipscopy import create_session",
+    "import chipscopy._cli._chipscopy",
+]
+
+
+def import_time(statement: str, repeat: int = 5) -> float:
+    """
+    Median time in seconds of running an import statement in a new python process.
+    The time of starting python itself is not included.
+
+    Args:
+        statement (str): e.g. "import chipscopy"
+        repeat (int): Number of processes to start.
+    """
+    code = (
+        "import time; _start = time.perf_counter(); "
+        f"{statement}; "
+        "print(time.perf_counter() - _start)"
+    )
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        times.append(float(output.split()[-1]))
+    return statistics.median(times)
+
+
+def benchmark_imports(statements: List[str] = None, repeat: int = 5) -> Dict[str, float]:
+    """Median import time in seconds, for each statement."""
+    if statements is None:
+        statements = DEFAULT_IMPORT_STATEMENTS
+    return {statement: import_time(statement, repeat) for statement in statements}
+
+
+def benchmark_disabled_logging(number: int = 200000) -> Dict[str, float]:
+    """
+    Time in ns per call of logging to a disabled domain, in the styles used in hot paths.
+    "baseline" is the loop without a log call.
+    """
+    from chipscopy.utils.logger import log
+
+    domain = "benchmark"
+    if domain not in log.domain_enabled:
+        log.register_domain(domain)
+    log.disable_domain(domain)
+
+    ctx, props = "jsn-JTAG-SMT2NC-210308A5F0D2-14ca8093-0", {"Name": "xcvc1902", "isActive": True}
+    statements = {
+        "baseline": "pass",
+        "f-string": 'log.benchmark.debug(f"Changing node {ctx}: {props}")',
+        "deferred format": 'log.benchmark.debug("Changing node {}: {}", ctx, props)',
+        "is_domain_enabled guard": (
+            'if log.is_domain_enabled("benchmark", "DEBUG"): '
+            'log.benchmark.debug(f"Changing node {ctx}: {props}")'
+        ),
+    }
+    namespace = {"log": log, "ctx": ctx, "props": props}
+    return {
+        name: min(timeit.repeat(stmt, globals=namespace, number=number, repeat=3)) / number * 1e9
+        for name, stmt in statements.items()
+    }
+
+
+def main():  # pragma: no cover
+    print("Import time (median of new processes):")
+    for statement, seconds in benchmark_imports().items():
+        print(f"  {seconds * 1000.0:8.1f} ms  {statement}")
+    print("Logging to a disabled domain (per call):")
+    for name, ns in benchmark_disabled_logging().items():
+        print(f"  {ns:8.1f} ns  {name}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,82 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+User callbacks for updates that arrive on the TCF event dispatcher thread.
+
+The callbacks run on one daemon thread, in the order they were requested, so a slow callback
+does not hold up the TCF thread, and a callback that blocks does not keep the interpreter from
+exiting. Updates that arrive while a call is queued are handled by that call.
+"""
+
+import queue
+import threading
+from typing import Callable, Optional
+
+from chipscopy.utils.printer import printer
+
+_callback_queue: Optional[queue.SimpleQueue] = None
+_callback_queue_lock = threading.Lock()
+
+
+def _get_callback_queue() -> queue.SimpleQueue:
+    global _callback_queue
+    with _callback_queue_lock:
+        if _callback_queue is None:
+            _callback_queue = queue.SimpleQueue()
+            threading.Thread(
+                target=_run_callbacks,
+                args=(_callback_queue,),
+                name="chipscopy_update_callback",
+                daemon=True,
+            ).start()
+        return _callback_queue
+
+
+def _run_callbacks(callback_queue: queue.SimpleQueue):
+    while True:
+        callback_queue.get()._run()
+
+
+class CoalescedCallback:
+    """
+    Callback that is called on the callback thread when requested. Requests made while a call
+    is queued are merged into that call.
+
+    Args:
+        callback: Called without arguments
+        description: Used in the warning printed when the callback raises, e.g. "YK scan update"
+
+    """
+
+    def __init__(self, callback: Callable[[], None], description: str):
+        self.callback = callback
+        self.description = description
+        self._pending = False
+
+    def request(self):
+        if self._pending:
+            return
+        self._pending = True
+        _get_callback_queue().put(self)
+
+    def _run(self):
+        self._pending = False
+        try:
+            self.callback()
+        except Exception as e:
+            printer(
+                f"Unhandled exception during {self.description} callback!\nException - {str(e)}",
+                level="warning",
+            )
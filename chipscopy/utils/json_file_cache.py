@@ -0,0 +1,91 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Base of the on-disk caches - one JSON file per key in a cache directory.
+
+Files are written to a temporary file and renamed, so concurrent sessions never read a partial
+file. Errors reading or writing a file are logged and the cache entry is treated as missing.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, ClassVar, Dict, Optional, Union
+
+from chipscopy.utils.logger import log
+
+
+class JsonFileCache:
+    """JSON files in ``cache_dir``, named by a hash of the key parts."""
+
+    log_name: ClassVar[str] = "json_file_cache"
+    """Prefix of the log messages of the cache"""
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        self.cache_dir = Path(cache_dir)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self.cache_dir)!r})"
+
+    def _file_path(self, *key_parts: Optional[str]) -> Path:
+        key = "|".join(part or "" for part in key_parts).lower()
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _write_file(self, path: Path, data: Dict[str, Any]) -> bool:
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+            tmp_path = None
+            log.client.debug(f"{self.log_name}: saved {path}")
+            return True
+        except (OSError, TypeError, ValueError) as ex:
+            log.client.warning(f"{self.log_name}: could not save {path}: {ex}")
+            return False
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+    def _read_file(self, path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            self._report_unreadable(path, ex)
+            return None
+
+    def _report_unreadable(self, path: Path, ex: Exception):
+        log.client.warning(f"{self.log_name}: ignoring unreadable cache file {path}: {ex}")
+
+    def _remove_file(self, path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete all cache files in the cache directory."""
+        for path in self.cache_dir.glob("*.json"):
+            self._remove_file(path)
@@ -15,7 +15,7 @@
 
 import sys
 import copy
-from typing import List, Union, ClassVar
+from typing import Dict, List, Optional, Union, ClassVar
 import logging
 from pathlib import Path
 from logging import handlers
@@ -45,6 +45,9 @@ class ParodyLogger:
     def critical(self, *args, **kwargs):
         pass
 
+    def opt(self, *args, **kwargs):
+        return self
+
     def __getattr__(self, item):
         return self
 
@@ -52,7 +55,53 @@ class ParodyLogger:
         return self
 
 
+class _SinkTrackingLogger:
+    """
+    Forwards to a loguru logger, and reports the sinks added and removed through it to the
+    CSSLogger. This includes sinks added directly with ``log.logger.add()``.
+    """
+
+    def __init__(self, logger: "loguru.Logger", css_logger: "CSSLogger"):
+        self._logger = logger
+        self._css_logger = css_logger
+
+    def __getattr__(self, item):
+        return getattr(self._logger, item)
+
+    def add(self, sink, **kwargs) -> int:
+        sink_id = self._logger.add(sink, **kwargs)
+        self._css_logger._sink_added(sink_id, kwargs.get("level"))
+        return sink_id
+
+    def remove(self, handler_id: Optional[int] = None):
+        self._logger.remove(handler_id)
+        self._css_logger._sink_removed(handler_id)
+
+
 class CSSLogger:
+    """
+    Domain based logger, on top of loguru. Log calls to a disabled domain go to a
+    ParodyLogger, which does nothing.
+
+    Arguments of a log call are evaluated even when the domain is disabled. In hot paths,
+    pass the values as arguments instead of building an f-string. The message is only
+    formatted when the record is emitted:
+
+    ::
+
+        log.client.debug("scanning cable {}", cable.ctx)
+        log.client.trace("record {!r}", record)
+
+    Values which are expensive to compute can be deferred with loguru lazy mode, or the
+    call can be guarded with is_domain_enabled():
+
+    ::
+
+        log.client.opt(lazy=True).debug("nodes {}", lambda: [n.ctx for n in nodes])
+        if log.is_domain_enabled("client", "DEBUG"):
+            ...
+    """
+
     # Default format
     default_format: ClassVar[str] = (
         "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
@@ -68,7 +117,7 @@ class CSSLogger:
 
         loguru.logger.remove()
 
-        self.logger: loguru.Logger = copy.deepcopy(loguru.logger)
+        self.logger: loguru.Logger = _SinkTrackingLogger(copy.deepcopy(loguru.logger), self)
         # Enable all modules, we'll enforce domain using record filter
         self.logger.enable("")
 
@@ -80,6 +129,18 @@ class CSSLogger:
 
         self.current_log_level: loguru.Level = None
 
+        # Sink id -> level number of the sink, 0 when the level of the sink is not known
+        self._sink_level_no: Dict[int, int] = {}
+
+        # Enabled domain -> lowest level number which reaches a sink
+        self._min_level_no_for_domain: Dict[str, int] = {}
+
+        # Level name -> level number, read with logger.level() on first use
+        self._level_no: Dict[str, int] = {}
+
+        # Domain names which can not be cached as attributes - see _update_domain_attribute()
+        self._reserved_attributes = frozenset(dir(self)) | {"_reserved_attributes"}
+
     def __call__(self, *args, **kwargs):
         if len(args) == 0:
             return
@@ -96,6 +157,16 @@ class CSSLogger:
             return self._parody_logger
         return self._get_logger_for_domain(item)
 
+    def _update_domain_attribute(self, domain: str):
+        # log.<domain> is looked up in every log call. Storing the current logger of the domain
+        # as an instance attribute avoids the failed attribute lookup and __getattr__ call.
+        if domain in self._reserved_attributes or not domain.isidentifier():
+            return
+        if self.domain_enabled.get(domain, False):
+            self.__dict__[domain] = self.logger_for_domain[domain]
+        else:
+            self.__dict__[domain] = self._parody_logger
+
     def _send_record_to_sink(self, record) -> bool:
         return self.domain_enabled.get(record["extra"]["domain"], False)
 
@@ -106,6 +177,7 @@ class CSSLogger:
             if domain not in self.domain_enabled:
                 # Disable domain logging by default.
                 self.domain_enabled[domain] = False
+            self._update_domain_attribute(domain)
 
         return self.logger_for_domain[domain]
 
@@ -125,9 +197,48 @@ class CSSLogger:
             raise ValueError(f"domain {domain} is already registered")
         self._get_logger_for_domain(domain)
 
+    def _sink_added(self, sink_id: int, level: Union[str, int, None]):
+        if isinstance(level, str):
+            level_no = self.logger.level(level).no
+        elif isinstance(level, int):
+            level_no = level
+        else:
+            # Default level of loguru, which can be changed by the environment - assume any level
+            level_no = 0
+        self._sink_level_no[sink_id] = level_no
+        self._update_enabled_levels()
+
+    def _sink_removed(self, sink_id: Optional[int]):
+        if sink_id is None:
+            self._sink_level_no.clear()
+        else:
+            self._sink_level_no.pop(sink_id, None)
+        if self.default_sink_id not in self._sink_level_no:
+            self.default_sink_id = None
+        self._update_enabled_levels()
+
+    def _update_enabled_levels(self):
+        # Called when domains or sinks change, so is_domain_enabled() is two lookups
+        self._min_level_no_for_domain = {}
+        if self._sink_level_no:
+            min_level_no = min(self._sink_level_no.values())
+            self._min_level_no_for_domain = {
+                domain: min_level_no for domain, enabled in self.domain_enabled.items() if enabled
+            }
+
     def is_domain_enabled(self, domain: str, level: str) -> bool:
-        level_info = self.logger.level(level)
-        return self.domain_enabled.get(domain, False) and level_info.no >= self.current_log_level.no
+        """
+        True if a record of level in domain would be emitted by any sink - the stdout sink, a
+        file or queue handler, or a sink added with ``log.logger.add()``. Costs about as much as
+        two dict lookups, for hot paths.
+        """
+        min_level_no = self._min_level_no_for_domain.get(domain)
+        if min_level_no is None:
+            return False
+        level_no = self._level_no.get(level)
+        if level_no is None:
+            level_no = self._level_no[level] = self.logger.level(level).no
+        return level_no >= min_level_no
 
     def enable_domain(self, domain_name: Union[str, List[str]]):
         if isinstance(domain_name, str):
@@ -143,6 +254,9 @@ class CSSLogger:
                 )
             # This is in case the user enables the domain before logging any message.
             self.domain_enabled[domain] = True
+            self._get_logger_for_domain(domain)
+            self._update_domain_attribute(domain)
+        self._update_enabled_levels()
 
     def disable_domain(self, domain_name: Union[str, List[str]]):
         if isinstance(domain_name, str):
@@ -151,6 +265,8 @@ class CSSLogger:
         for domain in domain_name:
             if domain in self.domain_enabled:
                 self.domain_enabled[domain] = False
+                self._update_domain_attribute(domain)
+        self._update_enabled_levels()
 
     def change_log_level(self, level: str):
         try:
@@ -190,7 +306,16 @@ class CSSLogger:
             queue_handler, format=CSSLogger.default_format, level=level_info.name
         )
 
+    def remove_handler(self, sink_id: int):
+        """Remove a handler added by add_file_handler() or add_queue_handler()."""
+        self.logger.remove(sink_id)
+
 
 # NOTE - Server side code should not import this module! Only client side code should use this.
 #  Server side code should import from init in server
 log = CSSLogger()
+
+# Domains of the API modules, registered here so they can be enabled before the modules that log
+# to them are imported
+log.register_domain("client")
+log.register_domain("noc_perfmon")
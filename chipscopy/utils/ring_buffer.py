@@ -0,0 +1,219 @@
+# Copyright (C) 2026, Advanced Micro Devices, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from array import array
+from typing import Dict, Optional, Iterator, Tuple, Union, List, Any
+
+try:
+    import numpy as np
+
+    _numpy_available = True
+except ImportError:
+    np = None
+    _numpy_available = False
+
+
+def check_for_numpy():
+    if not _numpy_available:
+        raise ImportError(f"numpy is not installed! Please run 'pip install numpy'")
+
+
+Column = Union[array, List[Any]]
+ColumnType = Union[Optional[str], Tuple[str, int]]
+
+
+class RingBuffer:
+    """
+    Fixed depth buffer of rows with named, typed columns. Storage grows with the rows appended,
+    doubling from ``initial_rows`` up to ``depth`` rows, so a deep buffer that gets few rows
+    stays small. When the buffer is full, the oldest row is overwritten.
+
+    Each column has an :mod:`array` typecode, e.g. ``"d"`` for float or ``"Q"`` for 64 bit
+    unsigned values. Typecode ``None`` stores python objects, e.g. ints wider than 64 bits.
+    A ``(typecode, width)`` tuple makes a vector column, with ``width`` values in every row.
+    Vector columns are returned flat, ``width`` values per row, except by :py:meth:`get_row`,
+    :py:meth:`get_rows` and :py:meth:`to_numpy`.
+
+    Rows are appended by one thread (typically the TCF dispatch thread) and read by others.
+    """
+
+    def __init__(self, depth: int, columns: Dict[str, ColumnType], initial_rows: int = 256):
+        if depth < 1:
+            raise ValueError(f"RingBuffer depth must be 1 or larger, not {depth}")
+        self.depth = depth
+        # Rows allocated. Until the buffer is full, rows are stored from index 0 without wrapping.
+        self._capacity = max(min(initial_rows, depth), 1)
+        self.column_names: List[str] = list(columns.keys())
+        self._columns: List[Column] = []
+        self._widths: List[int] = []
+        for name, typecode in columns.items():
+            width = 1
+            if isinstance(typecode, tuple):
+                typecode, width = typecode
+                if not typecode or width < 1:
+                    raise ValueError(f"Vector column {name} needs a typecode and a width of 1+")
+            self._widths.append(width)
+            self._columns.append(
+                array(typecode, [0]) * (self._capacity * width)
+                if typecode
+                else [None] * self._capacity
+            )
+        self._lock = threading.Lock()
+        self._next = 0
+        self._count = 0
+        self.total_count = 0
+        """Number of rows appended since creation or clear(). Rows beyond depth were overwritten."""
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        return self._count == self.depth
+
+    @property
+    def dropped_count(self) -> int:
+        """Number of rows overwritten, since the buffer was full."""
+        return self.total_count - self._count
+
+    def append(self, *values):
+        """
+        Append one row. Values are given in column order.
+        Values for vector columns are arrays of the column typecode with exactly width values.
+        """
+        with self._lock:
+            idx = self._next
+            if idx == self._capacity:
+                self._grow()
+            for column, width, value in zip(self._columns, self._widths, values):
+                if width == 1:
+                    column[idx] = value
+                else:
+                    if len(value) != width:
+                        raise ValueError(f"Vector column value needs {width} values")
+                    column[idx * width : (idx + 1) * width] = value
+            self._next = (idx + 1) % self.depth
+            if self._count < self.depth:
+                self._count += 1
+            self.total_count += 1
+
+    def _grow(self):
+        # Caller holds the lock. Only called before the buffer is full, when no rows wrap.
+        extra = min(self._capacity, self.depth - self._capacity)
+        for column, width in zip(self._columns, self._widths):
+            if isinstance(column, array):
+                column.extend(array(column.typecode, [0]) * (extra * width))
+            else:
+                column.extend([None] * extra)
+        self._capacity += extra
+
+    def clear(self):
+        with self._lock:
+            self._next = 0
+            self._count = 0
+            self.total_count = 0
+
+    def _ordered(self, column: Column, last: Optional[int], width: int = 1) -> Column:
+        # Returns a chronological copy of the newest 'last' rows. Caller holds the lock.
+        count = self._count if last is None else min(last, self._count)
+        start = (self._next - count) % self.depth
+        if start + count <= self.depth:
+            return column[start * width : (start + count) * width]
+        return column[start * width :] + column[: self._next * width]
+
+    def _split(self, values: Column, width: int) -> List[Column]:
+        return [values[n : n + width] for n in range(0, len(values), width)]
+
+    def get_column(self, name: str, last: Optional[int] = None) -> Column:
+        """
+        Chronological copy of one column.
+
+        Args:
+            name (str): Column name.
+            last (Optional[int]): Only the newest 'last' rows. Default is all rows.
+
+        Returns:
+            array or list, with the column values, oldest first.
+        """
+        idx = self.column_names.index(name)
+        with self._lock:
+            return self._ordered(self._columns[idx], last, self._widths[idx])
+
+    def get_rows(self, name: str, last: Optional[int] = None) -> List[Column]:
+        """Chronological copy of one vector column, as one array per row."""
+        idx = self.column_names.index(name)
+        return self._split(self.get_column(name, last), self._widths[idx])
+
+    def get_row(self, index: int) -> Tuple:
+        """
+        Copy of one row. Index 0 is the oldest row and -1 the newest, like a list.
+        Vector column values are arrays.
+        """
+        with self._lock:
+            if index < 0:
+                index += self._count
+            if not 0 <= index < self._count:
+                raise IndexError("RingBuffer row index out of range")
+            idx = (self._next - self._count + index) % self.depth
+            return tuple(
+                column[idx] if width == 1 else column[idx * width : (idx + 1) * width]
+                for column, width in zip(self._columns, self._widths)
+            )
+
+    def to_dict(self, last: Optional[int] = None) -> Dict[str, Column]:
+        """Chronological copy of all columns, as {column name: array or list}."""
+        with self._lock:
+            return {
+                name: self._ordered(column, last, width)
+                for name, column, width in zip(self.column_names, self._columns, self._widths)
+            }
+
+    def to_numpy(self, last: Optional[int] = None) -> Dict[str, "np.ndarray"]:
+        """
+        Chronological copy of all columns, as {column name: numpy array}. Requires numpy.
+        Vector columns have one row per buffer row.
+        """
+        check_for_numpy()
+        columns = dict()
+        for (name, values), width in zip(self.to_dict(last).items(), self._widths):
+            values = np.asarray(values, dtype=None if isinstance(values, array) else object)
+            columns[name] = values.reshape(-1, width) if width > 1 else values
+        return columns
+
+    def __iter__(self) -> Iterator[Tuple]:
+        """Iterate over a snapshot of the rows, oldest first."""
+        columns = [
+            values if width == 1 else self._split(values, width)
+            for values, width in zip(self.to_dict().values(), self._widths)
+        ]
+        return zip(*columns)
+
+    def read_new(self, after_total_count: int) -> Tuple[int, Dict[str, Column]]:
+        """
+        Rows appended after a previous read, for streaming consumers.
+        Rows which were already overwritten are skipped.
+
+        Args:
+            after_total_count (int): total_count returned by the previous call. Use 0 the first time.
+
+        Returns:
+            (total_count, {column name: new values})
+        """
+        with self._lock:
+            new_count = min(self.total_count - after_total_count, self._count)
+            columns = {
+                name: self._ordered(column, new_count, width)
+                for name, column, width in zip(self.column_names, self._columns, self._widths)
+            }
+            return self.total_count, columns
@@ -94,6 +94,13 @@ class ServerVersionInfo:
         return retval
 
 
+def get_server_version_info(server: ServerInfo, server_type: str) -> ServerVersionInfo:
+    """Version info of a connected server. Read once per connection, and kept on the server."""
+    if server.version_info is None:
+        server.version_info = ServerVersionInfo(server, server_type)
+    return server.version_info
+
+
 @dataclass
 class VersionDetails:
     version: InitVar[str]
@@ -159,7 +166,7 @@ def version_consistency_check(
     """
     mismatch_detected = False
     chipscopy_version = VersionDetails(__vivado_version__)
-    hw_server_version = VersionDetails(ServerVersionInfo(hw_server, "hw_server").version)
+    hw_server_version = VersionDetails(get_server_version_info(hw_server, "hw_server").version)
 
     # First compare chipscopy and hw_server
     if (
@@ -171,7 +178,7 @@ def version_consistency_check(
 
     cs_server_version = None
     if cs_server:
-        cs_server_version = VersionDetails(ServerVersionInfo(cs_server, "cs_server").version)
+        cs_server_version = VersionDetails(get_server_version_info(cs_server, "cs_server").version)
 
         # Next compare cs_server with chipscopy and hw_server
         if (